@@ -1,5 +1,33 @@
-from botocove.cove_decorator import cove
+from botocove.cove_context import CoveContext
+from botocove.cove_credentials import CoveCredentialStore
+from botocove.cove_decorator import acove, cove
+from botocove.cove_function_group import cove_functions
+from botocove.cove_hooks import CoveHook
+from botocove.cove_org_snapshot import CoveOrganizationSnapshot
+from botocove.cove_reducer import CoveReducer
 from botocove.cove_session import CoveSession
-from botocove.cove_types import CoveOutput
+from botocove.cove_sink import (
+    CoveJsonLinesSink,
+    CoveParquetSink,
+    CoveSink,
+    CoveSqliteSink,
+)
+from botocove.cove_types import CoveOutput, CoveSpilledOutput
 
-__all__ = ["cove", "CoveSession", "CoveOutput"]
+__all__ = [
+    "cove",
+    "acove",
+    "cove_functions",
+    "CoveSession",
+    "CoveOutput",
+    "CoveSpilledOutput",
+    "CoveCredentialStore",
+    "CoveOrganizationSnapshot",
+    "CoveHook",
+    "CoveContext",
+    "CoveReducer",
+    "CoveSink",
+    "CoveJsonLinesSink",
+    "CoveSqliteSink",
+    "CoveParquetSink",
+]
@@ -0,0 +1,136 @@
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, AsyncGenerator, Awaitable, Callable, List, Set
+
+from tqdm import tqdm
+
+from botocove.cove_host_account import CoveHostAccount
+from botocove.cove_session import CoveSession
+from botocove.cove_types import CoveFunctionOutput, CoveSessionInformation
+
+logger = logging.getLogger(__name__)
+
+
+class CoveAsyncRunner(object):
+    """Runs an async function in every target account on one event loop.
+
+    boto3 has no async STS client, so each session is activated in a small pool
+    of thread_workers threads. The wrapped coroutines run on the event loop, and
+    at most `concurrency` tasks exist at once.
+    """
+
+    def __init__(
+        self,
+        host_account: CoveHostAccount,
+        func: Callable[..., Awaitable[Any]],
+        raise_exception: bool,
+        func_args: Any,
+        func_kwargs: Any,
+        thread_workers: int,
+        concurrency: int,
+        serialize_exceptions: bool = False,
+    ) -> None:
+
+        self.host_account = host_account
+
+        self.cove_wrapped_func = func
+        self.raise_exception = raise_exception
+        self.func_args = func_args
+        self.func_kwargs = func_kwargs
+
+        self.thread_workers = thread_workers
+        self.concurrency = concurrency
+        self.serialize_exceptions = serialize_exceptions
+
+    async def run_cove_function(self) -> CoveFunctionOutput:
+        completed = [result async for result in self.iter_cove_function()]
+
+        successful_results = [
+            result for result in completed if not result["ExceptionDetails"]
+        ]
+        exceptions = [result for result in completed if result["ExceptionDetails"]]
+
+        return CoveFunctionOutput(
+            Results=successful_results,
+            Exceptions=exceptions,
+        )
+
+    async def iter_cove_function(
+        self,
+    ) -> AsyncGenerator[CoveSessionInformation, None]:
+        """Yields each task's session information as soon as the task completes.
+
+        Like CoveRunner, sessions are pulled lazily from the host account. A new
+        task starts each time one finishes, keeping `concurrency` in flight."""
+
+        sessions = self.host_account.iter_cove_sessions()
+        with ThreadPoolExecutor(max_workers=self.thread_workers) as sts_executor:
+
+            def start_tasks(count: int) -> Set["asyncio.Task[CoveSessionInformation]"]:
+                return {
+                    asyncio.ensure_future(self.cove_task(s, sts_executor))
+                    for s in islice(sessions, count)
+                }
+
+            tasks = start_tasks(self.concurrency)
+            try:
+                with tqdm(
+                    total=self.host_account.session_count,
+                    desc="Executing function",
+                    colour="#ff69b4",  # hotpink
+                ) as progress:
+                    while tasks:
+                        done, tasks = await asyncio.wait(
+                            tasks, return_when=asyncio.FIRST_COMPLETED
+                        )
+                        tasks.update(start_tasks(len(done)))
+                        for task in done:
+                            progress.update()
+                            yield task.result()
+            finally:
+                await _cancel_tasks(tasks)
+
+    async def cove_task(
+        self,
+        account_session_info: CoveSessionInformation,
+        sts_executor: ThreadPoolExecutor,
+    ) -> CoveSessionInformation:
+        cove_session = CoveSession(
+            account_session_info,
+            sts_client=self.host_account.sts_client,
+            credential_cache=self.host_account.credential_cache,
+            rate_limiter=self.host_account.rate_limiter,
+        )
+        try:
+            await asyncio.get_running_loop().run_in_executor(
+                sts_executor, cove_session.activate_cove_session
+            )
+
+            result = await self.cove_wrapped_func(
+                cove_session, *self.func_args, **self.func_kwargs
+            )
+
+            return cove_session.format_cove_result(result)
+
+        except Exception as e:
+            failed = cove_session.format_cove_error(
+                e, serialize=self.serialize_exceptions
+            )
+            if self.raise_exception is True:
+                logger.exception(failed)
+                raise
+            else:
+                return failed
+        finally:
+            cove_session.deactivate_cove_session()
+
+
+async def _cancel_tasks(tasks: Set["asyncio.Task[CoveSessionInformation]"]) -> None:
+    pending: List["asyncio.Task[CoveSessionInformation]"] = []
+    for task in tasks:
+        if task.cancel():
+            pending.append(task)
+    # Let cancelled tasks unwind before the STS executor shuts down
+    await asyncio.gather(*pending, return_exceptions=True)
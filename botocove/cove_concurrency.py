@@ -0,0 +1,95 @@
+import logging
+import threading
+import time
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# thread_workers="auto" starts small and never runs more tasks than this at once
+AUTO_THREAD_WORKERS_INITIAL = 4
+AUTO_THREAD_WORKERS_CEILING = 100
+
+ADDITIVE_INCREASE = 2
+MULTIPLICATIVE_DECREASE = 0.5
+# A round whose mean task latency exceeds the recent baseline by this factor is
+# treated as a sign of overload, like throttling
+LATENCY_TOLERANCE = 2.0
+# The baseline is a moving average of round latencies that gives each new round
+# this weight, so it follows shifts in the work of later tasks, such as a run
+# reaching larger accounts, within a round or two
+LATENCY_BASELINE_WEIGHT = 0.5
+
+
+class CoveConcurrencyController(object):
+    """Tunes the number of tasks in flight with additive increase, multiplicative
+    decrease (AIMD).
+
+    Completions are grouped into rounds of `limit` tasks. After each round the
+    limit grows by ADDITIVE_INCREASE if throughput rose, and is cut by
+    MULTIPLICATIVE_DECREASE if any task was throttled or latency rose well above
+    the moving average of recent rounds. Over a run the limit settles near the
+    fastest stable concurrency, between 1 and `ceiling`.
+    """
+
+    def __init__(
+        self,
+        initial: int = AUTO_THREAD_WORKERS_INITIAL,
+        ceiling: int = AUTO_THREAD_WORKERS_CEILING,
+    ) -> None:
+        self.ceiling = ceiling
+        self.limit = max(1, min(initial, ceiling))
+
+        self._baseline_latency: Optional[float] = None
+        self._last_throughput = 0.0
+        self._round_started = time.monotonic()
+        self._round_completions = 0
+        self._round_latency = 0.0
+        self._round_throttled = False
+        self._lock = threading.Lock()
+
+    def record(self, latency: float, throttled: bool) -> None:
+        """Records one completed task and adjusts the limit at the end of a round."""
+        with self._lock:
+            self._round_completions += 1
+            self._round_latency += latency
+            self._round_throttled = self._round_throttled or throttled
+            if self._round_completions < self.limit:
+                return
+
+            now = time.monotonic()
+            elapsed = max(now - self._round_started, 1e-9)
+            self.adjust(
+                throughput=self._round_completions / elapsed,
+                latency=self._round_latency / self._round_completions,
+                throttled=self._round_throttled,
+            )
+            self._round_started = now
+            self._round_completions = 0
+            self._round_latency = 0.0
+            self._round_throttled = False
+
+    def adjust(self, throughput: float, latency: float, throttled: bool) -> None:
+        previous_limit = self.limit
+        latency_rising = (
+            self._baseline_latency is not None
+            and latency > self._baseline_latency * LATENCY_TOLERANCE
+        )
+
+        if throttled or latency_rising:
+            self.limit = max(1, int(self.limit * MULTIPLICATIVE_DECREASE))
+        elif throughput >= self._last_throughput:
+            self.limit = min(self.ceiling, self.limit + ADDITIVE_INCREASE)
+
+        if self._baseline_latency is None:
+            self._baseline_latency = latency
+        else:
+            self._baseline_latency += LATENCY_BASELINE_WEIGHT * (
+                latency - self._baseline_latency
+            )
+        self._last_throughput = throughput
+
+        if self.limit != previous_limit:
+            logger.debug(
+                f"Concurrency {previous_limit} -> {self.limit}: "
+                f"{throughput=:.2f}/s {latency=:.3f}s {throttled=}"
+            )
@@ -0,0 +1,212 @@
+import functools
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from types import TracebackType
+from typing import Any, Callable, Dict, Iterator, List, Optional, Type, Union
+
+from boto3.session import Session
+from mypy_boto3_sts.type_defs import PolicyDescriptorTypeTypeDef
+
+from botocove.cove_credentials import CoveCredentialStore
+from botocove.cove_hooks import CoveHook
+from botocove.cove_host_account import CoveHostAccount
+from botocove.cove_org_snapshot import CoveOrganizationSnapshot
+from botocove.cove_output import run_cove
+from botocove.cove_reducer import CoveReducerType
+from botocove.cove_runner import (
+    CoveExecutorType,
+    CoveRunner,
+    CoveThreadWorkers,
+    get_auto_thread_workers_ceiling,
+)
+from botocove.cove_session import CoveSessionPool
+from botocove.cove_sink import CoveSink
+from botocove.cove_types import CoveOutput, CoveSpilledOutput
+from botocove.cove_validation import (
+    typecheck_api_telemetry,
+    typecheck_executor,
+    typecheck_external_id,
+    typecheck_ignore_ids,
+    typecheck_ou_thread_workers,
+    typecheck_prefetch_credentials,
+    typecheck_reducer,
+    typecheck_region_concurrency,
+    typecheck_regions,
+    typecheck_sink,
+    typecheck_spill_threshold,
+    typecheck_target_ids,
+    typecheck_thread_workers,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class CoveContext(object):
+    """Resolves the host account and target accounts once and runs any number of
+    functions against them.
+
+    The context keeps its STS and Organizations clients, its credential cache and,
+    with executor="thread", its worker threads and their recycled sessions
+    between runs. Functions decorated with the context's cove method take the
+    run arguments of cove; the arguments that choose and reach the targets are
+    the context's. Close the context, or use it as a context manager, to stop its
+    worker threads.
+    """
+
+    def __init__(
+        self,
+        *,
+        target_ids: Optional[List[str]] = None,
+        ignore_ids: Optional[List[str]] = None,
+        rolename: Optional[str] = None,
+        role_session_name: Optional[str] = None,
+        policy: Optional[str] = None,
+        policy_arns: Optional[List[PolicyDescriptorTypeTypeDef]] = None,
+        external_id: Optional[str] = None,
+        assuming_session: Optional[Session] = None,
+        thread_workers: CoveThreadWorkers = 20,
+        regions: Optional[List[str]] = None,
+        partition: Optional[str] = None,
+        credential_store: Optional[CoveCredentialStore] = None,
+        recycle_sessions: bool = False,
+        executor: CoveExecutorType = "thread",
+        ou_thread_workers: int = 5,
+        org_snapshot: Optional[CoveOrganizationSnapshot] = None,
+        assume_role_rate: Optional[float] = None,
+        assume_role_burst: int = 10,
+    ) -> None:
+        typecheck_regions(regions)
+        typecheck_external_id(external_id)
+        typecheck_target_ids(target_ids)
+        typecheck_ignore_ids(ignore_ids)
+        typecheck_thread_workers(thread_workers)
+        typecheck_ou_thread_workers(ou_thread_workers)
+        typecheck_executor(executor)
+
+        self.thread_workers = thread_workers
+        self.recycle_sessions = recycle_sessions
+        self.executor = executor
+        self.max_workers = (
+            get_auto_thread_workers_ceiling(executor)
+            if thread_workers == "auto"
+            else thread_workers
+        )
+
+        self.host_account = CoveHostAccount(
+            target_ids=target_ids,
+            ignore_ids=ignore_ids,
+            rolename=rolename,
+            role_session_name=role_session_name,
+            policy=policy,
+            policy_arns=policy_arns,
+            external_id=external_id,
+            assuming_session=assuming_session,
+            thread_workers=self.max_workers,
+            regions=regions,
+            partition=partition,
+            credential_store=credential_store,
+            ou_thread_workers=ou_thread_workers,
+            org_snapshot=org_snapshot,
+            assume_role_rate=assume_role_rate,
+            assume_role_burst=assume_role_burst,
+        )
+        self.session_pool = CoveSessionPool() if recycle_sessions else None
+        self.thread_executor: Optional[ThreadPoolExecutor] = None
+        if executor == "thread":
+            self.thread_executor = ThreadPoolExecutor(max_workers=self.max_workers)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}"
+            f"(accounts={len(self.host_account.target_accounts)}, "
+            f"regions={len(self.host_account.target_regions)})"
+        )
+
+    def __enter__(self) -> "CoveContext":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self.thread_executor is not None:
+            self.thread_executor.shutdown(wait=True)
+            self.thread_executor = None
+
+    def cove(
+        self,
+        _func: Optional[Callable[..., Any]] = None,
+        *,
+        raise_exception: bool = False,
+        stream: bool = False,
+        region_concurrency: Optional[int] = None,
+        prefetch_credentials: int = 0,
+        timings: bool = False,
+        trace_file: Optional[Union[str, "os.PathLike[str]"]] = None,
+        hooks: Optional[List[CoveHook]] = None,
+        api_telemetry: bool = False,
+        serialize_exceptions: bool = False,
+        reducer: Optional[CoveReducerType] = None,
+        initial: Any = None,
+        sink: Optional[CoveSink] = None,
+        spill_threshold: Optional[int] = None,
+    ) -> Callable:  # type: ignore
+        """Decorates a function to run against the context's targets, like the
+        cove decorator."""
+
+        def decorator(
+            func: Callable[..., Any],
+        ) -> Callable[
+            ..., Union[CoveOutput, CoveSpilledOutput, Iterator[Dict[str, Any]]]
+        ]:
+            @functools.wraps(func)
+            def wrapper(
+                *args: Any, **kwargs: Any
+            ) -> Union[CoveOutput, CoveSpilledOutput, Iterator[Dict[str, Any]]]:
+
+                typecheck_region_concurrency(region_concurrency)
+                typecheck_prefetch_credentials(prefetch_credentials, self.executor)
+                typecheck_api_telemetry(api_telemetry, self.executor, stream)
+                typecheck_reducer(reducer, initial, stream)
+                typecheck_sink(sink, stream)
+                typecheck_spill_threshold(spill_threshold, stream)
+                if self.executor == "thread" and self.thread_executor is None:
+                    raise RuntimeError(f"{self!r} is closed")
+
+                runner = CoveRunner(
+                    host_account=self.host_account,
+                    func=func,
+                    raise_exception=raise_exception,
+                    func_args=args,
+                    func_kwargs=kwargs,
+                    thread_workers=self.thread_workers,
+                    recycle_sessions=self.recycle_sessions,
+                    executor=self.executor,
+                    region_concurrency=region_concurrency,
+                    prefetch_credentials=prefetch_credentials,
+                    timings=timings,
+                    trace_file=trace_file,
+                    hooks=hooks,
+                    api_telemetry=api_telemetry,
+                    serialize_exceptions=serialize_exceptions,
+                    session_pool=self.session_pool,
+                    thread_executor=self.thread_executor,
+                    reducer=reducer,
+                    initial=initial,
+                    sink=sink,
+                )
+                return run_cove(runner, stream, spill_threshold)
+
+            return wrapper
+
+        # Handle both bare decorator and with argument
+        if _func is None:
+            return decorator
+        else:
+            return decorator(_func)
@@ -0,0 +1,182 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+from contextlib import closing
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Optional, Tuple, Union
+
+from mypy_boto3_sts.type_defs import CredentialsTypeDef
+
+from botocove.cove_types import CoveSessionInformation
+
+logger = logging.getLogger(__name__)
+
+# Credentials are refreshed this long before STS says they expire so that a task
+# never starts with credentials that lapse part way through the wrapped function.
+DEFAULT_EXPIRY_MARGIN = timedelta(minutes=5)
+
+# Partition, account ID, role name, role session name, session policy, session
+# policy ARNs and external ID: everything that changes the outcome of AssumeRole.
+CoveCredentialKey = Tuple[
+    Optional[str],
+    str,
+    str,
+    Optional[str],
+    Optional[str],
+    Optional[Tuple[str, ...]],
+    Optional[str],
+]
+
+
+def get_credential_key(session_info: CoveSessionInformation) -> CoveCredentialKey:
+    policy_arns = session_info["PolicyArns"]
+    return (
+        session_info["Partition"],
+        session_info["Id"],
+        session_info["RoleName"],
+        session_info["RoleSessionName"],
+        session_info["Policy"],
+        None if policy_arns is None else tuple(p["arn"] for p in policy_arns),
+        session_info["ExternalId"],
+    )
+
+
+class CoveCredentialStore(object):
+    """Persists assumed role credentials in a SQLite database so that later runs,
+    including runs in other processes, reuse them until they expire.
+
+    Credentials are stored under the ARN of the principal that assumed the role as
+    well as the role's key, so a run never reuses credentials that a different
+    principal obtained: each principal must pass the role's trust policy itself.
+
+    SQLite's file locking makes the store safe to share between processes. The
+    database holds live credentials, so it is created readable only by its owner.
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        self.path = os.fspath(path)
+        os.close(os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600))
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS credentials ("
+                "key TEXT PRIMARY KEY, "
+                "access_key_id TEXT NOT NULL, "
+                "secret_access_key TEXT NOT NULL, "
+                "session_token TEXT NOT NULL, "
+                "expiration TEXT NOT NULL)"
+            )
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(path={self.path!r})"
+
+    def get(
+        self, principal: str, key: CoveCredentialKey
+    ) -> Optional[CredentialsTypeDef]:
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT access_key_id, secret_access_key, session_token, expiration "
+                "FROM credentials WHERE key = ?",
+                (_serialize_key(principal, key),),
+            ).fetchone()
+        if row is None:
+            return None
+        return CredentialsTypeDef(
+            AccessKeyId=row[0],
+            SecretAccessKey=row[1],
+            SessionToken=row[2],
+            Expiration=datetime.fromisoformat(row[3]),
+        )
+
+    def put(
+        self, principal: str, key: CoveCredentialKey, creds: CredentialsTypeDef
+    ) -> None:
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "DELETE FROM credentials WHERE expiration < ?",
+                (_serialize_datetime(datetime.now(timezone.utc)),),
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO credentials VALUES (?, ?, ?, ?, ?)",
+                (
+                    _serialize_key(principal, key),
+                    creds["AccessKeyId"],
+                    creds["SecretAccessKey"],
+                    creds["SessionToken"],
+                    _serialize_datetime(creds["Expiration"]),
+                ),
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+
+class CoveCredentialCache(object):
+    """Holds the credentials of every role assumed during a run so that each
+    account's role is assumed once and shared by all of its region tasks.
+
+    Tasks for the same key wait on a per-key lock, so concurrent region tasks for
+    one account make a single AssumeRole call between them. With a store, the
+    cache also reads and writes credentials persisted by earlier runs of the same
+    principal, the ARN of the identity that assumes the roles.
+    """
+
+    def __init__(
+        self,
+        store: Optional[CoveCredentialStore] = None,
+        expiry_margin: timedelta = DEFAULT_EXPIRY_MARGIN,
+        principal: Optional[str] = None,
+    ) -> None:
+        if store is not None and principal is None:
+            raise ValueError("A credential store requires the assuming principal")
+        self.store = store
+        self.principal = principal
+        self.expiry_margin = expiry_margin
+        self._credentials: Dict[CoveCredentialKey, CredentialsTypeDef] = {}
+        self._key_locks: Dict[CoveCredentialKey, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get_credentials(
+        self,
+        key: CoveCredentialKey,
+        assume_role: Callable[[], CredentialsTypeDef],
+    ) -> CredentialsTypeDef:
+        with self._get_key_lock(key):
+            creds = self._credentials.get(key)
+            if creds is not None and not self._is_expiring(creds):
+                logger.debug(f"Reusing cached credentials for {key=}")
+                return creds
+
+            if self.store is not None and self.principal is not None:
+                creds = self.store.get(self.principal, key)
+                if creds is not None and not self._is_expiring(creds):
+                    logger.debug(f"Reusing stored credentials for {key=}")
+                    self._credentials[key] = creds
+                    return creds
+
+            creds = assume_role()
+            self._credentials[key] = creds
+            if self.store is not None and self.principal is not None:
+                self.store.put(self.principal, key, creds)
+            return creds
+
+    def _get_key_lock(self, key: CoveCredentialKey) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def _is_expiring(self, creds: CredentialsTypeDef) -> bool:
+        expiration = creds["Expiration"]
+        if expiration.tzinfo is None:
+            expiration = expiration.replace(tzinfo=timezone.utc)
+        return expiration - self.expiry_margin <= datetime.now(timezone.utc)
+
+
+def _serialize_key(principal: str, key: CoveCredentialKey) -> str:
+    return json.dumps([principal, *key])
+
+
+def _serialize_datetime(value: datetime) -> str:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat()
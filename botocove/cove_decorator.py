@@ -1,14 +1,54 @@
+import asyncio
 import functools
 import logging
-from typing import Any, Callable, Dict, List, Optional
+import os
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Union,
+)
 from warnings import warn
 
 from boto3.session import Session
 from mypy_boto3_sts.type_defs import PolicyDescriptorTypeTypeDef
 
+from botocove.cove_async_runner import CoveAsyncRunner
+from botocove.cove_credentials import CoveCredentialStore
+from botocove.cove_hooks import CoveHook
 from botocove.cove_host_account import CoveHostAccount
-from botocove.cove_runner import CoveRunner
-from botocove.cove_types import CoveOutput
+from botocove.cove_org_snapshot import CoveOrganizationSnapshot
+from botocove.cove_output import format_output, format_record, run_cove
+from botocove.cove_reducer import CoveReducerType
+from botocove.cove_runner import (
+    CoveExecutorType,
+    CoveRunner,
+    CoveThreadWorkers,
+    get_auto_thread_workers_ceiling,
+)
+from botocove.cove_sink import CoveSink
+from botocove.cove_types import CoveOutput, CoveSpilledOutput
+from botocove.cove_validation import (
+    typecheck_api_telemetry,
+    typecheck_concurrency,
+    typecheck_executor,
+    typecheck_external_id,
+    typecheck_ignore_ids,
+    typecheck_ou_thread_workers,
+    typecheck_prefetch_credentials,
+    typecheck_reducer,
+    typecheck_region_concurrency,
+    typecheck_regions,
+    typecheck_sink,
+    typecheck_spill_threshold,
+    typecheck_target_ids,
+    typecheck_thread_workers,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -25,21 +65,53 @@ def cove(
     external_id: Optional[str] = None,
     assuming_session: Optional[Session] = None,
     raise_exception: bool = False,
-    thread_workers: int = 20,
+    thread_workers: CoveThreadWorkers = 20,
     regions: Optional[List[str]] = None,
     partition: Optional[str] = None,
+    credential_store: Optional[CoveCredentialStore] = None,
+    recycle_sessions: bool = False,
+    stream: bool = False,
+    executor: CoveExecutorType = "thread",
+    ou_thread_workers: int = 5,
+    org_snapshot: Optional[CoveOrganizationSnapshot] = None,
+    assume_role_rate: Optional[float] = None,
+    assume_role_burst: int = 10,
+    region_concurrency: Optional[int] = None,
+    prefetch_credentials: int = 0,
+    timings: bool = False,
+    trace_file: Optional[Union[str, "os.PathLike[str]"]] = None,
+    hooks: Optional[List[CoveHook]] = None,
+    api_telemetry: bool = False,
+    serialize_exceptions: bool = False,
+    reducer: Optional[CoveReducerType] = None,
+    initial: Any = None,
+    sink: Optional[CoveSink] = None,
+    spill_threshold: Optional[int] = None,
     **cove_kwargs: Any,
 ) -> Callable:  # type: ignore
-    def decorator(func: Callable[..., Any]) -> Callable[..., CoveOutput]:
+    def decorator(
+        func: Callable[..., Any],
+    ) -> Callable[..., Union[CoveOutput, CoveSpilledOutput, Iterator[Dict[str, Any]]]]:
         @functools.wraps(func)
-        def wrapper(*args: Any, **kwargs: Any) -> CoveOutput:
+        def wrapper(
+            *args: Any, **kwargs: Any
+        ) -> Union[CoveOutput, CoveSpilledOutput, Iterator[Dict[str, Any]]]:
 
             _check_deprecation(cove_kwargs)
 
-            _typecheck_regions(regions)
-            _typecheck_external_id(external_id)
-            _typecheck_target_ids(target_ids)
-            _typecheck_ignore_ids(ignore_ids)
+            typecheck_regions(regions)
+            typecheck_external_id(external_id)
+            typecheck_target_ids(target_ids)
+            typecheck_ignore_ids(ignore_ids)
+            typecheck_thread_workers(thread_workers)
+            typecheck_ou_thread_workers(ou_thread_workers)
+            typecheck_executor(executor)
+            typecheck_region_concurrency(region_concurrency)
+            typecheck_prefetch_credentials(prefetch_credentials, executor)
+            typecheck_api_telemetry(api_telemetry, executor, stream)
+            typecheck_reducer(reducer, initial, stream)
+            typecheck_sink(sink, stream)
+            typecheck_spill_threshold(spill_threshold, stream)
 
             host_account = CoveHostAccount(
                 target_ids=target_ids,
@@ -50,9 +122,18 @@ def cove(
                 policy_arns=policy_arns,
                 external_id=external_id,
                 assuming_session=assuming_session,
-                thread_workers=thread_workers,
+                thread_workers=(
+                    get_auto_thread_workers_ceiling(executor)
+                    if thread_workers == "auto"
+                    else thread_workers
+                ),
                 regions=regions,
                 partition=partition,
+                credential_store=credential_store,
+                ou_thread_workers=ou_thread_workers,
+                org_snapshot=org_snapshot,
+                assume_role_rate=assume_role_rate,
+                assume_role_burst=assume_role_burst,
             )
 
             runner = CoveRunner(
@@ -62,27 +143,21 @@ def cove(
                 func_args=args,
                 func_kwargs=kwargs,
                 thread_workers=thread_workers,
+                recycle_sessions=recycle_sessions,
+                executor=executor,
+                region_concurrency=region_concurrency,
+                prefetch_credentials=prefetch_credentials,
+                timings=timings,
+                trace_file=trace_file,
+                hooks=hooks,
+                api_telemetry=api_telemetry,
+                serialize_exceptions=serialize_exceptions,
+                reducer=reducer,
+                initial=initial,
+                sink=sink,
             )
 
-            output = runner.run_cove_function()
-
-            # Rewrite dataclasses into untyped dicts to retain current functionality
-            return CoveOutput(
-                Results=[
-                    {k: v for k, v in r.items() if v is not None}
-                    for r in output["Results"]
-                ],
-                Exceptions=[
-                    {k: v for k, v in e.items() if v is not None}
-                    for e in output["Exceptions"]
-                    if e["AssumeRoleSuccess"] is True
-                ],
-                FailedAssumeRole=[
-                    {k: v for k, v in f.items() if v is not None}
-                    for f in output["Exceptions"]
-                    if f["AssumeRoleSuccess"] is False
-                ],
-            )
+            return run_cove(runner, stream, spill_threshold)
 
         return wrapper
 
@@ -93,25 +168,119 @@ def cove(
         return decorator(_func)
 
 
-def _typecheck_regions(list_of_regions: Optional[List[str]]) -> None:
-    if list_of_regions is None:
-        return
-    if isinstance(list_of_regions, str):
-        raise TypeError(
-            f"regions must be a list of str. Got str {repr(list_of_regions)}."
-        )
-    if len(list_of_regions) == 0:
-        raise ValueError(
-            f"regions must have at least 1 element. Got {repr(list_of_regions)}."
-        )
+def acove(
+    _func: Optional[Callable[..., Awaitable[Any]]] = None,
+    *,
+    target_ids: Optional[List[str]] = None,
+    ignore_ids: Optional[List[str]] = None,
+    rolename: Optional[str] = None,
+    role_session_name: Optional[str] = None,
+    policy: Optional[str] = None,
+    policy_arns: Optional[List[PolicyDescriptorTypeTypeDef]] = None,
+    external_id: Optional[str] = None,
+    assuming_session: Optional[Session] = None,
+    raise_exception: bool = False,
+    thread_workers: int = 20,
+    concurrency: int = 100,
+    regions: Optional[List[str]] = None,
+    partition: Optional[str] = None,
+    credential_store: Optional[CoveCredentialStore] = None,
+    stream: bool = False,
+    ou_thread_workers: int = 5,
+    org_snapshot: Optional[CoveOrganizationSnapshot] = None,
+    assume_role_rate: Optional[float] = None,
+    assume_role_burst: int = 10,
+    serialize_exceptions: bool = False,
+) -> Callable:  # type: ignore
+    """The asyncio counterpart of cove for `async def` functions.
+
+    The decorated function returns an awaitable CoveOutput, or an async iterator of
+    records when stream is True."""
+
+    def decorator(
+        func: Callable[..., Awaitable[Any]],
+    ) -> Callable[..., Union[Awaitable[CoveOutput], AsyncIterator[Dict[str, Any]]]]:
+        @functools.wraps(func)
+        def wrapper(
+            *args: Any, **kwargs: Any
+        ) -> Union[Awaitable[CoveOutput], AsyncIterator[Dict[str, Any]]]:
+
+            typecheck_regions(regions)
+            typecheck_external_id(external_id)
+            typecheck_target_ids(target_ids)
+            typecheck_ignore_ids(ignore_ids)
+            typecheck_thread_workers(thread_workers, allow_auto=False)
+            typecheck_ou_thread_workers(ou_thread_workers)
+            typecheck_concurrency(concurrency)
+
+            def create_runner() -> CoveAsyncRunner:
+                host_account = CoveHostAccount(
+                    target_ids=target_ids,
+                    ignore_ids=ignore_ids,
+                    rolename=rolename,
+                    role_session_name=role_session_name,
+                    policy=policy,
+                    policy_arns=policy_arns,
+                    external_id=external_id,
+                    assuming_session=assuming_session,
+                    thread_workers=thread_workers,
+                    regions=regions,
+                    partition=partition,
+                    credential_store=credential_store,
+                    ou_thread_workers=ou_thread_workers,
+                    org_snapshot=org_snapshot,
+                    assume_role_rate=assume_role_rate,
+                    assume_role_burst=assume_role_burst,
+                )
 
+                return CoveAsyncRunner(
+                    host_account=host_account,
+                    func=func,
+                    raise_exception=raise_exception,
+                    func_args=args,
+                    func_kwargs=kwargs,
+                    thread_workers=thread_workers,
+                    concurrency=concurrency,
+                    serialize_exceptions=serialize_exceptions,
+                )
 
-def _typecheck_external_id(external_id: Optional[str]) -> None:
-    if external_id is None:
-        return
-    if isinstance(external_id, str):
-        return
-    raise TypeError(f"external_id must be a string not {type(external_id)}")
+            if stream:
+                return _astream_records(create_runner)
+
+            return _arun(create_runner)
+
+        return wrapper
+
+    # Handle both bare decorator and with argument
+    if _func is None:
+        return decorator
+    else:
+        return decorator(_func)
+
+
+async def _create_async_runner(
+    create_runner: Callable[[], CoveAsyncRunner],
+) -> CoveAsyncRunner:
+    # Resolving the host account makes blocking STS and Organizations calls
+    return await asyncio.get_running_loop().run_in_executor(None, create_runner)
+
+
+async def _arun(create_runner: Callable[[], CoveAsyncRunner]) -> CoveOutput:
+    runner = await _create_async_runner(create_runner)
+    return format_output(await runner.run_cove_function())
+
+
+async def _astream_records(
+    create_runner: Callable[[], CoveAsyncRunner],
+) -> AsyncIterator[Dict[str, Any]]:
+    runner = await _create_async_runner(create_runner)
+    records = runner.iter_cove_function()
+    try:
+        async for record in records:
+            yield format_record(record)
+    finally:
+        # Closing the runner's generator cancels its pending tasks
+        await records.aclose()
 
 
 def _check_deprecation(kwargs: Dict[str, Any]) -> None:
@@ -130,38 +299,3 @@ def _raise_type_error_for_any_kwarg_except_org_master(kwargs: Dict[str, Any]) ->
         if key != "org_master":
             raise TypeError(f"cove() got an unexpected keyword argument '{key}'")
     return None
-
-
-def _typecheck_target_ids(list_of_ids: Optional[List[str]]) -> None:
-    if list_of_ids is None:
-        return
-    if isinstance(list_of_ids, str):
-        raise TypeError(
-            f"target_ids must be a list of str. Got str {repr(list_of_ids)}."
-        )
-    if len(list_of_ids) == 0:
-        raise ValueError(
-            f"target_ids must have at least 1 element. Got {repr(list_of_ids)}."
-        )
-    for _id in list_of_ids:
-        _typecheck_id(_id)
-
-
-def _typecheck_ignore_ids(list_of_ids: Optional[List[str]]) -> None:
-    if list_of_ids is None:
-        return
-    if isinstance(list_of_ids, str):
-        raise TypeError(
-            f"ignore_ids must be a list of str. Got str {repr(list_of_ids)}."
-        )
-    for _id in list_of_ids:
-        _typecheck_id(_id)
-
-
-def _typecheck_id(_id: str) -> None:
-    if isinstance(_id, str):
-        return
-    raise TypeError(
-        f"{_id} is an incorrect type: all account and ou id's must be strings "
-        f"not {type(_id)}"
-    )
@@ -0,0 +1,158 @@
+import logging
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from botocove.cove_decorator import cove
+from botocove.cove_output import spilled_output
+from botocove.cove_session import CoveSession, serialize_exception
+from botocove.cove_types import CoveExceptionRecord, CoveOutput, CoveSpilledOutput
+
+logger = logging.getLogger(__name__)
+
+CoveFunctions = Union[Sequence[Callable[..., Any]], Mapping[str, Callable[..., Any]]]
+
+# A function's return value, or the exception it raised
+CoveFunctionCall = Tuple[Any, Optional[Union[Exception, CoveExceptionRecord]]]
+
+
+class CoveFunctionGroup(object):
+    """Calls several functions in turn with the same CoveSession.
+
+    A cove task runs the group as its function, so each account and region is
+    assumed and gets a session once for all of the functions. An exception from
+    one function is recorded against that function and the others still run,
+    unless raise_exception is True.
+    """
+
+    def __init__(
+        self,
+        functions: CoveFunctions,
+        raise_exception: bool = False,
+        serialize_exceptions: bool = False,
+    ) -> None:
+        self.functions = _name_functions(functions)
+        self.raise_exception = raise_exception
+        self.serialize_exceptions = serialize_exceptions
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self.functions)!r})"
+
+    def __call__(
+        self, session: CoveSession, *args: Any, **kwargs: Any
+    ) -> Dict[str, CoveFunctionCall]:
+        calls: Dict[str, CoveFunctionCall] = {}
+        for name, func in self.functions.items():
+            try:
+                calls[name] = (func(session, *args, **kwargs), None)
+            except Exception as e:
+                if self.raise_exception:
+                    raise
+                logger.debug(f"{name} failed in account {session}: {e!r}")
+                calls[name] = (
+                    None,
+                    serialize_exception(e) if self.serialize_exceptions else e,
+                )
+        return calls
+
+    def split_output(
+        self,
+        output: Union[CoveOutput, CoveSpilledOutput],
+        spill_threshold: Optional[int] = None,
+    ) -> Dict[str, Union[CoveOutput, CoveSpilledOutput]]:
+        """Splits the output of a run of the group into one output per function.
+
+        Tasks that failed to assume their role, or that failed outside of the
+        functions, appear in every function's output, as do the run's Timings
+        and ApiCalls summaries. With spill_threshold, each function's lists
+        spill to a temporary file like the output of a run."""
+        grouped: Dict[str, Union[CoveOutput, CoveSpilledOutput]] = {}
+        for name in self.functions:
+            grouped[name] = (
+                CoveOutput(Results=[], Exceptions=[], FailedAssumeRole=[])
+                if spill_threshold is None
+                else spilled_output(spill_threshold)
+            )
+            for record in output["Exceptions"]:
+                grouped[name]["Exceptions"].append(record)
+            for record in output["FailedAssumeRole"]:
+                grouped[name]["FailedAssumeRole"].append(record)
+        for record in output["Results"]:
+            shared = {k: v for k, v in record.items() if k != "Result"}
+            for name, (result, err) in record["Result"].items():
+                split = dict(shared)
+                if err is None:
+                    if result is not None:
+                        split["Result"] = result
+                    grouped[name]["Results"].append(split)
+                else:
+                    split["ExceptionDetails"] = err
+                    grouped[name]["Exceptions"].append(split)
+
+        for function_output in grouped.values():
+            if "Timings" in output:
+                function_output["Timings"] = output["Timings"]
+            if "ApiCalls" in output:
+                function_output["ApiCalls"] = output["ApiCalls"]
+        return grouped
+
+
+def cove_functions(
+    functions: CoveFunctions, **cove_kwargs: Any
+) -> Callable[..., Dict[str, Union[CoveOutput, CoveSpilledOutput]]]:
+    """Runs every function against each account and region with one assumed
+    session, and returns each function's output by name.
+
+    Functions are named by their keys when given as a mapping, or by their
+    __name__ when given as a sequence. Takes the keyword arguments of cove except
+    stream, reducer and sink. Arguments passed to the returned callable are passed to
+    every function."""
+    if cove_kwargs.get("stream"):
+        raise ValueError("cove_functions does not support stream=True")
+    for unsupported in ("reducer", "sink"):
+        if cove_kwargs.get(unsupported) is not None:
+            raise ValueError(f"cove_functions does not support {unsupported}")
+
+    spill_threshold = cove_kwargs.get("spill_threshold")
+    group = CoveFunctionGroup(
+        functions,
+        raise_exception=cove_kwargs.get("raise_exception", False),
+        # Spilled records hold CoveExceptionRecords, as in the output of cove
+        serialize_exceptions=(
+            cove_kwargs.get("serialize_exceptions", False)
+            or spill_threshold is not None
+        ),
+    )
+    run_group = cove(**cove_kwargs)(group)
+
+    def wrapper(
+        *args: Any, **kwargs: Any
+    ) -> Dict[str, Union[CoveOutput, CoveSpilledOutput]]:
+        return group.split_output(run_group(*args, **kwargs), spill_threshold)
+
+    return wrapper
+
+
+def _name_functions(functions: CoveFunctions) -> Dict[str, Callable[..., Any]]:
+    if isinstance(functions, Mapping):
+        named = dict(functions)
+    else:
+        named = {}
+        for func in functions:
+            name = getattr(func, "__name__", repr(func))
+            if name in named:
+                raise ValueError(
+                    f"Functions must have unique names. Got {name!r} twice: "
+                    "pass a dict to name them."
+                )
+            named[name] = func
+    if not named:
+        raise ValueError("functions must have at least 1 element.")
+    return named
@@ -0,0 +1,87 @@
+import logging
+from typing import Optional, Sequence
+
+from botocove.cove_types import CoveSessionInformation
+
+logger = logging.getLogger(__name__)
+
+
+class CoveHook(object):
+    """Receives lifecycle events of a cove run. Subclass it and override the
+    events you need; every method does nothing by default.
+
+    Task events fire on the worker that runs the task, so a hook shared by
+    several threads must be thread safe. With executor="process" the task
+    events fire in the worker processes, on a copy of the hook. Hooks should
+    not raise: an exception from a task event fails that task.
+    """
+
+    def on_task_submitted(self, session_information: CoveSessionInformation) -> None:
+        """The task has been submitted to the executor."""
+
+    def on_assume_role_start(self, session_information: CoveSessionInformation) -> None:
+        """The task is about to get credentials for its account."""
+
+    def on_assume_role_end(self, session_information: CoveSessionInformation) -> None:
+        """The task's session has been activated with its account's credentials."""
+
+    def on_function_start(self, session_information: CoveSessionInformation) -> None:
+        """The wrapped function is about to be called."""
+
+    def on_function_end(self, session_information: CoveSessionInformation) -> None:
+        """The wrapped function returned; its return value is in Result."""
+
+    def on_task_failed(
+        self, session_information: CoveSessionInformation, err: Exception
+    ) -> None:
+        """Assuming the role or the wrapped function raised err."""
+
+    def on_run_complete(self) -> None:
+        """Every task has completed, or the run has stopped early."""
+
+
+class _CoveHookGroup(CoveHook):
+    """Forwards each event to several hooks in order."""
+
+    def __init__(self, hooks: Sequence[CoveHook]) -> None:
+        self.hooks = tuple(hooks)
+
+    def on_task_submitted(self, session_information: CoveSessionInformation) -> None:
+        for hook in self.hooks:
+            hook.on_task_submitted(session_information)
+
+    def on_assume_role_start(self, session_information: CoveSessionInformation) -> None:
+        for hook in self.hooks:
+            hook.on_assume_role_start(session_information)
+
+    def on_assume_role_end(self, session_information: CoveSessionInformation) -> None:
+        for hook in self.hooks:
+            hook.on_assume_role_end(session_information)
+
+    def on_function_start(self, session_information: CoveSessionInformation) -> None:
+        for hook in self.hooks:
+            hook.on_function_start(session_information)
+
+    def on_function_end(self, session_information: CoveSessionInformation) -> None:
+        for hook in self.hooks:
+            hook.on_function_end(session_information)
+
+    def on_task_failed(
+        self, session_information: CoveSessionInformation, err: Exception
+    ) -> None:
+        for hook in self.hooks:
+            hook.on_task_failed(session_information, err)
+
+    def on_run_complete(self) -> None:
+        for hook in self.hooks:
+            hook.on_run_complete()
+
+
+def combine_hooks(hooks: Optional[Sequence[CoveHook]]) -> Optional[CoveHook]:
+    """Returns None when there are no hooks so that callers skip every event
+    with a single check."""
+    if not hooks:
+        return None
+    if len(hooks) == 1:
+        return hooks[0]
+    return _CoveHookGroup(hooks)
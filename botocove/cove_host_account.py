@@ -1,10 +1,11 @@
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 from typing import (
     Any,
     Dict,
-    Iterable,
+    Generator,
     List,
     Literal,
     Optional,
@@ -23,6 +24,13 @@ from mypy_boto3_organizations.type_defs import AccountTypeDef
 from mypy_boto3_sts.client import STSClient
 from mypy_boto3_sts.type_defs import PolicyDescriptorTypeTypeDef
 
+from botocove.cove_credentials import CoveCredentialCache, CoveCredentialStore
+from botocove.cove_org_snapshot import (
+    CoveOrganizationSnapshot,
+    CoveOrganizationTopology,
+)
+from botocove.cove_rate_limiter import CoveRateLimiter
+from botocove.cove_task import CoveRunConfig, CoveTask
 from botocove.cove_types import CoveSessionInformation
 
 logger = logging.getLogger(__name__)
@@ -34,6 +42,8 @@ DEFAULT_ROLENAME = "OrganizationAccountAccessRole"
 class CoveHostAccount(object):
     target_regions: Sequence[Optional[str]]
     account_data: Optional[Dict[str, AccountTypeDef]] = None
+    org_topology: Optional[CoveOrganizationTopology] = None
+    accounts_from_snapshot = False
 
     def __init__(
         self,
@@ -48,16 +58,32 @@ class CoveHostAccount(object):
         thread_workers: int,
         regions: Optional[List[str]],
         partition: Optional[str],
+        credential_store: Optional[CoveCredentialStore] = None,
+        ou_thread_workers: int = 5,
+        org_snapshot: Optional[CoveOrganizationSnapshot] = None,
+        assume_role_rate: Optional[float] = None,
+        assume_role_burst: int = 10,
     ) -> None:
 
         self.thread_workers = thread_workers
+        self.ou_thread_workers = ou_thread_workers
 
+        self.assuming_session = assuming_session
         self.sts_client = self._get_boto3_sts_client(assuming_session)
+        self.assume_role_rate = assume_role_rate
+        self.assume_role_burst = assume_role_burst
+        self.rate_limiter = self._get_rate_limiter(self.sts_client)
         self.org_client = self._get_boto3_org_client(assuming_session)
 
         caller_id = self.sts_client.get_caller_identity()
         self.host_account_id = caller_id["Account"]
         self.host_account_partition = caller_id["Arn"].split(":")[1]
+        self.credential_cache = CoveCredentialCache(
+            store=credential_store, principal=caller_id["Arn"]
+        )
+
+        if org_snapshot is not None:
+            self.org_topology = org_snapshot.load(self.host_account_id)
 
         if regions is None:
             self.target_regions = [None]
@@ -83,6 +109,10 @@ class CoveHostAccount(object):
             raise ValueError(
                 "There are no eligible account ids to run decorated func against"
             )
+        self._validate_target_accounts_are_active()
+
+        if org_snapshot is not None and self.org_topology is not None:
+            org_snapshot.save(self.host_account_id, self.org_topology)
 
         self.partition = partition or self.host_account_partition
         self.role_to_assume = rolename or DEFAULT_ROLENAME
@@ -90,62 +120,63 @@ class CoveHostAccount(object):
         self.policy = policy
         self.policy_arns = policy_arns
         self.external_id = external_id
+        self.run_config = CoveRunConfig(
+            RoleName=self.role_to_assume,
+            RoleSessionName=self.role_session_name,
+            Policy=self.policy,
+            PolicyArns=self.policy_arns,
+            ExternalId=self.external_id,
+            Partition=self.partition,
+        )
 
     def get_cove_sessions(self) -> List[CoveSessionInformation]:
+        return list(self.iter_cove_sessions())
+
+    def iter_cove_sessions(self) -> Generator[CoveSessionInformation, None, None]:
+        return (
+            task.session_information(self.run_config) for task in self.iter_cove_tasks()
+        )
+
+    def iter_cove_tasks(self) -> Generator[CoveTask, None, None]:
+        """Generates tasks lazily so that runners only hold the tasks they have
+        in flight."""
         logger.info(f"Getting session information for {self.target_accounts=}")
         logger.info(f"AWS Partition: {self.partition=}")
         logger.info(f"Role: {self.role_to_assume=} {self.role_session_name=}")
         logger.info(f"Session policy: {self.policy_arns=} {self.policy=}")
-        return list(self._generate_account_sessions())
-
-    def _generate_account_sessions(self) -> Iterable[CoveSessionInformation]:
-        for region in self.target_regions:
-            for account_id in self.target_accounts:
-                if self.account_data is not None:
-
-                    # If running with target accounts, but with organization data
-                    # available, i.e., running from org master but not targeting
-                    # whole org.
-                    if account_id not in self.account_data:
-                        raise ValueError(
-                            f"Account {account_id} is not ACTIVE in the organization."
-                        )
-
-                    yield CoveSessionInformation(
-                        Id=account_id,
-                        RoleName=self.role_to_assume,
-                        RoleSessionName=self.role_session_name,
-                        Policy=self.policy,
-                        PolicyArns=self.policy_arns,
-                        ExternalId=self.external_id,
-                        AssumeRoleSuccess=False,
-                        Region=region,
-                        Partition=self.partition,
-                        ExceptionDetails=None,
-                        Name=self.account_data[account_id]["Name"],
-                        Arn=self.account_data[account_id]["Arn"],
-                        Email=self.account_data[account_id]["Email"],
-                        Status=self.account_data[account_id]["Status"],
-                        Result=None,
-                    )
-                else:
-                    yield CoveSessionInformation(
-                        Id=account_id,
-                        RoleName=self.role_to_assume,
-                        RoleSessionName=self.role_session_name,
-                        Policy=self.policy,
-                        PolicyArns=self.policy_arns,
-                        ExternalId=self.external_id,
-                        AssumeRoleSuccess=False,
-                        Region=region,
-                        Partition=self.partition,
-                        ExceptionDetails=None,
-                        Name=None,
-                        Arn=None,
-                        Email=None,
-                        Status=None,
-                        Result=None,
-                    )
+        return self._generate_tasks()
+
+    @property
+    def session_count(self) -> int:
+        return len(self.target_regions) * len(self.target_accounts)
+
+    def _validate_target_accounts_are_active(self) -> None:
+        # If running with target accounts, but with organization data
+        # available, i.e., running from org master but not targeting
+        # whole org.
+        if self.account_data is None:
+            return
+        if self.accounts_from_snapshot and not self.target_accounts.issubset(
+            self.account_data
+        ):
+            # A target may have joined the organization after the snapshot
+            logger.info("Targets missing from organization snapshot: refreshing it")
+            self.organization_account_ids = self._list_active_org_accounts()
+        for account_id in self.target_accounts:
+            if account_id not in self.account_data:
+                raise ValueError(
+                    f"Account {account_id} is not ACTIVE in the organization."
+                )
+
+    def _generate_tasks(self) -> Generator[CoveTask, None, None]:
+        # Regions vary fastest so that consecutive tasks spread their load across
+        # every region's endpoints instead of bursting against one region
+        for account_id in self.target_accounts:
+            account = (
+                None if self.account_data is None else self.account_data[account_id]
+            )
+            for region in self.target_regions:
+                yield CoveTask(account_id, region, account)
 
     def _get_boto3_client(
         self,
@@ -176,6 +207,15 @@ class CoveHostAccount(object):
         client: STSClient = self._get_boto3_client("sts", assuming_session)
         return client
 
+    def _get_rate_limiter(self, sts_client: STSClient) -> Optional[CoveRateLimiter]:
+        if self.assume_role_rate is None:
+            return None
+        rate_limiter = CoveRateLimiter(
+            rate=self.assume_role_rate, burst=self.assume_role_burst
+        )
+        rate_limiter.attach(sts_client)
+        return rate_limiter
+
     def _resolve_target_accounts(self, target_ids: Optional[List[str]]) -> Set[str]:
         accounts_to_ignore = self._gather_ignored_accounts()
         logger.info(f"Ignoring account IDs: {accounts_to_ignore=}")
@@ -235,44 +275,21 @@ class CoveHostAccount(object):
     def _get_all_accounts_by_organization_units(
         self, target_ous: List[str]
     ) -> List[str]:
+        """Expands the OU tree breadth-first from the target OUs. The child OUs and
+        child accounts of every OU in a level are listed concurrently, so the
+        lookup takes one round trip per level of the tree rather than per OU."""
 
         account_list: List[str] = []
 
-        for parent_ou in target_ous:
-
-            current_ou_list: List[str] = []
-
-            # current_ou_list is mutated and recursivly populated with all childs
-            self._get_all_child_ous(parent_ou, current_ou_list)
-
-            # for complete list add parent ou as well to list of child ous
-            current_ou_list.append(parent_ou)
+        with ThreadPoolExecutor(max_workers=self.ou_thread_workers) as executor:
+            current_level = target_ous
+            while current_level:
+                child_ous = executor.map(self._get_child_ous, current_level)
+                child_accounts = executor.map(self._get_child_accounts, current_level)
 
-            account_list.extend(
-                self._get_accounts_by_organization_units(current_ou_list)
-            )
-
-        return account_list
-
-    def _get_all_child_ous(self, parent_ou: str, ou_list: List[str]) -> None:
-        """Depth-first recursion mutates the current_ou_list present in the calling
-        function to establish all children of a parent OU"""
-
-        child_ous = self._get_child_ous(parent_ou)
-        ou_list.extend(child_ous)
-
-        for ou in child_ous:
-            self._get_all_child_ous(ou, ou_list)
-
-    def _get_accounts_by_organization_units(
-        self, organization_units: List[str]
-    ) -> List[str]:
-
-        account_list: List[str] = []
-
-        for ou in organization_units:
-            ou_children = self._get_child_accounts(ou)
-            account_list.extend(ou_children)
+                for accounts in child_accounts:
+                    account_list.extend(accounts)
+                current_level = [ou for ous in child_ous for ou in ous]
 
         return account_list
 
@@ -280,6 +297,14 @@ class CoveHostAccount(object):
         """Captures all account metadata into self.account_data for future lookup and
         returns a set of account IDs in the AWS organization."""
 
+        if self.org_topology is not None and self.org_topology["Accounts"]:
+            self.account_data = self.org_topology["Accounts"]
+            self.accounts_from_snapshot = True
+            return set(self.account_data.keys())
+
+        return self._list_active_org_accounts()
+
+    def _list_active_org_accounts(self) -> Set[str]:
         pages = self.org_client.get_paginator("list_accounts").paginate()
         self.account_data: Dict[str, AccountTypeDef] = {
             account["Id"]: account
@@ -287,6 +312,8 @@ class CoveHostAccount(object):
             for account in page["Accounts"]
             if account["Status"] == "ACTIVE"
         }
+        if self.org_topology is not None:
+            self.org_topology["Accounts"] = self.account_data
 
         return set(self.account_data.keys())
 
@@ -295,11 +322,14 @@ class CoveHostAccount(object):
         """List the child organizational units (OUs) of the parent OU. Just the ID
         is needed to traverse the organization tree."""
 
+        if self.org_topology is not None and parent_ou in self.org_topology["ChildOus"]:
+            return self.org_topology["ChildOus"][parent_ou]
+
         try:
             pages = self.org_client.get_paginator("list_children").paginate(
                 ParentId=parent_ou, ChildType="ORGANIZATIONAL_UNIT"
             )
-            return [ou["Id"] for page in pages for ou in page["Children"]]
+            child_ous = [ou["Id"] for page in pages for ou in page["Children"]]
         except ClientError:
             logger.error(
                 "Cove can only look up target accounts by OU when running from the "
@@ -309,12 +339,27 @@ class CoveHostAccount(object):
             )
             raise
 
+        if self.org_topology is not None:
+            self.org_topology["ChildOus"][parent_ou] = child_ous
+        return child_ous
+
     @lru_cache()
     def _get_child_accounts(self, parent_ou: str) -> List[str]:
         """List the child accounts of the parent organizational unit (OU). Just the ID is
         needed to access the account. The metadata is enriched elsewhere."""
 
+        if (
+            self.org_topology is not None
+            and parent_ou in self.org_topology["ChildAccounts"]
+        ):
+            return self.org_topology["ChildAccounts"][parent_ou]
+
         pages = self.org_client.get_paginator("list_children").paginate(
             ParentId=parent_ou, ChildType="ACCOUNT"
         )
-        return [account["Id"] for page in pages for account in page["Children"]]
+        child_accounts = [
+            account["Id"] for page in pages for account in page["Children"]
+        ]
+        if self.org_topology is not None:
+            self.org_topology["ChildAccounts"][parent_ou] = child_accounts
+        return child_accounts
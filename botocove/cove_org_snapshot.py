@@ -0,0 +1,104 @@
+import json
+import logging
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, TypedDict, Union
+
+from mypy_boto3_organizations.type_defs import AccountTypeDef
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SNAPSHOT_TTL = timedelta(hours=1)
+
+
+class CoveOrganizationTopology(TypedDict):
+    CreatedAt: float
+    Accounts: Optional[Dict[str, AccountTypeDef]]
+    ChildOus: Dict[str, List[str]]
+    ChildAccounts: Dict[str, List[str]]
+
+
+class CoveOrganizationSnapshot(object):
+    """Persists what Cove learns about an organization to a local JSON file so
+    that later runs resolve targets without calling the Organizations API.
+
+    The snapshot holds the active accounts with their metadata and the child OUs
+    and child accounts of every OU that a run has looked up. It is keyed by the
+    host account ID and expires ttl after it was first written.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        ttl: timedelta = DEFAULT_SNAPSHOT_TTL,
+    ) -> None:
+        self.path = os.fspath(path)
+        self.ttl = ttl
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(path={self.path!r}, ttl={self.ttl!r})"
+
+    def load(self, host_account_id: str) -> CoveOrganizationTopology:
+        """Returns the host account's topology, or an empty one if there is no
+        unexpired snapshot."""
+        topology = self._read().get(host_account_id)
+        if topology is None or self._is_expired(topology):
+            logger.info("No current organization snapshot: using Organizations API")
+            return CoveOrganizationTopology(
+                CreatedAt=time.time(), Accounts=None, ChildOus={}, ChildAccounts={}
+            )
+        logger.info(f"Using organization snapshot from {self.path}")
+        return topology
+
+    def save(self, host_account_id: str, topology: CoveOrganizationTopology) -> None:
+        snapshots = self._read()
+        snapshots[host_account_id] = topology
+
+        # Write to a temporary file and rename it over the snapshot so that
+        # concurrent readers never see a partial file
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(snapshots, f, default=_serialize_datetime)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    def invalidate(self) -> None:
+        """Deletes the snapshot so that the next run calls the Organizations API."""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def _read(self) -> Dict[str, CoveOrganizationTopology]:
+        try:
+            with open(self.path) as f:
+                snapshots: Dict[str, CoveOrganizationTopology] = json.load(
+                    f, object_hook=_deserialize_account
+                )
+                return snapshots
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            logger.warning(f"Ignoring unreadable organization snapshot {self.path}")
+            return {}
+
+    def _is_expired(self, topology: CoveOrganizationTopology) -> bool:
+        return topology["CreatedAt"] + self.ttl.total_seconds() <= time.time()
+
+
+def _serialize_datetime(value: Any) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value)} is not JSON serializable")
+
+
+def _deserialize_account(value: Dict[str, Any]) -> Dict[str, Any]:
+    if "JoinedTimestamp" in value:
+        value["JoinedTimestamp"] = datetime.fromisoformat(value["JoinedTimestamp"])
+    return value
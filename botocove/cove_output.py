@@ -0,0 +1,169 @@
+import logging
+from itertools import chain
+from typing import (
+    Any,
+    Counter,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Union,
+)
+
+from botocove.cove_reducer import CoveAggregation
+from botocove.cove_runner import CoveRunner
+from botocove.cove_session import serialize_exception
+from botocove.cove_sink import CoveSink, summarize_sink
+from botocove.cove_spill import CoveSpilledRecords, CoveSpillStore
+from botocove.cove_telemetry import CoveApiTelemetry
+from botocove.cove_timings import summarize_timings
+from botocove.cove_types import (
+    CoveFunctionOutput,
+    CoveOutput,
+    CoveSessionInformation,
+    CoveSpilledOutput,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def format_output(output: CoveFunctionOutput) -> CoveOutput:
+    formatted = CoveOutput(Results=[], Exceptions=[], FailedAssumeRole=[])
+    for record in chain(output["Results"], output["Exceptions"]):
+        formatted[_category(record)].append(format_record(record))
+    return formatted
+
+
+def collect_output(
+    records: Iterable[CoveSessionInformation],
+    timings: bool = False,
+    api_telemetry: Optional[CoveApiTelemetry] = None,
+    aggregation: Optional[CoveAggregation] = None,
+    sink: Optional[CoveSink] = None,
+    spill_threshold: Optional[int] = None,
+) -> Union[CoveOutput, CoveSpilledOutput]:
+    # Rewrite each record into an untyped dict to retain current functionality.
+    # Records are formatted and sorted in one pass as they complete, so each
+    # record exists once in memory instead of once per copy.
+    formatted: Union[CoveOutput, CoveSpilledOutput] = (
+        CoveOutput(Results=[], Exceptions=[], FailedAssumeRole=[])
+        if spill_threshold is None
+        else spilled_output(spill_threshold)
+    )
+    # Records that are reduced or written to the sink keep only their timings
+    # for the summary
+    timing_records: List[Dict[str, Any]] = []
+    sunk: Counter[str] = Counter()
+    if sink is not None:
+        sink.open()
+    try:
+        for record in records:
+            category = _category(record)
+            if category == "Results" and aggregation is not None:
+                aggregation.fold_completed(record)
+                if timings and "Timings" in record:
+                    timing_records.append(_timing_record(record))
+                continue
+
+            if sink is None:
+                if spill_threshold is None:
+                    formatted[category].append(format_record(record))
+                else:
+                    formatted[category].append(_spillable_record(record))
+                continue
+            sink.write(format_record(record))
+            sunk[category] += 1
+            if timings and "Timings" in record:
+                timing_records.append(_timing_record(record))
+    finally:
+        if sink is not None:
+            sink.close()
+
+    if timings:
+        formatted["Timings"] = summarize_timings(
+            chain(
+                formatted["Results"],
+                formatted["Exceptions"],
+                formatted["FailedAssumeRole"],
+                timing_records,
+            )
+        )
+    if api_telemetry is not None:
+        formatted["ApiCalls"] = api_telemetry.summary()
+    if aggregation is not None:
+        formatted["Aggregate"] = aggregation.result()
+    if sink is not None:
+        formatted["Sink"] = summarize_sink(sink, sunk)
+    return formatted
+
+
+def spilled_output(spill_threshold: int) -> CoveSpilledOutput:
+    store = CoveSpillStore()
+
+    def records() -> CoveSpilledRecords:
+        return CoveSpilledRecords(store, spill_threshold)
+
+    return CoveSpilledOutput(
+        Results=records(), Exceptions=records(), FailedAssumeRole=records()
+    )
+
+
+def _category(
+    record: CoveSessionInformation,
+) -> Literal["Results", "Exceptions", "FailedAssumeRole"]:
+    if not record["ExceptionDetails"]:
+        return "Results"
+    if record["AssumeRoleSuccess"] is True:
+        return "Exceptions"
+    return "FailedAssumeRole"
+
+
+def _spillable_record(record: CoveSessionInformation) -> Dict[str, Any]:
+    # An exception may pickle but fail to unpickle, for example when its
+    # __init__ takes arguments other than its message, so spilled records hold
+    # a description of it instead
+    formatted = format_record(record)
+    details = formatted.get("ExceptionDetails")
+    if isinstance(details, Exception):
+        formatted["ExceptionDetails"] = serialize_exception(details)
+    return formatted
+
+
+def _timing_record(record: CoveSessionInformation) -> Dict[str, Any]:
+    return {
+        "Id": record["Id"],
+        "Region": record["Region"],
+        "Name": record["Name"],
+        "Timings": record.get("Timings"),
+    }
+
+
+def run_cove(
+    runner: CoveRunner, stream: bool, spill_threshold: Optional[int] = None
+) -> Union[CoveOutput, CoveSpilledOutput, Iterator[Dict[str, Any]]]:
+    if stream:
+        return stream_records(runner)
+    return collect_output(
+        runner.iter_cove_function(),
+        timings=runner.timings,
+        api_telemetry=runner.api_telemetry,
+        aggregation=runner.aggregation,
+        sink=runner.sink,
+        spill_threshold=spill_threshold,
+    )
+
+
+def stream_records(runner: CoveRunner) -> Iterator[Dict[str, Any]]:
+    records = runner.iter_cove_function()
+    try:
+        for record in records:
+            yield format_record(record)
+    finally:
+        # Closing the runner's generator cancels its queued tasks
+        records.close()
+
+
+def format_record(record: CoveSessionInformation) -> Dict[str, Any]:
+    return {k: v for k, v in record.items() if v is not None}
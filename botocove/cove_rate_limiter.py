@@ -0,0 +1,128 @@
+import logging
+import threading
+import time
+from typing import Any, Callable, Optional, Tuple, TypeVar
+
+from botocore.exceptions import ClientError
+from mypy_boto3_sts.client import STSClient
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+THROTTLING_ERROR_CODES = {
+    "Throttling",
+    "ThrottlingException",
+    "ThrottledException",
+    "RequestThrottled",
+    "RequestThrottledException",
+    "RequestLimitExceeded",
+    "TooManyRequestsException",
+    "SlowDown",
+}
+
+# On throttling the rate is halved. Each success then recovers a small fraction of
+# the configured rate, so the limiter settles just below the rate STS accepts.
+DECREASE_FACTOR = 0.5
+RECOVERY_FRACTION = 0.02
+MAX_ATTEMPTS = 5
+
+
+def is_throttling_error(err: BaseException) -> bool:
+    return (
+        isinstance(err, ClientError)
+        and err.response.get("Error", {}).get("Code") in THROTTLING_ERROR_CODES
+    )
+
+
+class CoveRateLimiter(object):
+    """A token bucket shared by every thread that calls AssumeRole.
+
+    Tokens refill at `rate` per second up to `burst`. The rate adapts to STS: it
+    drops each time a call is throttled, including attempts that botocore retries
+    internally, and climbs back towards the configured rate as calls succeed.
+    Calls that still fail with throttling are retried through the bucket.
+    """
+
+    def __init__(self, rate: float, burst: int = 10, min_rate: float = 0.5) -> None:
+        if rate <= 0:
+            raise ValueError(f"rate must be greater than 0. Got {rate!r}.")
+        if burst < 1:
+            raise ValueError(f"burst must be at least 1. Got {burst!r}.")
+        self.max_rate = rate
+        self.rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.burst = burst
+        self.throttle_count = 0
+        # Attached limiters observe every throttled attempt, including the last
+        self.attached = False
+
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(rate={self.max_rate!r}, burst={self.burst!r})"
+        )
+
+    def attach(self, sts_client: STSClient) -> None:
+        """Learns from throttled AssumeRole attempts that botocore retries."""
+        sts_client.meta.events.register(
+            "needs-retry.sts.AssumeRole", self._observe_attempt
+        )
+        self.attached = True
+
+    def call(self, operation: Callable[[], T]) -> T:
+        attempt = 1
+        while True:
+            self.acquire()
+            try:
+                result = operation()
+            except ClientError as e:
+                if not is_throttling_error(e) or attempt >= MAX_ATTEMPTS:
+                    raise
+                logger.debug(f"Throttled on attempt {attempt}: retrying")
+                if not self.attached:
+                    self.on_throttle()
+                attempt += 1
+                continue
+            self.on_success()
+            return result
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    float(self.burst), self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def on_throttle(self) -> None:
+        with self._lock:
+            self.throttle_count += 1
+            self.rate = max(self.min_rate, self.rate * DECREASE_FACTOR)
+            # Spend any saved burst so that the reduced rate applies immediately
+            self._tokens = min(self._tokens, 0.0)
+        logger.debug(f"AssumeRole throttled: reduced rate to {self.rate:.2f}/s")
+
+    def on_success(self) -> None:
+        with self._lock:
+            self.rate = min(
+                self.max_rate, self.rate + self.max_rate * RECOVERY_FRACTION
+            )
+
+    def _observe_attempt(
+        self, response: Optional[Tuple[Any, Any]] = None, **kwargs: Any
+    ) -> None:
+        if response is None:
+            return
+        _, parsed = response
+        if parsed.get("Error", {}).get("Code") in THROTTLING_ERROR_CODES:
+            self.on_throttle()
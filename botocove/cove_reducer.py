@@ -0,0 +1,94 @@
+import copy
+import functools
+import logging
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Callable, List, Optional, Union
+
+from botocove.cove_types import CoveSessionInformation
+
+logger = logging.getLogger(__name__)
+
+
+class CoveReducer(ABC):
+    """Folds the results of a run into one value instead of keeping them.
+
+    Each worker thread folds the results of its own tasks into its own partial
+    accumulator, so folding needs no lock, and the partials are combined when
+    the run ends. Subclass it and implement all three methods: initial returns a
+    new empty accumulator, reduce folds a result into an accumulator and combine
+    merges two accumulators. reduce and combine may update an accumulator in
+    place as long as they return it.
+    """
+
+    @abstractmethod
+    def initial(self) -> Any: ...
+
+    @abstractmethod
+    def reduce(self, accumulator: Any, result: Any) -> Any: ...
+
+    @abstractmethod
+    def combine(self, accumulator: Any, other: Any) -> Any: ...
+
+
+CoveReducerType = Union[Callable[[Any, Any], Any], CoveReducer]
+
+
+class CoveAggregation(object):
+    """Holds the accumulators of one run's reducer.
+
+    A CoveReducer folds each result on the worker thread that produced it when
+    fold_in_workers is set. Otherwise, and always for a reducer function, whose
+    partials can't be combined, the output collector folds each result as it
+    completes, on the one thread that consumes the run.
+    """
+
+    def __init__(
+        self, reducer: CoveReducerType, initial: Any, fold_in_workers: bool
+    ) -> None:
+        self.reducer = reducer
+        self.fold_in_workers = fold_in_workers and isinstance(reducer, CoveReducer)
+        # A copy, so that a mutable initial value is not shared between runs
+        self._accumulator = copy.deepcopy(initial)
+        # One single-item list per folding thread, so that a thread can replace
+        # its accumulator without a lock while the aggregation can still reach it
+        self._partials: List[List[Any]] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def fold_in_worker(self, session_information: CoveSessionInformation) -> None:
+        """Folds the task's result on the worker thread and drops it from the
+        session information."""
+        if not self.fold_in_workers:
+            return
+        self._fold(session_information["Result"])
+        session_information["Result"] = None
+
+    def fold_completed(self, session_information: CoveSessionInformation) -> None:
+        """Folds the result of a completed task that was not folded by its
+        worker."""
+        if self.fold_in_workers:
+            return
+        self._fold(session_information["Result"])
+
+    def result(self) -> Any:
+        """Combines the partial accumulators once every task has completed."""
+        if not isinstance(self.reducer, CoveReducer):
+            return self._accumulator
+        with self._lock:
+            partials = [cell[0] for cell in self._partials]
+        if not partials:
+            return self.reducer.initial()
+        return functools.reduce(self.reducer.combine, partials)
+
+    def _fold(self, result: Any) -> None:
+        if not isinstance(self.reducer, CoveReducer):
+            self._accumulator = self.reducer(self._accumulator, result)
+            return
+        cell: Optional[List[Any]] = getattr(self._local, "cell", None)
+        if cell is None:
+            cell = [self.reducer.initial()]
+            self._local.cell = cell
+            with self._lock:
+                self._partials.append(cell)
+        cell[0] = self.reducer.reduce(cell[0], result)
@@ -1,17 +1,87 @@
 import logging
-from concurrent.futures import Future, ThreadPoolExecutor, as_completed
-from typing import Any, Callable, Iterable, List
+import os
+import time
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from contextlib import nullcontext
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Deque,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    Literal,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
+import boto3
+from botocore.credentials import ReadOnlyCredentials
+from mypy_boto3_sts.client import STSClient
 from tqdm import tqdm
 
+from botocove.cove_concurrency import (
+    AUTO_THREAD_WORKERS_CEILING,
+    CoveConcurrencyController,
+)
+from botocove.cove_credentials import CoveCredentialCache, CoveCredentialStore
+from botocove.cove_hooks import CoveHook, combine_hooks
 from botocove.cove_host_account import CoveHostAccount
-from botocove.cove_session import CoveSession
+from botocove.cove_rate_limiter import (
+    THROTTLING_ERROR_CODES,
+    CoveRateLimiter,
+    is_throttling_error,
+)
+from botocove.cove_reducer import CoveAggregation, CoveReducerType
+from botocove.cove_scheduler import CoveRegionScheduler
+from botocove.cove_session import CoveSession, CoveSessionPool
+from botocove.cove_sink import CoveSink
+from botocove.cove_task import CoveRunConfig, CoveTask
+from botocove.cove_telemetry import CoveApiTelemetry
+from botocove.cove_timings import CoveTaskTimer, stamp_submission
+from botocove.cove_trace import CoveTraceWriter
 from botocove.cove_types import CoveFunctionOutput, CoveSessionInformation
 
 logger = logging.getLogger(__name__)
 
+CoveExecutorType = Literal["thread", "process"]
+CoveThreadWorkers = Union[int, Literal["auto"]]
+
+# Keeps each worker's next task queued without materializing every task up front
+MAX_IN_FLIGHT_PER_WORKER = 2
+
+# Size of the pool that assumes roles ahead of submission with prefetch_credentials
+PREFETCH_THREAD_WORKERS = 4
+
+
+def get_auto_thread_workers_ceiling(executor: CoveExecutorType) -> int:
+    if executor == "process":
+        return os.cpu_count() or 1
+    return AUTO_THREAD_WORKERS_CEILING
+
 
 class CoveRunner(object):
+    sts_client: STSClient
+    run_config: CoveRunConfig
+    credential_cache: CoveCredentialCache
+    session_pool: Optional[CoveSessionPool]
+    rate_limiter: Optional[CoveRateLimiter]
+
     def __init__(
         self,
         host_account: CoveHostAccount,
@@ -19,11 +89,28 @@ class CoveRunner(object):
         raise_exception: bool,
         func_args: Any,
         func_kwargs: Any,
-        thread_workers: int,
+        thread_workers: CoveThreadWorkers,
+        recycle_sessions: bool = False,
+        executor: CoveExecutorType = "thread",
+        region_concurrency: Optional[int] = None,
+        prefetch_credentials: int = 0,
+        timings: bool = False,
+        trace_file: Optional[Union[str, "os.PathLike[str]"]] = None,
+        hooks: Optional[Sequence[CoveHook]] = None,
+        api_telemetry: bool = False,
+        serialize_exceptions: bool = False,
+        session_pool: Optional[CoveSessionPool] = None,
+        thread_executor: Optional[ThreadPoolExecutor] = None,
+        reducer: Optional[CoveReducerType] = None,
+        initial: Any = None,
+        sink: Optional[CoveSink] = None,
     ) -> None:
 
         self.host_account = host_account
-        self.sessions = host_account.get_cove_sessions()
+        self.run_config = host_account.run_config
+        self.sts_client = host_account.sts_client
+        self.credential_cache = host_account.credential_cache
+        self.rate_limiter = host_account.rate_limiter
 
         self.cove_wrapped_func = func
         self.raise_exception = raise_exception
@@ -31,34 +118,133 @@ class CoveRunner(object):
         self.func_kwargs = func_kwargs
 
         self.thread_workers = thread_workers
+        self.recycle_sessions = recycle_sessions
+        if session_pool is None and recycle_sessions:
+            session_pool = CoveSessionPool()
+        self.session_pool = session_pool
+        self.executor = executor
+        self.thread_executor = thread_executor
+        self.region_concurrency = region_concurrency
+        self.prefetch_credentials = prefetch_credentials
+        self.timings = timings
+        self.trace = None if trace_file is None else CoveTraceWriter(trace_file)
+        self.hooks = combine_hooks(hooks)
+        self.api_telemetry = CoveApiTelemetry() if api_telemetry else None
+        self.serialize_exceptions = serialize_exceptions
+        self.aggregation = (
+            None
+            if reducer is None
+            else CoveAggregation(reducer, initial, fold_in_workers=executor == "thread")
+        )
+        self.sink = sink
+
+        self.concurrency_controller: Optional[CoveConcurrencyController] = None
+        if thread_workers == "auto":
+            self.concurrency_controller = CoveConcurrencyController(
+                ceiling=get_auto_thread_workers_ceiling(executor)
+            )
+            self.max_workers = self.concurrency_controller.ceiling
+        else:
+            self.max_workers = thread_workers
 
     def run_cove_function(self) -> CoveFunctionOutput:
+        output = CoveFunctionOutput(Results=[], Exceptions=[])
+        for result in self.iter_cove_function():
+            if result["ExceptionDetails"]:
+                output["Exceptions"].append(result)
+            else:
+                output["Results"].append(result)
+        return output
+
+    def iter_cove_function(self) -> Generator[CoveSessionInformation, None, None]:
+        """Yields each task's session information as soon as the task completes.
+
+        Tasks are pulled lazily from the host account and at most
+        MAX_IN_FLIGHT_PER_WORKER * thread_workers tasks are submitted at once, or
+        the concurrency controller's limit when thread_workers is "auto". The
+        runner keeps no reference to a result once it is yielded, so a consumer
+        that discards results runs in constant memory.
 
-        # The "Submit and Use as Completed" pattern as described in
-        # "ThreadPoolExecutor in Python: The Complete Guide".
-        # https://superfastpython.com/threadpoolexecutor-in-python/#Submit_and_Use_as_Completed
-        with ThreadPoolExecutor(max_workers=self.thread_workers) as executor:
-            futures: List["Future[CoveSessionInformation]"] = [
-                executor.submit(self.cove_thread, s) for s in self.sessions
-            ]
-            completed: List[CoveSessionInformation] = list(
-                tqdm(
-                    _iterate_results_in_order_of_completion(futures),
-                    total=len(self.sessions),
+        Tasks arrive with regions interleaved, and region_concurrency further
+        caps the tasks in flight for any one region. With prefetch_credentials,
+        roles are assumed that many tasks ahead of submission in a separate
+        pool, so STS calls overlap with the functions already running. With
+        timings, each session's Timings record the phases of its task. With a
+        trace_file, the phases are also written as trace events as tasks
+        complete.
+
+        A thread_executor given to the runner is used for the tasks and left
+        running afterwards, so that a CoveContext can reuse its threads and their
+        recycled sessions for its next run."""
+
+        executor_context: ContextManager[Executor] = (
+            self._create_executor()
+            if self.thread_executor is None
+            else nullcontext(self.thread_executor)
+        )
+        with executor_context as executor, ThreadPoolExecutor(
+            max_workers=PREFETCH_THREAD_WORKERS
+        ) as prefetch_executor:
+            run = _cove_process_task if self.executor == "process" else self.run_task
+            tasks: Generator[CoveTask, None, None] = (
+                _prefetch_credentials(
+                    self.host_account.iter_cove_tasks(),
+                    self.prefetch_task_credentials,
+                    prefetch_executor,
+                    lookahead=self.prefetch_credentials,
+                )
+                if self.prefetch_credentials
+                else self.host_account.iter_cove_tasks()
+            )
+            if self.timings or self.trace is not None:
+                tasks = stamp_submission(tasks)
+            results = _iterate_results_in_order_of_completion(
+                executor,
+                run,
+                tasks,
+                max_in_flight=MAX_IN_FLIGHT_PER_WORKER * self.max_workers,
+                controller=self.concurrency_controller,
+                region_concurrency=self.region_concurrency,
+                on_submit=None if self.hooks is None else self._on_task_submitted,
+            )
+            if self.trace is not None:
+                results = self.trace.record(results)
+            try:
+                yield from tqdm(
+                    results,
+                    total=self.host_account.session_count,
                     desc="Executing function",
                     colour="#ff69b4",  # hotpink
                 )
-            )
+            finally:
+                # Cancel queued jobs before the executors wait for them
+                results.close()
+                tasks.close()
+                if self.hooks is not None:
+                    self.hooks.on_run_complete()
 
-        successful_results = [
-            result for result in completed if not result["ExceptionDetails"]
-        ]
-        exceptions = [result for result in completed if result["ExceptionDetails"]]
+    def run_task(self, task: CoveTask) -> CoveSessionInformation:
+        return self.cove_thread(task.session_information(self.run_config))
 
-        return CoveFunctionOutput(
-            Results=successful_results,
-            Exceptions=exceptions,
+    def prefetch_task_credentials(self, task: CoveTask) -> None:
+        """Assumes the task's role into the credential cache. A failure is left
+        for the task to raise and report when it assumes the role."""
+        cove_session = CoveSession(
+            task.session_information(self.run_config),
+            sts_client=self.sts_client,
+            credential_cache=self.credential_cache,
+            rate_limiter=self.rate_limiter,
         )
+        try:
+            cove_session.fetch_role_credentials()
+        except Exception as e:
+            logger.debug(
+                f"Prefetching credentials for account {task.account_id} failed: {e}"
+            )
+
+    def _on_task_submitted(self, task: CoveTask) -> None:
+        if self.hooks is not None:
+            self.hooks.on_task_submitted(task.session_information(self.run_config))
 
     def cove_thread(
         self,
@@ -66,27 +252,285 @@ class CoveRunner(object):
     ) -> CoveSessionInformation:
         cove_session = CoveSession(
             account_session_info,
-            sts_client=self.host_account.sts_client,
+            sts_client=self.sts_client,
+            credential_cache=self.credential_cache,
+            session_pool=self.session_pool,
+            rate_limiter=self.rate_limiter,
+            hooks=self.hooks,
+            api_telemetry=self.api_telemetry,
         )
+        timer = CoveTaskTimer.start(account_session_info)
         try:
             cove_session.activate_cove_session()
+            if timer is not None:
+                timer.assumed_role()
 
+            if self.hooks is not None:
+                self.hooks.on_function_start(account_session_info)
             result = self.cove_wrapped_func(
                 cove_session, *self.func_args, **self.func_kwargs
             )
 
-            return cove_session.format_cove_result(result)
+            completed = cove_session.format_cove_result(result)
+            if self.hooks is not None:
+                self.hooks.on_function_end(completed)
+            if self.aggregation is not None:
+                self.aggregation.fold_in_worker(completed)
+            return completed
 
         except Exception as e:
+            failed = cove_session.format_cove_error(
+                e, serialize=self.serialize_exceptions
+            )
+            if self.hooks is not None:
+                self.hooks.on_task_failed(failed, e)
             if self.raise_exception is True:
-                logger.exception(cove_session.format_cove_error(e))
+                logger.exception(failed)
                 raise
             else:
-                return cove_session.format_cove_error(e)
+                return failed
+        finally:
+            cove_session.deactivate_cove_session()
+            if timer is not None:
+                timer.finish()
+
+    def _create_executor(self) -> Executor:
+        if self.executor == "process":
+            return ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_process_worker,
+                initargs=(self._get_process_worker_config(),),
+            )
+        return ThreadPoolExecutor(max_workers=self.max_workers)
+
+    def _get_process_worker_config(self) -> "CoveProcessWorkerConfig":
+        # Clients can't cross a process boundary. Without an assuming session,
+        # each worker process builds its own STS client from the default
+        # credential chain, which refreshes temporary credentials as they
+        # expire. An assuming session's credentials are sent as a frozen copy.
+        credentials = None
+        if self.host_account.assuming_session is not None:
+            credentials = self.host_account.assuming_session.get_credentials()
+
+        return CoveProcessWorkerConfig(
+            func=self.cove_wrapped_func,
+            func_args=self.func_args,
+            func_kwargs=self.func_kwargs,
+            raise_exception=self.raise_exception,
+            recycle_sessions=self.recycle_sessions,
+            credential_store=self.credential_cache.store,
+            credential_principal=self.credential_cache.principal,
+            sts_credentials=(
+                None if credentials is None else credentials.get_frozen_credentials()
+            ),
+            sts_region_name=self.sts_client.meta.region_name,
+            assume_role_rate=(
+                None
+                if self.host_account.assume_role_rate is None
+                else self.host_account.assume_role_rate / self.max_workers
+            ),
+            assume_role_burst=max(
+                1, self.host_account.assume_role_burst // self.max_workers
+            ),
+            hooks=self.hooks,
+            run_config=self.run_config,
+            serialize_exceptions=self.serialize_exceptions,
+        )
+
+
+class CoveProcessWorkerConfig(NamedTuple):
+    func: Callable[..., Any]
+    func_args: Any
+    func_kwargs: Any
+    raise_exception: bool
+    recycle_sessions: bool
+    credential_store: Optional[CoveCredentialStore]
+    credential_principal: Optional[str]
+    sts_credentials: Optional[ReadOnlyCredentials]
+    sts_region_name: str
+    # The host's rate and burst, shared out between the worker processes
+    assume_role_rate: Optional[float]
+    assume_role_burst: int
+    hooks: Optional[CoveHook]
+    run_config: CoveRunConfig
+    serialize_exceptions: bool
+
+
+class CoveProcessWorker(CoveRunner):
+    """Runs the tasks sent to one worker process of a process
+    mode CoveRunner. Each worker process assumes roles with its own STS client and
+    credential cache."""
+
+    def __init__(self, config: CoveProcessWorkerConfig) -> None:
+        if config.sts_credentials is None:
+            sts_session = boto3.Session()
+        else:
+            sts_session = boto3.Session(
+                aws_access_key_id=config.sts_credentials.access_key,
+                aws_secret_access_key=config.sts_credentials.secret_key,
+                aws_session_token=config.sts_credentials.token,
+            )
+        self.sts_client = sts_session.client("sts", region_name=config.sts_region_name)
+        self.credential_cache = CoveCredentialCache(
+            store=config.credential_store, principal=config.credential_principal
+        )
+        self.session_pool = CoveSessionPool() if config.recycle_sessions else None
+        self.rate_limiter = None
+        if config.assume_role_rate is not None:
+            self.rate_limiter = CoveRateLimiter(
+                rate=config.assume_role_rate, burst=config.assume_role_burst
+            )
+            self.rate_limiter.attach(self.sts_client)
+
+        self.cove_wrapped_func = config.func
+        self.raise_exception = config.raise_exception
+        self.func_args = config.func_args
+        self.func_kwargs = config.func_kwargs
+        self.hooks = config.hooks
+        self.api_telemetry = None
+        self.run_config = config.run_config
+        self.serialize_exceptions = config.serialize_exceptions
+        # The parent process folds results as they arrive
+        self.aggregation = None
+
+
+_process_worker: Optional[CoveProcessWorker] = None
+
+
+def _init_process_worker(config: CoveProcessWorkerConfig) -> None:
+    global _process_worker
+    _process_worker = CoveProcessWorker(config)
+
+
+def _cove_process_task(task: CoveTask) -> CoveSessionInformation:
+    if _process_worker is None:
+        raise RuntimeError("Cove process worker was not initialized")
+    return _process_worker.run_task(task)
 
 
 def _iterate_results_in_order_of_completion(
-    jobs: List["Future[CoveSessionInformation]"],
-) -> Iterable[CoveSessionInformation]:
-    for f in as_completed(jobs):
-        yield f.result()
+    executor: Executor,
+    run: Callable[[CoveTask], CoveSessionInformation],
+    tasks: Iterator[CoveTask],
+    max_in_flight: int,
+    controller: Optional[CoveConcurrencyController] = None,
+    region_concurrency: Optional[int] = None,
+    on_submit: Optional[Callable[[CoveTask], None]] = None,
+) -> Generator[CoveSessionInformation, None, None]:
+    """Yields results as their jobs complete, submitting a new job from tasks
+    each time one finishes so that at most max_in_flight jobs exist at once. With
+    a controller, its limit replaces max_in_flight and each job's latency and
+    throttling are fed back to it. With region_concurrency, tasks for a region
+    that already has that many jobs wait while other regions' tasks go first.
+    on_submit is called with each task once it is submitted.
+
+    A variant of the "Submit and Use as Completed" pattern as described in
+    "ThreadPoolExecutor in Python: The Complete Guide".
+    https://superfastpython.com/threadpoolexecutor-in-python/#Submit_and_Use_as_Completed
+    """
+    jobs: Set["Future[CoveSessionInformation]"] = set()
+    submitted_at: Dict["Future[CoveSessionInformation]", float] = {}
+    job_regions: Dict["Future[CoveSessionInformation]", Optional[str]] = {}
+
+    scheduler = (
+        None
+        if region_concurrency is None
+        else CoveRegionScheduler(tasks, region_concurrency, max_deferred=max_in_flight)
+    )
+
+    def take(count: int) -> Iterable[CoveTask]:
+        if scheduler is None:
+            return islice(tasks, count)
+        return scheduler.take(count)
+
+    def submit_up_to_limit() -> None:
+        limit = max_in_flight if controller is None else controller.limit
+        for task in take(max(0, limit - len(jobs))):
+            job = executor.submit(run, task)
+            jobs.add(job)
+            if controller is not None:
+                submitted_at[job] = time.monotonic()
+            if scheduler is not None:
+                job_regions[job] = task.region
+            if on_submit is not None:
+                on_submit(task)
+
+    try:
+        submit_up_to_limit()
+        while jobs:
+            done, _ = wait(jobs, return_when=FIRST_COMPLETED)
+            jobs.difference_update(done)
+            if controller is not None:
+                now = time.monotonic()
+                for f in done:
+                    controller.record(
+                        latency=now - submitted_at.pop(f), throttled=_is_throttled(f)
+                    )
+            if scheduler is not None:
+                for f in done:
+                    scheduler.release(job_regions.pop(f))
+            # Refill before yielding so workers stay busy while the consumer runs
+            submit_up_to_limit()
+            for f in done:
+                yield f.result()
+    finally:
+        # Stop queued jobs if the consumer stops iterating early, and let running
+        # jobs finish as the executor may outlive this run
+        for f in jobs:
+            f.cancel()
+        wait(jobs)
+
+
+def _prefetch_credentials(
+    tasks: Iterator[CoveTask],
+    prefetch: Callable[[CoveTask], None],
+    executor: Executor,
+    lookahead: int,
+) -> Generator[CoveTask, None, None]:
+    """Yields tasks in order while prefetching the credentials of the next
+    lookahead tasks in executor.
+
+    Every task of a run assumes the same role, so each account is prefetched
+    once while it is in the lookahead and the region tasks of one account do not
+    hold several prefetch threads. A prefetch that has not started by the time
+    its task is yielded is cancelled, because the task will assume the role
+    itself.
+    """
+    ahead: Deque[Tuple[CoveTask, Optional["Future[None]"]]] = deque()
+    pending: Dict[str, "Future[None]"] = {}
+
+    def pop() -> CoveTask:
+        task, job = ahead.popleft()
+        if job is not None:
+            job.cancel()
+            if pending.get(task.account_id) is job:
+                del pending[task.account_id]
+        return task
+
+    try:
+        for task in tasks:
+            job = None
+            if task.account_id not in pending:
+                job = executor.submit(prefetch, task)
+                pending[task.account_id] = job
+            ahead.append((task, job))
+            if len(ahead) > lookahead:
+                yield pop()
+        while ahead:
+            yield pop()
+    finally:
+        for _, job in ahead:
+            if job is not None:
+                job.cancel()
+
+
+def _is_throttled(job: "Future[CoveSessionInformation]") -> bool:
+    err = job.exception()
+    if err is not None:
+        return is_throttling_error(err)
+    details = job.result()["ExceptionDetails"]
+    if details is None:
+        return False
+    if isinstance(details, BaseException):
+        return is_throttling_error(details)
+    return details["ErrorCode"] in THROTTLING_ERROR_CODES
@@ -0,0 +1,67 @@
+import logging
+from collections import Counter, defaultdict, deque
+from typing import DefaultDict, Deque, Iterator, List, Optional
+
+from botocove.cove_task import CoveTask
+
+logger = logging.getLogger(__name__)
+
+
+class CoveRegionScheduler(object):
+    """Releases tasks so that no region has more than region_concurrency tasks
+    in flight.
+
+    A task whose region is at its cap waits in that region's queue while later
+    tasks for other regions go ahead of it. At most max_deferred tasks wait
+    at once, so a run dominated by one region pauses instead of reading every
+    task into memory.
+    """
+
+    def __init__(
+        self,
+        tasks: Iterator[CoveTask],
+        region_concurrency: int,
+        max_deferred: int,
+    ) -> None:
+        self.region_concurrency = region_concurrency
+        self.max_deferred = max_deferred
+
+        self._tasks = tasks
+        self._in_flight: Counter[Optional[str]] = Counter()
+        self._deferred: DefaultDict[Optional[str], Deque[CoveTask]] = defaultdict(deque)
+        self._deferred_count = 0
+
+    def take(self, count: int) -> List[CoveTask]:
+        """Returns up to count tasks whose regions are below the cap, oldest
+        deferred tasks first."""
+        taken: List[CoveTask] = []
+
+        for region, queue in self._deferred.items():
+            while (
+                queue
+                and len(taken) < count
+                and self._in_flight[region] < self.region_concurrency
+            ):
+                self._deferred_count -= 1
+                taken.append(self._start(queue.popleft()))
+
+        while len(taken) < count and self._deferred_count < self.max_deferred:
+            task = next(self._tasks, None)
+            if task is None:
+                break
+            region = task.region
+            if self._in_flight[region] < self.region_concurrency:
+                taken.append(self._start(task))
+            else:
+                self._deferred[region].append(task)
+                self._deferred_count += 1
+
+        return taken
+
+    def release(self, region: Optional[str]) -> None:
+        """Records that a task in region has completed."""
+        self._in_flight[region] -= 1
+
+    def _start(self, task: CoveTask) -> CoveTask:
+        self._in_flight[task.region] += 1
+        return task
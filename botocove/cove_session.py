@@ -1,14 +1,54 @@
+import copy
 import logging
-from typing import Any
+import threading
+import traceback
+from typing import Any, List, Optional, Tuple
 
+from boto3.resources.factory import ResourceFactory
 from boto3.session import Session
+from botocore.client import BaseClient
 from botocore.exceptions import ClientError
+from botocore.hooks import BaseEventHooks
 from mypy_boto3_sts.client import STSClient
+from mypy_boto3_sts.type_defs import CredentialsTypeDef
 
-from botocove.cove_types import CoveSessionInformation
+from botocove.cove_credentials import CoveCredentialCache, get_credential_key
+from botocove.cove_hooks import CoveHook
+from botocove.cove_rate_limiter import CoveRateLimiter
+from botocove.cove_telemetry import CoveApiTelemetry
+from botocove.cove_types import CoveExceptionRecord, CoveSessionInformation
 
 logger = logging.getLogger(__name__)
 
+# The boto3 and botocore state that a CoveSession releases when its task ends
+_BOTO_COMPONENTS = ("_session", "_loader", "resource_factory")
+
+
+class CoveSessionPool(object):
+    """Keeps one boto3 session per worker thread for CoveSessions to recycle.
+
+    A new boto3 session builds a botocore session, loader and event system, and
+    parses service models again for its first clients. A recycled session keeps
+    the models it has loaded and only has its credentials and region swapped for
+    each task. Tasks on one thread run one after another, so the thread's session
+    is never shared between concurrent tasks.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+
+    def get_session(self) -> Tuple[Session, Optional[str], BaseEventHooks]:
+        """Returns this thread's session, the region it was created with and a
+        copy of the event handlers it was created with, so that handlers that
+        one task registers don't run for later tasks."""
+        session: Optional[Session] = getattr(self._local, "session", None)
+        if session is None:
+            session = Session()
+            self._local.session = session
+            self._local.default_region = session.region_name
+            self._local.events = copy.copy(session.events)
+        return session, self._local.default_region, copy.copy(self._local.events)
+
 
 class CoveSession(Session):
     """Enriches a boto3 Session with account data from Master account if run from
@@ -17,6 +57,7 @@ class CoveSession(Session):
     """
 
     assume_role_success: bool = False
+    deactivated: bool = False
     session_information: CoveSessionInformation
     stored_exception: Exception
 
@@ -24,38 +65,42 @@ class CoveSession(Session):
         self,
         session_info: CoveSessionInformation,
         sts_client: STSClient,
+        credential_cache: Optional[CoveCredentialCache] = None,
+        session_pool: Optional[CoveSessionPool] = None,
+        rate_limiter: Optional[CoveRateLimiter] = None,
+        hooks: Optional[CoveHook] = None,
+        api_telemetry: Optional[CoveApiTelemetry] = None,
     ) -> None:
         self.session_information = session_info
         self.sts_client = sts_client
+        self.credential_cache = credential_cache
+        self.session_pool = session_pool
+        self.rate_limiter = rate_limiter
+        self.hooks = hooks
+        self.api_telemetry = api_telemetry
+        self._clients: List[BaseClient] = []
 
     def __repr__(self) -> str:
         # Overwrite boto3's repr to avoid AttributeErrors
         return f"{self.__class__.__name__}(account_id={self.session_information['Id']})"
 
-    def activate_cove_session(self) -> "CoveSession":
-        role_arn = (
-            f"arn:{self.session_information['Partition']}:"
-            f"iam::{self.session_information['Id']}:role/"
-            f"{self.session_information['RoleName']}"
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes that are not set, such as the botocore
+        # components that deactivate_cove_session releases
+        if self.deactivated and name in _BOTO_COMPONENTS:
+            raise RuntimeError(
+                f"{self!r} was deactivated when its task completed. Use the "
+                "session only inside the wrapped function."
+            )
+        raise AttributeError(
+            f"{self.__class__.__name__!r} object has no attribute {name!r}"
         )
 
+    def activate_cove_session(self) -> "CoveSession":
         try:
-            logger.debug(f"Attempting to assume {role_arn}")
-
-            # This calling style avoids a ParamValidationError from botocore.
-            # Passing None is not allowed for the optional parameters.
-            assume_role_args = {
-                k: v
-                for k, v in [
-                    ("RoleArn", role_arn),
-                    ("RoleSessionName", self.session_information["RoleSessionName"]),
-                    ("Policy", self.session_information["Policy"]),
-                    ("PolicyArns", self.session_information["PolicyArns"]),
-                    ("ExternalId", self.session_information["ExternalId"]),
-                ]
-                if v is not None
-            }
-            creds = self.sts_client.assume_role(**assume_role_args)["Credentials"]  # type: ignore[arg-type] # noqa E501
+            if self.hooks is not None:
+                self.hooks.on_assume_role_start(self.session_information)
+            creds = self.fetch_role_credentials()
 
             init_session_args = {
                 k: v
@@ -68,8 +113,21 @@ class CoveSession(Session):
                 if v is not None
             }
 
-            self.initialize_boto_session(**init_session_args)
+            if self.session_pool is None:
+                self.initialize_boto_session(**init_session_args)
+            else:
+                self.initialize_pooled_boto_session(
+                    self.session_pool, **init_session_args
+                )
+            if self.api_telemetry is not None:
+                self.api_telemetry.register(
+                    self.events,
+                    self.session_information["Id"],
+                    unique_id=self._telemetry_id,
+                )
             self.session_information["AssumeRoleSuccess"] = True
+            if self.hooks is not None:
+                self.hooks.on_assume_role_end(self.session_information)
         except ClientError:
             logger.error(
                 f"Failed to initalize cove session for "
@@ -79,14 +137,124 @@ class CoveSession(Session):
 
         return self
 
+    def client(self, *args: Any, **kwargs: Any) -> Any:
+        # Resources create their clients through this method too
+        client = super().client(*args, **kwargs)
+        self._clients.append(client)
+        return client
+
+    def deactivate_cove_session(self) -> None:
+        """Closes the clients the task created so that their connection pools
+        release their sockets now rather than whenever the garbage collector
+        frees them, and releases the session's botocore components.
+
+        A recycled session's components go on to serve later tasks with other
+        credentials, so a session kept after its task raises when it is used
+        instead of acting in another account."""
+        if (
+            self.api_telemetry is not None
+            and self.session_information["AssumeRoleSuccess"]
+        ):
+            self.api_telemetry.unregister(self.events, unique_id=self._telemetry_id)
+        clients, self._clients = self._clients, []
+        for client in clients:
+            client.close()
+        for name in _BOTO_COMPONENTS:
+            vars(self).pop(name, None)
+        self.deactivated = True
+
+    @property
+    def _telemetry_id(self) -> str:
+        return f"cove-api-telemetry-{id(self)}"
+
+    def fetch_role_credentials(self) -> CredentialsTypeDef:
+        if self.credential_cache is None:
+            return self._assume_role()
+        return self.credential_cache.get_credentials(
+            get_credential_key(self.session_information), self._assume_role
+        )
+
+    def _assume_role(self) -> CredentialsTypeDef:
+        role_arn = (
+            f"arn:{self.session_information['Partition']}:"
+            f"iam::{self.session_information['Id']}:role/"
+            f"{self.session_information['RoleName']}"
+        )
+        logger.debug(f"Attempting to assume {role_arn}")
+
+        # This calling style avoids a ParamValidationError from botocore.
+        # Passing None is not allowed for the optional parameters.
+        assume_role_args = {
+            k: v
+            for k, v in [
+                ("RoleArn", role_arn),
+                ("RoleSessionName", self.session_information["RoleSessionName"]),
+                ("Policy", self.session_information["Policy"]),
+                ("PolicyArns", self.session_information["PolicyArns"]),
+                ("ExternalId", self.session_information["ExternalId"]),
+            ]
+            if v is not None
+        }
+        if self.rate_limiter is None:
+            return self.sts_client.assume_role(**assume_role_args)["Credentials"]  # type: ignore[arg-type] # noqa E501
+        return self.rate_limiter.call(
+            lambda: self.sts_client.assume_role(**assume_role_args)  # type: ignore[arg-type] # noqa E501
+        )["Credentials"]
+
     def initialize_boto_session(self, *args: Any, **kwargs: Any) -> None:
         # Inherit from and initialize standard boto3 Session object
         super().__init__(*args, **kwargs)
 
+    def initialize_pooled_boto_session(
+        self,
+        session_pool: CoveSessionPool,
+        aws_access_key_id: str,
+        aws_secret_access_key: str,
+        aws_session_token: str,
+        region_name: Optional[str] = None,
+    ) -> None:
+        # Adopt the state of this thread's recycled session instead of building
+        # a new botocore session through boto3's Session.__init__. The task gets
+        # its own copy of the session's original event handlers.
+        pooled_session, default_region, events = session_pool.get_session()
+        self._session = pooled_session._session
+        self._session._events = events  # type: ignore[attr-defined]
+        self._session.register_component("event_emitter", events)
+        self._loader = pooled_session._loader
+        self.resource_factory = ResourceFactory(events)
+
+        self._session.set_credentials(
+            aws_access_key_id, aws_secret_access_key, aws_session_token
+        )
+        self._session.set_config_variable("region", region_name or default_region)
+
     def format_cove_result(self, result: Any) -> CoveSessionInformation:
         self.session_information["Result"] = result
         return self.session_information
 
-    def format_cove_error(self, err: Exception) -> CoveSessionInformation:
-        self.session_information["ExceptionDetails"] = err
+    def format_cove_error(
+        self, err: Exception, serialize: bool = False
+    ) -> CoveSessionInformation:
+        self.session_information["ExceptionDetails"] = (
+            serialize_exception(err) if serialize else err
+        )
         return self.session_information
+
+
+def serialize_exception(err: Exception) -> CoveExceptionRecord:
+    """Describes err without referencing it, so that its traceback's frames and
+    everything they hold can be garbage collected."""
+    error_code = None
+    request_id = None
+    if isinstance(err, ClientError):
+        error_code = err.response.get("Error", {}).get("Code")
+        request_id = err.response.get("ResponseMetadata", {}).get("RequestId")
+    return CoveExceptionRecord(
+        Type=type(err).__name__,
+        Message=str(err),
+        ErrorCode=error_code,
+        RequestId=request_id,
+        Traceback="".join(
+            traceback.format_exception(type(err), err, err.__traceback__)
+        ),
+    )
@@ -0,0 +1,212 @@
+import json
+import logging
+import os
+import sqlite3
+from abc import ABC, abstractmethod
+from typing import IO, Any, Counter, Dict, List, Optional, Union
+
+from botocove.cove_session import serialize_exception
+from botocove.cove_types import CoveSinkSummary
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 100
+
+# The columns of tabular sinks: the record's identity and outcome, and the whole
+# record as JSON
+SINK_COLUMNS = ("Id", "Region", "Name", "Outcome", "Record")
+
+
+class CoveSink(ABC):
+    """Writes each record of a run to disk as it completes, instead of keeping it
+    in the output.
+
+    Records are buffered and written batch_size at a time. Each run opens the
+    sink, which replaces anything it wrote before, and closes it when the run
+    ends, even if the run stops early. Subclass it and implement _open,
+    _write_batch and _close to write another format.
+    """
+
+    def __init__(
+        self, path: Union[str, "os.PathLike[str]"], batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be a positive int. Got {batch_size!r}.")
+        self.path = os.fspath(path)
+        self.batch_size = batch_size
+        self._batch: List[Dict[str, Any]] = []
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(path={self.path!r})"
+
+    def open(self) -> None:
+        self._batch = []
+        self._open()
+
+    def write(self, record: Dict[str, Any]) -> None:
+        self._batch.append(record)
+        if len(self._batch) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._batch:
+            self._write_batch(self._batch)
+            self._batch = []
+
+    def close(self) -> None:
+        try:
+            self.flush()
+        finally:
+            self._close()
+        logger.info(f"Wrote cove records to {self.path}")
+
+    @abstractmethod
+    def _open(self) -> None: ...
+
+    @abstractmethod
+    def _write_batch(self, records: List[Dict[str, Any]]) -> None: ...
+
+    @abstractmethod
+    def _close(self) -> None: ...
+
+
+class CoveJsonLinesSink(CoveSink):
+    """Writes one JSON object per line. Values that JSON can't represent are
+    written as strings, and exceptions as CoveExceptionRecords."""
+
+    _file: Optional[IO[str]] = None
+
+    def _open(self) -> None:
+        self._file = open(self.path, "w")
+
+    def _write_batch(self, records: List[Dict[str, Any]]) -> None:
+        if self._file is None:
+            raise RuntimeError(f"{self!r} is not open")
+        self._file.write("".join(f"{_to_json(record)}\n" for record in records))
+
+    def _close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class CoveSqliteSink(CoveSink):
+    """Writes one row per record to a table of a SQLite database, with the
+    record as JSON in the Record column. Each batch is one transaction."""
+
+    _conn: Optional[sqlite3.Connection] = None
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        table: str = "cove_records",
+    ) -> None:
+        super().__init__(path, batch_size)
+        if not table.isidentifier():
+            raise ValueError(f"table must be an identifier. Got {table!r}.")
+        self.table = table
+
+    def _open(self) -> None:
+        self._conn = sqlite3.connect(self.path)
+        with self._conn:
+            self._conn.execute(f"DROP TABLE IF EXISTS {self.table}")  # noqa: S608
+            self._conn.execute(
+                f"CREATE TABLE {self.table} ("  # noqa: S608
+                "Id TEXT NOT NULL, Region TEXT, Name TEXT, "
+                "Outcome TEXT NOT NULL, Record TEXT NOT NULL)"
+            )
+
+    def _write_batch(self, records: List[Dict[str, Any]]) -> None:
+        if self._conn is None:
+            raise RuntimeError(f"{self!r} is not open")
+        with self._conn:
+            self._conn.executemany(
+                f"INSERT INTO {self.table} VALUES (?, ?, ?, ?, ?)",  # noqa: S608
+                [_to_row(record) for record in records],
+            )
+
+    def _close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+class CoveParquetSink(CoveSink):
+    """Writes one row per record to a Parquet file, with the record as JSON in
+    the Record column. Each batch is one row group. Requires pyarrow, which
+    botocove does not install."""
+
+    _pyarrow: Any = None
+    _schema: Any = None
+    _writer: Any = None
+
+    def _open(self) -> None:
+        try:
+            import pyarrow.parquet
+        except ImportError as e:
+            raise ImportError(
+                "CoveParquetSink requires pyarrow: pip install pyarrow"
+            ) from e
+        self._pyarrow = pyarrow
+        self._schema = pyarrow.schema(
+            [
+                ("Id", pyarrow.string()),
+                ("Region", pyarrow.string()),
+                ("Name", pyarrow.string()),
+                ("Outcome", pyarrow.string()),
+                ("Record", pyarrow.string()),
+            ]
+        )
+        self._writer = pyarrow.parquet.ParquetWriter(self.path, self._schema)
+
+    def _write_batch(self, records: List[Dict[str, Any]]) -> None:
+        if self._writer is None:
+            raise RuntimeError(f"{self!r} is not open")
+        rows = [_to_row(record) for record in records]
+        columns = {
+            column: [row[i] for row in rows] for i, column in enumerate(SINK_COLUMNS)
+        }
+        self._writer.write_table(self._pyarrow.table(columns, schema=self._schema))
+
+    def _close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+def get_outcome(record: Dict[str, Any]) -> str:
+    if "ExceptionDetails" not in record:
+        return "Result"
+    if record.get("AssumeRoleSuccess"):
+        return "Exception"
+    return "FailedAssumeRole"
+
+
+def summarize_sink(sink: CoveSink, counts: Counter[str]) -> CoveSinkSummary:
+    """Summarizes a run's sink from the number of records written to it under
+    each of the output's keys."""
+    return CoveSinkSummary(
+        Location=sink.path,
+        Records=sum(counts.values()),
+        Results=counts["Results"],
+        Exceptions=counts["Exceptions"],
+        FailedAssumeRole=counts["FailedAssumeRole"],
+    )
+
+
+def _to_row(record: Dict[str, Any]) -> List[Optional[str]]:
+    return [
+        record["Id"],
+        record.get("Region"),
+        record.get("Name"),
+        get_outcome(record),
+        _to_json(record),
+    ]
+
+
+def _to_json(record: Dict[str, Any]) -> str:
+    details = record.get("ExceptionDetails")
+    if isinstance(details, Exception):
+        record = dict(record, ExceptionDetails=serialize_exception(details))
+    return json.dumps(record, default=str)
@@ -0,0 +1,144 @@
+import logging
+import mmap
+import pickle  # noqa: S403
+import tempfile
+import threading
+from array import array
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Union,
+    overload,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class CoveSpillStore(object):
+    """An append-only temporary file of pickled records.
+
+    Records are read back through a memory map of the file, so reading a record
+    costs one unpickle and no file I/O beyond the pages it touches. The file is
+    deleted when the store is closed or garbage collected.
+    """
+
+    def __init__(self, directory: Optional[str] = None) -> None:
+        self._file = tempfile.TemporaryFile(prefix="botocove-", dir=directory)
+        self._size = 0
+        self._map: Optional[mmap.mmap] = None
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(size={self._size})"
+
+    def append(self, record: Dict[str, Any]) -> int:
+        """Writes the record and returns its offset in the store."""
+        data = pickle.dumps(record, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            offset = self._size
+            self._file.write(data)
+            self._size += len(data)
+        return offset
+
+    def load(self, offset: int) -> Dict[str, Any]:
+        with self._lock:
+            records = self._mapped()
+            records.seek(offset)
+            record: Dict[str, Any] = pickle.load(records)  # noqa: S301
+        return record
+
+    def close(self) -> None:
+        with self._lock:
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+            self._file.close()
+
+    def _mapped(self) -> mmap.mmap:
+        # Remap when records have been written since the last read
+        if self._map is None or len(self._map) < self._size:
+            self._file.flush()
+            if self._map is not None:
+                self._map.close()
+            self._map = mmap.mmap(
+                self._file.fileno(), self._size, access=mmap.ACCESS_READ
+            )
+        return self._map
+
+
+class CoveSpilledRecords(Sequence[Dict[str, Any]]):
+    """A list of records that moves to a CoveSpillStore once it holds more than
+    threshold records.
+
+    Until then records are kept in memory. Afterwards the sequence keeps only an
+    8-byte offset per record and loads a record from the store each time it is
+    read, so indexing, slicing, iteration and comparison with lists behave as
+    they would for a list while memory stays flat. Records must be picklable,
+    and a record that doesn't load back from its pickle raises when it is read.
+    """
+
+    def __init__(self, store: CoveSpillStore, threshold: int) -> None:
+        self.store = store
+        self.threshold = threshold
+        self._records: Optional[List[Dict[str, Any]]] = []
+        self._offsets = array("q")
+
+    def __repr__(self) -> str:
+        if self._records is not None:
+            return repr(self._records)
+        return f"{self.__class__.__name__}(len={len(self)}, store={self.store!r})"
+
+    @property
+    def spilled(self) -> bool:
+        return self._records is None
+
+    def append(self, record: Dict[str, Any]) -> None:
+        if self._records is not None:
+            self._records.append(record)
+            if len(self._records) > self.threshold:
+                self._spill()
+            return
+        self._offsets.append(self.store.append(record))
+
+    def __len__(self) -> int:
+        if self._records is not None:
+            return len(self._records)
+        return len(self._offsets)
+
+    @overload
+    def __getitem__(self, index: int) -> Dict[str, Any]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Dict[str, Any]]: ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        if self._records is not None:
+            return self._records[index]
+        if isinstance(index, slice):
+            return [self.store.load(offset) for offset in self._offsets[index]]
+        return self.store.load(self._offsets[index])
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        if self._records is not None:
+            return iter(self._records)
+        return (self.store.load(offset) for offset in self._offsets)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, (str, bytes)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    # Mutable and compared by value, like a list
+    __hash__ = None  # type: ignore
+
+    def _spill(self) -> None:
+        records, self._records = self._records or [], None
+        logger.info(f"Moving {len(records)} records to a temporary file to save memory")
+        for record in records:
+            self._offsets.append(self.store.append(record))
@@ -0,0 +1,70 @@
+from typing import List, NamedTuple, Optional
+
+from mypy_boto3_organizations.type_defs import AccountTypeDef
+from mypy_boto3_sts.type_defs import PolicyDescriptorTypeTypeDef
+
+from botocove.cove_types import CoveSessionInformation, CoveTaskTimings
+
+
+class CoveRunConfig(NamedTuple):
+    """The session settings that every task of a run shares."""
+
+    RoleName: str
+    RoleSessionName: Optional[str]
+    Policy: Optional[str]
+    PolicyArns: Optional[List[PolicyDescriptorTypeTypeDef]]
+    ExternalId: Optional[str]
+    Partition: Optional[str]
+
+
+class CoveTask(object):
+    """A task waiting to run: the account and region plus a reference to the
+    account's organization data.
+
+    Tasks hold nothing that is the same for the whole run, so queued tasks stay
+    small and a process pool pickles the policy once per worker instead of once
+    per task. The worker builds the task's CoveSessionInformation when it starts
+    the task.
+    """
+
+    __slots__ = ("account_id", "region", "account", "timings")
+
+    def __init__(
+        self,
+        account_id: str,
+        region: Optional[str],
+        account: Optional[AccountTypeDef] = None,
+    ) -> None:
+        self.account_id = account_id
+        self.region = region
+        self.account = account
+        self.timings: Optional[CoveTaskTimings] = None
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}"
+            f"(account_id={self.account_id!r}, region={self.region!r})"
+        )
+
+    def session_information(self, config: CoveRunConfig) -> CoveSessionInformation:
+        account = self.account
+        session_information = CoveSessionInformation(
+            Id=self.account_id,
+            RoleName=config.RoleName,
+            RoleSessionName=config.RoleSessionName,
+            Policy=config.Policy,
+            PolicyArns=config.PolicyArns,
+            ExternalId=config.ExternalId,
+            AssumeRoleSuccess=False,
+            Region=self.region,
+            Partition=config.Partition,
+            ExceptionDetails=None,
+            Name=None if account is None else account["Name"],
+            Arn=None if account is None else account["Arn"],
+            Email=None if account is None else account["Email"],
+            Status=None if account is None else account["Status"],
+            Result=None,
+        )
+        if self.timings is not None:
+            session_information["Timings"] = self.timings
+        return session_information
@@ -0,0 +1,124 @@
+import functools
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from botocore.hooks import BaseEventHooks
+
+from botocove.cove_rate_limiter import THROTTLING_ERROR_CODES
+from botocove.cove_types import CoveApiCallStats
+
+logger = logging.getLogger(__name__)
+
+# Service, operation, region and account of an API call
+CoveApiCallKey = Tuple[str, str, Optional[str], str]
+
+
+class _CoveApiCallCounters(object):
+    __slots__ = ("calls", "retries", "throttles", "retry_sleep")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.retries = 0
+        self.throttles = 0
+        self.retry_sleep = 0.0
+
+
+class CoveApiTelemetry(object):
+    """Counts the botocore API calls that wrapped functions make through their
+    CoveSessions.
+
+    Handlers registered on each session's events count calls, retried
+    attempts, throttling errors and the time between a failed attempt and its
+    retry, which is mostly botocore's retry sleep. Each thread tracks the call
+    it is making, so counts are attributed to the service, operation, client
+    region and account of the call that retried.
+    """
+
+    def __init__(self) -> None:
+        self._counters: Dict[CoveApiCallKey, _CoveApiCallCounters] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def register(self, events: BaseEventHooks, account_id: str, unique_id: str) -> None:
+        events.register(
+            "before-call",
+            functools.partial(self._before_call, account_id),
+            unique_id=f"{unique_id}-before-call",
+        )
+        events.register(
+            "before-send", self._before_send, unique_id=f"{unique_id}-before-send"
+        )
+        events.register(
+            "needs-retry", self._needs_retry, unique_id=f"{unique_id}-needs-retry"
+        )
+
+    def unregister(self, events: BaseEventHooks, unique_id: str) -> None:
+        events.unregister("before-call", unique_id=f"{unique_id}-before-call")
+        events.unregister("before-send", unique_id=f"{unique_id}-before-send")
+        events.unregister("needs-retry", unique_id=f"{unique_id}-needs-retry")
+
+    def summary(self) -> List[CoveApiCallStats]:
+        with self._lock:
+            counters = sorted(self._counters.items(), key=lambda kv: -kv[1].calls)
+        return [
+            CoveApiCallStats(
+                Service=service,
+                Operation=operation,
+                Region=region,
+                Account=account_id,
+                Calls=c.calls,
+                Retries=c.retries,
+                Throttles=c.throttles,
+                RetrySleep=c.retry_sleep,
+            )
+            for (service, operation, region, account_id), c in counters
+        ]
+
+    def _get_counters(self, key: CoveApiCallKey) -> _CoveApiCallCounters:
+        counters = self._counters.get(key)
+        if counters is None:
+            counters = self._counters.setdefault(key, _CoveApiCallCounters())
+        return counters
+
+    def _before_call(
+        self,
+        account_id: str,
+        event_name: str,
+        context: Dict[str, Any],
+        **kwargs: Any,
+    ) -> None:
+        _, service, operation = event_name.split(".", 2)
+        key = (service, operation, context.get("client_region"), account_id)
+        self._local.key = key
+        self._local.attempt_ended_at = None
+        with self._lock:
+            self._get_counters(key).calls += 1
+
+    def _before_send(self, **kwargs: Any) -> None:
+        attempt_ended_at: Optional[float] = getattr(
+            self._local, "attempt_ended_at", None
+        )
+        if attempt_ended_at is None:
+            return
+        self._local.attempt_ended_at = None
+        with self._lock:
+            counters = self._get_counters(self._local.key)
+            counters.retries += 1
+            counters.retry_sleep += time.monotonic() - attempt_ended_at
+
+    def _needs_retry(
+        self, response: Optional[Tuple[Any, Dict[str, Any]]] = None, **kwargs: Any
+    ) -> None:
+        key: Optional[CoveApiCallKey] = getattr(self._local, "key", None)
+        if key is None:
+            return
+        # If botocore retries, the next before-send on this thread is the retry
+        self._local.attempt_ended_at = time.monotonic()
+        if (
+            response is not None
+            and response[1].get("Error", {}).get("Code") in THROTTLING_ERROR_CODES
+        ):
+            with self._lock:
+                self._get_counters(key).throttles += 1
@@ -0,0 +1,142 @@
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from typing import Any, DefaultDict, Dict, Generator, Iterable, List, Mapping, Optional
+
+from botocove.cove_task import CoveTask
+from botocove.cove_types import (
+    CovePercentiles,
+    CoveSessionInformation,
+    CoveTaskTimings,
+    CoveTimingsSummary,
+)
+
+logger = logging.getLogger(__name__)
+
+TIMING_PHASES = ("QueueWait", "AssumeRole", "Function", "Total")
+SLOWEST_ACCOUNTS = 10
+
+
+class CoveTaskTimer(object):
+    """Records the phases of one task into its session information's Timings.
+
+    Start is stamped when the runner submits the task. The timer measures queue
+    wait from then until a worker starts the task, then assume role and function
+    time, all in seconds on the monotonic clock. It also records the process and
+    thread that ran the task.
+    """
+
+    __slots__ = ("timings", "started", "assumed_role_at")
+
+    def __init__(self, timings: CoveTaskTimings) -> None:
+        self.timings = timings
+        self.started = time.monotonic()
+        self.assumed_role_at: Optional[float] = None
+        timings["QueueWait"] = self.started - timings["Start"]
+        timings["Pid"] = os.getpid()
+        timings["Tid"] = threading.get_native_id()
+
+    @classmethod
+    def start(
+        cls, account_session_info: CoveSessionInformation
+    ) -> Optional["CoveTaskTimer"]:
+        timings = account_session_info.get("Timings")
+        return None if timings is None else cls(timings)
+
+    def assumed_role(self) -> None:
+        self.assumed_role_at = time.monotonic()
+
+    def finish(self) -> None:
+        now = time.monotonic()
+        if self.assumed_role_at is None:
+            self.timings["AssumeRole"] = now - self.started
+            self.timings["Function"] = 0.0
+        else:
+            self.timings["AssumeRole"] = self.assumed_role_at - self.started
+            self.timings["Function"] = now - self.assumed_role_at
+        self.timings["Total"] = now - self.timings["Start"]
+
+
+def stamp_submission(
+    tasks: Generator[CoveTask, None, None],
+) -> Generator[CoveTask, None, None]:
+    """Starts each task's timings as the runner takes it for submission."""
+    try:
+        for task in tasks:
+            task.timings = CoveTaskTimings(Start=time.monotonic())
+            yield task
+    finally:
+        tasks.close()
+
+
+def summarize_timings(
+    records: Iterable[Mapping[str, Any]],
+) -> CoveTimingsSummary:
+    """Summarizes the timed records of a run with p50, p95 and p99 of each phase,
+    overall and per region, and the accounts with the longest total time."""
+    phases: Dict[str, List[float]] = {phase: [] for phase in TIMING_PHASES}
+    region_phases: DefaultDict[str, Dict[str, List[float]]] = defaultdict(
+        lambda: {phase: [] for phase in TIMING_PHASES}
+    )
+    totals: List[Mapping[str, Any]] = []
+
+    for record in records:
+        timings = record.get("Timings")
+        if timings is None or "Total" not in timings:
+            continue
+        region = record.get("Region") or "default"
+        for phase, value in _phase_values(timings).items():
+            phases[phase].append(value)
+            region_phases[region][phase].append(value)
+        totals.append(record)
+
+    slowest = sorted(totals, key=_total_time, reverse=True)[:SLOWEST_ACCOUNTS]
+    return CoveTimingsSummary(
+        Phases=_percentiles_by_phase(phases),
+        Regions={
+            region: _percentiles_by_phase(values)
+            for region, values in region_phases.items()
+        },
+        SlowestAccounts=[
+            {
+                "Id": r["Id"],
+                "Region": r.get("Region"),
+                "Name": r.get("Name"),
+                "Total": _total_time(r),
+            }
+            for r in slowest
+        ],
+    )
+
+
+def _phase_values(timings: CoveTaskTimings) -> Dict[str, float]:
+    return {
+        "QueueWait": timings["QueueWait"],
+        "AssumeRole": timings["AssumeRole"],
+        "Function": timings["Function"],
+        "Total": timings["Total"],
+    }
+
+
+def _total_time(record: Mapping[str, Any]) -> float:
+    total: float = record["Timings"]["Total"]
+    return total
+
+
+def _percentiles_by_phase(phases: Dict[str, List[float]]) -> Dict[str, CovePercentiles]:
+    return {
+        phase: _percentiles(sorted(values))
+        for phase, values in phases.items()
+        if values
+    }
+
+
+def _percentiles(values: List[float]) -> CovePercentiles:
+    # Nearest-rank percentiles: always an observed value, so a p99 of few tasks
+    # is the slowest task rather than an interpolation
+    def rank(p: int) -> float:
+        return values[max(0, -(-p * len(values) // 100) - 1)]
+
+    return CovePercentiles(p50=rank(50), p95=rank(95), p99=rank(99))
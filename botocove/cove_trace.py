@@ -0,0 +1,111 @@
+import json
+import logging
+import os
+import time
+from typing import Any, Dict, Generator, Iterator, Set, Tuple, Union
+
+from botocove.cove_types import CoveSessionInformation
+
+logger = logging.getLogger(__name__)
+
+
+class CoveTraceWriter(object):
+    """Writes the phases of each task as a Chrome trace event file that can be
+    opened in Perfetto (https://ui.perfetto.dev) or chrome://tracing.
+
+    Each worker thread gets a track with a span per task containing its assume
+    role and function spans. Queue waits overlap, so they are written as async
+    spans on their own track. Events are written as tasks complete, so the
+    writer holds no more than one task in memory.
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        self.path = os.fspath(path)
+        # Trace timestamps are microseconds since the writer was created, which
+        # is before the first task is submitted
+        self.origin = time.monotonic()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(path={self.path!r})"
+
+    def record(
+        self, results: Generator[CoveSessionInformation, None, None]
+    ) -> Generator[CoveSessionInformation, None, None]:
+        """Yields results unchanged, writing each timed result's events."""
+        named_tracks: Set[Tuple[int, int]] = set()
+        with open(self.path, "w") as f:
+            f.write("[\n")
+            first = True
+            try:
+                for task_id, result in enumerate(results):
+                    for event in self._task_events(task_id, result, named_tracks):
+                        if not first:
+                            f.write(",\n")
+                        json.dump(event, f, default=str)
+                        first = False
+                    yield result
+            finally:
+                results.close()
+                f.write("\n]\n")
+                logger.info(f"Wrote trace of cove run to {self.path}")
+
+    def _task_events(
+        self,
+        task_id: int,
+        result: CoveSessionInformation,
+        named_tracks: Set[Tuple[int, int]],
+    ) -> Iterator[Dict[str, Any]]:
+        timings = result.get("Timings")
+        if timings is None or "Total" not in timings:
+            return
+
+        pid, tid = timings["Pid"], timings["Tid"]
+        if (pid, tid) not in named_tracks:
+            named_tracks.add((pid, tid))
+            yield {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": tid,
+                "args": {"name": f"Worker {tid}"},
+            }
+
+        submitted = self._microseconds(timings["Start"])
+        started = submitted + timings["QueueWait"] * 1e6
+        assumed_role = started + timings["AssumeRole"] * 1e6
+        args = {
+            "Id": result["Id"],
+            "Name": result["Name"],
+            "Region": result["Region"],
+            "Failed": result["ExceptionDetails"] is not None,
+        }
+
+        for phase, ts in (("b", submitted), ("e", started)):
+            yield {
+                "name": "QueueWait",
+                "cat": "queue",
+                "ph": phase,
+                "id": task_id,
+                "ts": ts,
+                "pid": pid,
+                "tid": tid,
+                "args": args,
+            }
+        for name, ts, duration in (
+            (result["Id"], started, timings["AssumeRole"] + timings["Function"]),
+            ("AssumeRole", started, timings["AssumeRole"]),
+            ("Function", assumed_role, timings["Function"]),
+        ):
+            yield {
+                "name": name,
+                "cat": "task",
+                "ph": "X",
+                "ts": ts,
+                "dur": duration * 1e6,
+                "pid": pid,
+                "tid": tid,
+                "args": args,
+            }
+
+    def _microseconds(self, timestamp: float) -> float:
+        return (timestamp - self.origin) * 1e6
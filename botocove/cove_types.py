@@ -1,10 +1,30 @@
-from typing import Any, Dict, List, Optional, TypedDict
+from typing import Any, Dict, List, Optional, TypedDict, Union
 
 from mypy_boto3_organizations.literals import AccountStatusType
 from mypy_boto3_sts.type_defs import PolicyDescriptorTypeTypeDef
 
+from botocove.cove_spill import CoveSpilledRecords
 
-class CoveSessionInformation(TypedDict):
+
+class CoveExceptionRecord(TypedDict):
+    Type: str
+    Message: str
+    ErrorCode: Optional[str]
+    RequestId: Optional[str]
+    Traceback: str
+
+
+class CoveTaskTimings(TypedDict, total=False):
+    Start: float
+    QueueWait: float
+    AssumeRole: float
+    Function: float
+    Total: float
+    Pid: int
+    Tid: int
+
+
+class _CoveSessionInformation(TypedDict):
     Id: str
     RoleName: str
     AssumeRoleSuccess: bool
@@ -17,17 +37,75 @@ class CoveSessionInformation(TypedDict):
     PolicyArns: Optional[List[PolicyDescriptorTypeTypeDef]]
     ExternalId: Optional[str]
     Result: Any
-    ExceptionDetails: Optional[Exception]
+    ExceptionDetails: Optional[Union[Exception, CoveExceptionRecord]]
     Region: Optional[str]
     Partition: Optional[str]
 
 
+class CoveSessionInformation(_CoveSessionInformation, total=False):
+    Timings: CoveTaskTimings
+
+
+class CovePercentiles(TypedDict):
+    p50: float
+    p95: float
+    p99: float
+
+
+class CoveTimingsSummary(TypedDict):
+    Phases: Dict[str, CovePercentiles]
+    Regions: Dict[str, Dict[str, CovePercentiles]]
+    SlowestAccounts: List[Dict[str, Any]]
+
+
+class CoveApiCallStats(TypedDict):
+    Service: str
+    Operation: str
+    Region: Optional[str]
+    Account: str
+    Calls: int
+    Retries: int
+    Throttles: int
+    RetrySleep: float
+
+
+class CoveSinkSummary(TypedDict):
+    Location: str
+    Records: int
+    Results: int
+    Exceptions: int
+    FailedAssumeRole: int
+
+
 class CoveFunctionOutput(TypedDict):
     Results: List[CoveSessionInformation]
     Exceptions: List[CoveSessionInformation]
 
 
-class CoveOutput(TypedDict):
+class _CoveOutput(TypedDict):
     Results: List[Dict[str, Any]]
     Exceptions: List[Dict[str, Any]]
     FailedAssumeRole: List[Dict[str, Any]]
+
+
+class CoveOutput(_CoveOutput, total=False):
+    Timings: CoveTimingsSummary
+    ApiCalls: List[CoveApiCallStats]
+    Aggregate: Any
+    Sink: CoveSinkSummary
+
+
+class _CoveSpilledOutput(TypedDict):
+    Results: CoveSpilledRecords
+    Exceptions: CoveSpilledRecords
+    FailedAssumeRole: CoveSpilledRecords
+
+
+class CoveSpilledOutput(_CoveSpilledOutput, total=False):
+    """The output of a run with spill_threshold. Its record lists are sequences
+    that may keep their records in a temporary file, not lists."""
+
+    Timings: CoveTimingsSummary
+    ApiCalls: List[CoveApiCallStats]
+    Aggregate: Any
+    Sink: CoveSinkSummary
@@ -0,0 +1,177 @@
+from typing import Any, List, Optional, get_args
+
+from botocove.cove_reducer import CoveReducer, CoveReducerType
+from botocove.cove_runner import CoveExecutorType, CoveThreadWorkers
+from botocove.cove_sink import CoveSink
+
+
+def typecheck_regions(list_of_regions: Optional[List[str]]) -> None:
+    if list_of_regions is None:
+        return
+    if isinstance(list_of_regions, str):
+        raise TypeError(
+            f"regions must be a list of str. Got str {repr(list_of_regions)}."
+        )
+    if len(list_of_regions) == 0:
+        raise ValueError(
+            f"regions must have at least 1 element. Got {repr(list_of_regions)}."
+        )
+
+
+def typecheck_thread_workers(
+    thread_workers: CoveThreadWorkers, allow_auto: bool = True
+) -> None:
+    if thread_workers == "auto" and allow_auto:
+        return
+    if _is_positive_int(thread_workers):
+        return
+    if not allow_auto:
+        raise ValueError(
+            f"thread_workers must be a positive int. Got {thread_workers!r}."
+        )
+    raise ValueError(
+        f'thread_workers must be a positive int or "auto". Got {thread_workers!r}.'
+    )
+
+
+def typecheck_ou_thread_workers(ou_thread_workers: int) -> None:
+    if _is_positive_int(ou_thread_workers):
+        return
+    raise ValueError(
+        f"ou_thread_workers must be a positive int. Got {ou_thread_workers!r}."
+    )
+
+
+def typecheck_concurrency(concurrency: int) -> None:
+    if _is_positive_int(concurrency):
+        return
+    raise ValueError(f"concurrency must be a positive int. Got {concurrency!r}.")
+
+
+def typecheck_executor(executor: CoveExecutorType) -> None:
+    if executor not in get_args(CoveExecutorType):
+        raise ValueError(f'executor must be "thread" or "process". Got {executor!r}.')
+
+
+def typecheck_region_concurrency(region_concurrency: Optional[int]) -> None:
+    if region_concurrency is None:
+        return
+    if isinstance(region_concurrency, int) and region_concurrency >= 1:
+        return
+    raise ValueError(
+        f"region_concurrency must be a positive int. Got {region_concurrency!r}."
+    )
+
+
+def typecheck_prefetch_credentials(
+    prefetch_credentials: int, executor: CoveExecutorType
+) -> None:
+    if not isinstance(prefetch_credentials, int) or prefetch_credentials < 0:
+        raise ValueError(
+            "prefetch_credentials must be a non-negative int. "
+            f"Got {prefetch_credentials!r}."
+        )
+    if prefetch_credentials and executor == "process":
+        raise ValueError(
+            'prefetch_credentials is not supported with executor="process": '
+            "worker processes do not share the credential cache."
+        )
+
+
+def typecheck_api_telemetry(
+    api_telemetry: bool, executor: CoveExecutorType, stream: bool
+) -> None:
+    if not api_telemetry:
+        return
+    if executor == "process":
+        raise ValueError(
+            'api_telemetry is not supported with executor="process": '
+            "worker processes do not share the telemetry counters."
+        )
+    if stream:
+        raise ValueError("api_telemetry is not supported with stream=True.")
+
+
+def typecheck_reducer(
+    reducer: Optional[CoveReducerType], initial: Any, stream: bool
+) -> None:
+    if reducer is None:
+        if initial is not None:
+            raise ValueError("initial is only used with a reducer.")
+        return
+    if stream:
+        raise ValueError("reducer is not supported with stream=True.")
+    if not callable(reducer) and not isinstance(reducer, CoveReducer):
+        raise TypeError(
+            f"reducer must be a function or a CoveReducer. Got {reducer!r}."
+        )
+    if isinstance(reducer, CoveReducer) and initial is not None:
+        raise ValueError("initial is not used with a CoveReducer: override initial.")
+
+
+def typecheck_sink(sink: Optional[CoveSink], stream: bool) -> None:
+    if sink is None:
+        return
+    if not isinstance(sink, CoveSink):
+        raise TypeError(f"sink must be a CoveSink. Got {sink!r}.")
+    if stream:
+        raise ValueError("sink is not supported with stream=True.")
+
+
+def typecheck_spill_threshold(spill_threshold: Optional[int], stream: bool) -> None:
+    if spill_threshold is None:
+        return
+    if not isinstance(spill_threshold, int) or spill_threshold < 0:
+        raise ValueError(
+            f"spill_threshold must be a non-negative int. Got {spill_threshold!r}."
+        )
+    if stream:
+        raise ValueError("spill_threshold is not supported with stream=True.")
+
+
+def typecheck_external_id(external_id: Optional[str]) -> None:
+    if external_id is None:
+        return
+    if isinstance(external_id, str):
+        return
+    raise TypeError(f"external_id must be a string not {type(external_id)}")
+
+
+def typecheck_target_ids(list_of_ids: Optional[List[str]]) -> None:
+    if list_of_ids is None:
+        return
+    if isinstance(list_of_ids, str):
+        raise TypeError(
+            f"target_ids must be a list of str. Got str {repr(list_of_ids)}."
+        )
+    if len(list_of_ids) == 0:
+        raise ValueError(
+            f"target_ids must have at least 1 element. Got {repr(list_of_ids)}."
+        )
+    for _id in list_of_ids:
+        typecheck_id(_id)
+
+
+def typecheck_ignore_ids(list_of_ids: Optional[List[str]]) -> None:
+    if list_of_ids is None:
+        return
+    if isinstance(list_of_ids, str):
+        raise TypeError(
+            f"ignore_ids must be a list of str. Got str {repr(list_of_ids)}."
+        )
+    for _id in list_of_ids:
+        typecheck_id(_id)
+
+
+def typecheck_id(_id: str) -> None:
+    if isinstance(_id, str):
+        return
+    raise TypeError(
+        f"{_id} is an incorrect type: all account and ou id's must be strings "
+        f"not {type(_id)}"
+    )
+
+
+def _is_positive_int(value: Any) -> bool:
+    # bool is a subclass of int, but True is not a number of workers
+    return isinstance(value, int) and not isinstance(value, bool) and value >= 1
@@ -1,3 +1,7 @@
+from typing import List
+
+from boto3 import Session
+
 from botocove.cove_host_account import CoveHostAccount
 from tests.moto_mock_org.moto_models import LargeOrg, SmallOrg
 
@@ -178,3 +182,58 @@ def test_target_just_targets(mock_small_org: SmallOrg) -> None:
     account_ids = [acc_id["Id"] for acc_id in sessions]
 
     assert set(account_ids) == set(mock_small_org.all_accounts[0:2])
+
+
+def test_target_nested_ou_finds_accounts_at_every_level(
+    mock_small_org: SmallOrg,
+) -> None:
+
+    host_account = CoveHostAccount(
+        target_ids=[mock_small_org.new_org1, mock_small_org.new_org4],
+        ignore_ids=None,
+        rolename=None,
+        role_session_name=None,
+        policy=None,
+        policy_arns=None,
+        external_id=None,
+        assuming_session=None,
+        regions=None,
+        partition=None,
+        thread_workers=20,
+        ou_thread_workers=2,
+    )
+    sessions = host_account.get_cove_sessions()
+    account_ids = [acc_id["Id"] for acc_id in sessions]
+
+    assert set(account_ids) == set(mock_small_org.all_accounts)
+
+
+def test_ignore_nested_ou_lists_each_ou_once(
+    mock_session: Session, mock_small_org: SmallOrg
+) -> None:
+
+    listed_ous: List[str] = []
+    mock_session.events.register(
+        "before-parameter-build.organizations.ListChildren",
+        lambda params, **kwargs: listed_ous.append(params["ParentId"]),
+    )
+
+    host_account = CoveHostAccount(
+        target_ids=None,
+        ignore_ids=[mock_small_org.new_org1],
+        rolename=None,
+        role_session_name=None,
+        policy=None,
+        policy_arns=None,
+        external_id=None,
+        assuming_session=mock_session,
+        regions=None,
+        partition=None,
+        thread_workers=20,
+    )
+
+    assert host_account.target_accounts == set(mock_small_org.account_group_two)
+    # Each OU is listed once for child OUs and once for child accounts
+    assert sorted(listed_ous) == sorted(
+        2 * [mock_small_org.new_org1, mock_small_org.new_org2, mock_small_org.new_org3]
+    )
@@ -0,0 +1,105 @@
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+from boto3 import Session
+
+from botocove import CoveOutput, CoveSession, acove
+from tests.moto_mock_org.moto_models import SmallOrg
+
+
+def test_when_async_function_is_decorated_then_output_has_result_per_account(
+    mock_small_org: SmallOrg,
+) -> None:
+    @acove(regions=["eu-west-1", "us-east-1"])
+    async def get_account_id(session: CoveSession) -> str:
+        await asyncio.sleep(0)
+        return session.session_information["Id"]
+
+    output: CoveOutput = asyncio.run(get_account_id())
+
+    assert output["Exceptions"] == []
+    assert output["FailedAssumeRole"] == []
+    assert len(output["Results"]) == 2 * len(mock_small_org.all_accounts)
+    assert all(r["Result"] == r["Id"] for r in output["Results"])
+
+
+def test_when_async_function_raises_then_exception_is_captured(
+    mock_small_org: SmallOrg,
+) -> None:
+    @acove
+    async def fail(session: Session) -> None:
+        raise Exception("oh no")
+
+    output: CoveOutput = asyncio.run(fail())
+
+    assert len(output["Exceptions"]) == len(mock_small_org.all_accounts)
+    assert all(
+        repr(e["ExceptionDetails"]) == repr(Exception("oh no"))
+        for e in output["Exceptions"]
+    )
+
+
+def test_when_raise_exception_then_async_function_exception_escapes(
+    mock_small_org: SmallOrg,
+) -> None:
+    @acove(raise_exception=True)
+    async def fail(session: Session) -> None:
+        raise Exception("oh no")
+
+    with pytest.raises(Exception, match="oh no"):
+        asyncio.run(fail())
+
+
+def test_when_concurrency_is_one_then_tasks_run_one_at_a_time(
+    mock_small_org: SmallOrg,
+) -> None:
+    running: List[int] = []
+    peak: List[int] = []
+
+    @acove(concurrency=1)
+    async def track_concurrency(session: Session) -> None:
+        running.append(1)
+        peak.append(len(running))
+        await asyncio.sleep(0.01)
+        running.pop()
+
+    asyncio.run(track_concurrency())
+
+    assert max(peak) == 1
+
+
+def test_when_streaming_then_records_are_yielded_asynchronously(
+    mock_small_org: SmallOrg,
+) -> None:
+    @acove(stream=True)
+    async def get_account_id(session: CoveSession) -> str:
+        return session.session_information["Id"]
+
+    async def collect() -> List[Dict[str, Any]]:
+        return [record async for record in get_account_id()]
+
+    records = asyncio.run(collect())
+
+    assert {r["Result"] for r in records} == set(mock_small_org.all_accounts)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"concurrency": 0},
+        {"concurrency": True},
+        {"thread_workers": 0},
+        {"thread_workers": True},
+        {"thread_workers": "auto"},
+    ],
+)
+def test_when_async_worker_counts_are_invalid_then_raises_value_error(
+    kwargs: Dict[str, Any],
+) -> None:
+    @acove(**kwargs)
+    async def do_nothing(session: CoveSession) -> None:
+        pass
+
+    with pytest.raises(ValueError, match="must be a positive int"):
+        do_nothing()
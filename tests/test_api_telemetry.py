@@ -0,0 +1,101 @@
+from typing import Any, Iterator, List, Optional
+
+import pytest
+from boto3 import Session
+from botocore.awsrequest import AWSResponse, HTTPHeaders
+
+from botocove import CoveSession, cove
+from tests.moto_mock_org.moto_models import SmallOrg
+
+THROTTLING_BODY = (
+    b"<ErrorResponse><Error><Type>Sender</Type><Code>Throttling</Code>"
+    b"<Message>Rate exceeded</Message></Error><RequestId>1</RequestId>"
+    b"</ErrorResponse>"
+)
+
+
+class FakeRawResponse:
+    def stream(self, **kwargs: Any) -> Iterator[bytes]:
+        yield THROTTLING_BODY
+
+
+def test_when_api_telemetry_then_calls_are_counted_by_account_and_region(
+    mock_session: Session, mock_small_org: SmallOrg
+) -> None:
+    @cove(
+        assuming_session=mock_session,
+        regions=["eu-west-1", "us-east-1"],
+        api_telemetry=True,
+    )
+    def get_caller_identity(session: CoveSession) -> None:
+        session.client("sts").get_caller_identity()
+
+    output = get_caller_identity()
+
+    assert len(output["ApiCalls"]) == len(output["Results"])
+    for stats in output["ApiCalls"]:
+        assert stats["Service"] == "sts"
+        assert stats["Operation"] == "GetCallerIdentity"
+        assert stats["Calls"] == 1
+        assert stats["Retries"] == 0
+    assert {s["Region"] for s in output["ApiCalls"]} == {"eu-west-1", "us-east-1"}
+    assert {s["Account"] for s in output["ApiCalls"]} == set(
+        mock_small_org.all_accounts
+    )
+
+
+@pytest.mark.parametrize("recycle_sessions", [False, True])
+def test_when_calls_are_throttled_then_retries_are_counted(
+    mock_session: Session, mock_small_org: SmallOrg, recycle_sessions: bool
+) -> None:
+    @cove(
+        assuming_session=mock_session,
+        api_telemetry=True,
+        recycle_sessions=recycle_sessions,
+    )
+    def get_caller_identity_after_throttle(session: CoveSession) -> None:
+        client = session.client("sts")
+        throttled: List[bool] = []
+
+        def throttle_once(**kwargs: Any) -> Optional[AWSResponse]:
+            if throttled:
+                return None
+            throttled.append(True)
+            return AWSResponse("https://sts", 400, HTTPHeaders(), FakeRawResponse())
+
+        client.meta.events.register_first(
+            "before-send.sts.GetCallerIdentity",
+            throttle_once,  # type: ignore[arg-type]
+        )
+        client.get_caller_identity()
+
+    output = get_caller_identity_after_throttle()
+
+    assert output["Exceptions"] == []
+    for stats in output["ApiCalls"]:
+        assert stats["Calls"] == 1
+        assert stats["Retries"] == 1
+        assert stats["Throttles"] == 1
+        assert stats["RetrySleep"] >= 0
+    assert sum(s["Calls"] for s in output["ApiCalls"]) == len(output["Results"])
+
+
+def test_when_api_telemetry_is_off_then_output_has_no_api_calls(
+    mock_session: Session, mock_small_org: SmallOrg
+) -> None:
+    @cove(assuming_session=mock_session)
+    def do_nothing(session: CoveSession) -> None:
+        pass
+
+    assert "ApiCalls" not in do_nothing()
+
+
+def test_when_api_telemetry_and_stream_then_raises_value_error(
+    mock_session: Session, mock_small_org: SmallOrg
+) -> None:
+    @cove(assuming_session=mock_session, api_telemetry=True, stream=True)
+    def do_nothing(session: CoveSession) -> None:
+        pass
+
+    with pytest.raises(ValueError, match="api_telemetry is not supported with stream"):
+        do_nothing()
@@ -0,0 +1,37 @@
+from typing import Iterator, List
+
+from pytest_mock import MockerFixture
+
+from botocove import CoveSession, cove
+from botocove.cove_host_account import CoveHostAccount
+from botocove.cove_runner import MAX_IN_FLIGHT_PER_WORKER
+from botocove.cove_task import CoveTask
+from tests.moto_mock_org.moto_models import SmallOrg
+
+
+def test_tasks_are_pulled_lazily_within_the_in_flight_window(
+    mock_small_org: SmallOrg, mocker: MockerFixture
+) -> None:
+    pulled: List[str] = []
+    iter_cove_tasks = CoveHostAccount.iter_cove_tasks
+
+    def counting_iter_cove_tasks(
+        self: CoveHostAccount,
+    ) -> Iterator[CoveTask]:
+        for task in iter_cove_tasks(self):
+            pulled.append(task.account_id)
+            yield task
+
+    mocker.patch.object(CoveHostAccount, "iter_cove_tasks", counting_iter_cove_tasks)
+
+    pulled_at_each_call: List[int] = []
+
+    @cove(thread_workers=1, regions=["eu-west-1", "us-east-1"])
+    def record_pulled(session: CoveSession) -> None:
+        pulled_at_each_call.append(len(pulled))
+
+    output = record_pulled()
+
+    assert len(output["Results"]) == 2 * len(mock_small_org.all_accounts)
+    for calls_started, pulled_count in enumerate(pulled_at_each_call, start=1):
+        assert pulled_count <= calls_started - 1 + MAX_IN_FLIGHT_PER_WORKER
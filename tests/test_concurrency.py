@@ -0,0 +1,78 @@
+import pytest
+from boto3 import Session
+
+from botocove import CoveSession, cove
+from botocove.cove_concurrency import CoveConcurrencyController
+from tests.moto_mock_org.moto_models import SmallOrg
+
+
+def test_when_throughput_rises_then_limit_increases() -> None:
+    controller = CoveConcurrencyController(initial=4, ceiling=100)
+
+    controller.adjust(throughput=10.0, latency=0.1, throttled=False)
+    controller.adjust(throughput=12.0, latency=0.1, throttled=False)
+
+    assert controller.limit == 8
+
+
+def test_when_throttled_then_limit_halves() -> None:
+    controller = CoveConcurrencyController(initial=16, ceiling=100)
+
+    controller.adjust(throughput=10.0, latency=0.1, throttled=True)
+
+    assert controller.limit == 8
+
+
+def test_when_latency_rises_then_limit_halves() -> None:
+    controller = CoveConcurrencyController(initial=16, ceiling=100)
+
+    controller.adjust(throughput=10.0, latency=0.1, throttled=False)
+    controller.adjust(throughput=20.0, latency=0.5, throttled=False)
+
+    assert controller.limit == 9
+
+
+def test_when_later_tasks_are_slower_then_limit_halves_once() -> None:
+    controller = CoveConcurrencyController(initial=16, ceiling=100)
+
+    # One fast round of empty accounts, then every round reaches large accounts
+    controller.adjust(throughput=10.0, latency=0.1, throttled=False)
+    for _ in range(5):
+        controller.adjust(throughput=10.0, latency=0.5, throttled=False)
+
+    # Halved from 18 to 9 once, then grew by 2 in each of the next 4 rounds
+    assert controller.limit == 17
+
+
+def test_limit_stays_between_one_and_ceiling() -> None:
+    controller = CoveConcurrencyController(initial=5, ceiling=6)
+
+    controller.adjust(throughput=10.0, latency=0.1, throttled=False)
+    assert controller.limit == 6
+
+    for _ in range(5):
+        controller.adjust(throughput=10.0, latency=0.1, throttled=True)
+    assert controller.limit == 1
+
+
+def test_when_auto_then_every_account_runs(
+    mock_session: Session, mock_small_org: SmallOrg
+) -> None:
+    @cove(assuming_session=mock_session, thread_workers="auto")
+    def do_nothing(session: CoveSession) -> str:
+        return session.session_information["Id"]
+
+    output = do_nothing()
+
+    assert sorted(r["Result"] for r in output["Results"]) == sorted(
+        mock_small_org.all_accounts
+    )
+
+
+def test_when_thread_workers_is_not_positive_then_value_error() -> None:
+    @cove(thread_workers=0)
+    def do_nothing(session: Session) -> None:
+        pass
+
+    with pytest.raises(ValueError, match="thread_workers must be"):
+        do_nothing()
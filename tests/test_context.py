@@ -0,0 +1,113 @@
+import threading
+from collections import Counter
+from typing import Any
+from typing import Counter as CounterType
+from typing import Set
+
+import pytest
+from boto3 import Session
+
+from botocove import CoveContext, CoveSession
+from tests.moto_mock_org.moto_models import SmallOrg
+
+
+@pytest.fixture()
+def api_calls(mock_session: Session) -> CounterType[str]:
+    calls: CounterType[str] = Counter()
+
+    def count(event_name: str, **kwargs: Any) -> None:
+        calls[event_name.split(".", 1)[1]] += 1
+
+    mock_session.events.register("before-call.*.*", count)
+    return calls
+
+
+def test_discovery_and_credentials_are_shared_between_functions(
+    mock_session: Session, mock_small_org: SmallOrg, api_calls: CounterType[str]
+) -> None:
+    with CoveContext(
+        assuming_session=mock_session, regions=["eu-west-1", "us-east-1"]
+    ) as context:
+
+        @context.cove()
+        def get_account_id(session: CoveSession) -> str:
+            return session.session_information["Id"]
+
+        @context.cove
+        def get_region(session: CoveSession) -> str:
+            return session.region_name
+
+        first = get_account_id()
+        second = get_region()
+
+    assert {r["Result"] for r in first["Results"]} == set(mock_small_org.all_accounts)
+    assert {r["Result"] for r in second["Results"]} == {"eu-west-1", "us-east-1"}
+    assert api_calls["sts.GetCallerIdentity"] == 1
+    assert api_calls["organizations.ListAccounts"] == 1
+    assert api_calls["sts.AssumeRole"] == len(mock_small_org.all_accounts)
+
+
+def test_runs_reuse_the_context_threads(
+    mock_session: Session, mock_small_org: SmallOrg
+) -> None:
+    threads: Set[int] = set()
+
+    with CoveContext(assuming_session=mock_session, thread_workers=2) as context:
+
+        @context.cove()
+        def record_thread(session: CoveSession) -> None:
+            threads.add(threading.get_ident())
+
+        for _ in range(3):
+            output = record_thread()
+            assert len(output["Results"]) == len(mock_small_org.all_accounts)
+
+    assert 1 <= len(threads) <= 2
+
+
+def test_reducer_function_runs_start_from_initial(
+    mock_session: Session, mock_small_org: SmallOrg
+) -> None:
+    def add_account(accumulator: Set[str], result: str) -> Set[str]:
+        accumulator.add(result)
+        return accumulator
+
+    with CoveContext(assuming_session=mock_session) as context:
+
+        @context.cove(reducer=add_account, initial=set())
+        def get_tagged_id(session: CoveSession, tag: str) -> str:
+            return f"{tag}:{session.session_information['Id']}"
+
+        first = get_tagged_id("a")["Aggregate"]
+        second = get_tagged_id("b")["Aggregate"]
+
+    assert first == {f"a:{a}" for a in mock_small_org.all_accounts}
+    assert second == {f"b:{a}" for a in mock_small_org.all_accounts}
+
+
+def test_when_context_is_closed_then_running_a_function_raises(
+    mock_session: Session, mock_small_org: SmallOrg
+) -> None:
+    context = CoveContext(assuming_session=mock_session)
+
+    @context.cove()
+    def do_nothing(session: CoveSession) -> None:
+        pass
+
+    context.close()
+
+    with pytest.raises(RuntimeError, match="closed"):
+        do_nothing()
+
+
+def test_when_api_telemetry_and_stream_then_raises_value_error(
+    mock_session: Session, mock_small_org: SmallOrg
+) -> None:
+    with CoveContext(assuming_session=mock_session) as context:
+
+        @context.cove(api_telemetry=True, stream=True)
+        def do_nothing(session: CoveSession) -> None:
+            pass
+
+        with pytest.raises(ValueError, match="api_telemetry"):
+            do_nothing()
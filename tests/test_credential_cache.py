@@ -0,0 +1,135 @@
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, List
+
+from boto3 import Session
+from mypy_boto3_sts.type_defs import CredentialsTypeDef
+
+from botocove import CoveCredentialStore, cove
+from botocove.cove_credentials import CoveCredentialCache
+from tests.moto_mock_org.moto_models import SmallOrg
+
+PRINCIPAL = "arn:aws:sts::123456789012:assumed-role/Admin/session"
+
+
+def _fake_credentials(expires_in: timedelta) -> CredentialsTypeDef:
+    return {
+        "AccessKeyId": "AKIAFAKE",
+        "SecretAccessKey": "fake",
+        "SessionToken": "fake",
+        "Expiration": datetime.now(timezone.utc) + expires_in,
+    }
+
+
+def test_when_credentials_are_fresh_then_role_is_assumed_once() -> None:
+    cache = CoveCredentialCache()
+    calls: List[CredentialsTypeDef] = []
+
+    def assume_role() -> CredentialsTypeDef:
+        calls.append(_fake_credentials(timedelta(hours=1)))
+        return calls[-1]
+
+    key = ("aws", "111111111111", "Role", "Role", None, None, None)
+    first = cache.get_credentials(key, assume_role)
+    second = cache.get_credentials(key, assume_role)
+
+    assert first is second
+    assert len(calls) == 1
+
+
+def test_when_credentials_are_near_expiry_then_role_is_assumed_again() -> None:
+    cache = CoveCredentialCache(expiry_margin=timedelta(minutes=5))
+    calls: List[CredentialsTypeDef] = []
+
+    def assume_role() -> CredentialsTypeDef:
+        calls.append(_fake_credentials(timedelta(minutes=1)))
+        return calls[-1]
+
+    key = ("aws", "111111111111", "Role", "Role", None, None, None)
+    cache.get_credentials(key, assume_role)
+    cache.get_credentials(key, assume_role)
+
+    assert len(calls) == 2
+
+
+def test_when_many_regions_then_each_account_role_is_assumed_once(
+    mock_session: Session, mock_small_org: SmallOrg
+) -> None:
+    assume_role_calls: List[Any] = []
+    mock_session.events.register(
+        "before-call.sts.AssumeRole",
+        lambda **kwargs: assume_role_calls.append(kwargs),
+    )
+
+    @cove(
+        assuming_session=mock_session,
+        regions=["eu-west-1", "us-east-1", "ap-southeast-2"],
+    )
+    def do_nothing(session: Session) -> None:
+        pass
+
+    output = do_nothing()
+
+    assert len(output["Results"]) == 3 * len(mock_small_org.all_accounts)
+    assert len(assume_role_calls) == len(mock_small_org.all_accounts)
+
+
+def test_when_store_holds_fresh_credentials_then_next_run_skips_assume_role(
+    mock_session: Session, mock_small_org: SmallOrg, tmp_path: Path
+) -> None:
+    assume_role_calls: List[Any] = []
+    mock_session.events.register(
+        "before-call.sts.AssumeRole",
+        lambda **kwargs: assume_role_calls.append(kwargs),
+    )
+
+    @cove(
+        assuming_session=mock_session,
+        credential_store=CoveCredentialStore(tmp_path / "credentials.db"),
+    )
+    def do_nothing(session: Session) -> None:
+        pass
+
+    first_output = do_nothing()
+    assert len(assume_role_calls) == len(mock_small_org.all_accounts)
+
+    second_output = do_nothing()
+    assert len(assume_role_calls) == len(mock_small_org.all_accounts)
+    assert len(second_output["Results"]) == len(first_output["Results"])
+    assert second_output["FailedAssumeRole"] == []
+
+
+def test_store_round_trips_credentials(tmp_path: Path) -> None:
+    store = CoveCredentialStore(tmp_path / "credentials.db")
+    key = ("aws", "111111111111", "Role", "Role", None, ("arn:aws:iam::aws:x",), None)
+    creds = _fake_credentials(timedelta(hours=1))
+
+    store.put(PRINCIPAL, key, creds)
+
+    assert CoveCredentialStore(tmp_path / "credentials.db").get(PRINCIPAL, key) == creds
+    other_key = ("aws", "222222222222", "Role", "Role", None, None, None)
+    assert store.get(PRINCIPAL, other_key) is None
+
+
+def test_when_another_principal_stored_credentials_then_role_is_assumed_again(
+    tmp_path: Path,
+) -> None:
+    store = CoveCredentialStore(tmp_path / "credentials.db")
+    calls: List[CredentialsTypeDef] = []
+
+    def assume_role() -> CredentialsTypeDef:
+        calls.append(_fake_credentials(timedelta(hours=1)))
+        return calls[-1]
+
+    key = ("aws", "111111111111", "Role", "Role", None, None, None)
+    CoveCredentialCache(store=store, principal=PRINCIPAL).get_credentials(
+        key, assume_role
+    )
+    other_principal = "arn:aws:sts::123456789012:assumed-role/Other/session"
+    creds = CoveCredentialCache(store=store, principal=other_principal).get_credentials(
+        key, assume_role
+    )
+
+    assert len(calls) == 2
+    assert creds is calls[1]
+    assert store.get(other_principal, key) == calls[1]
@@ -0,0 +1,124 @@
+from typing import Any, List
+
+import pytest
+from boto3 import Session
+
+from botocove import CoveSession, cove_functions
+from botocove.cove_spill import CoveSpilledRecords
+from tests.moto_mock_org.moto_models import SmallOrg
+
+
+@pytest.fixture()
+def assume_role_calls(mock_session: Session) -> List[Any]:
+    calls: List[Any] = []
+    mock_session.events.register(
+        "before-call.sts.AssumeRole", lambda **kwargs: calls.append(kwargs)
+    )
+    return calls
+
+
+def get_account_id(session: CoveSession) -> str:
+    return session.session_information["Id"]
+
+
+def get_region(session: CoveSession) -> str:
+    return session.region_name
+
+
+def test_functions_share_one_session_per_task(
+    mock_session: Session, mock_small_org: SmallOrg, assume_role_calls: List[Any]
+) -> None:
+    sessions: List[CoveSession] = []
+
+    def record_session(session: CoveSession) -> None:
+        sessions.append(session)
+
+    output = cove_functions(
+        [get_account_id, get_region, record_session],
+        assuming_session=mock_session,
+        regions=["eu-west-1", "us-east-1"],
+    )()
+
+    task_count = 2 * len(mock_small_org.all_accounts)
+    assert set(output) == {"get_account_id", "get_region", "record_session"}
+    assert {r["Result"] for r in output["get_account_id"]["Results"]} == set(
+        mock_small_org.all_accounts
+    )
+    assert {r["Result"] for r in output["get_region"]["Results"]} == {
+        "eu-west-1",
+        "us-east-1",
+    }
+    for function_output in output.values():
+        assert len(function_output["Results"]) == task_count
+    assert len(sessions) == task_count
+    assert len(assume_role_calls) == len(mock_small_org.all_accounts)
+
+
+def test_a_failing_function_only_fails_its_own_output(
+    mock_session: Session, mock_small_org: SmallOrg
+) -> None:
+    def fail(session: CoveSession) -> None:
+        raise ValueError("broken")
+
+    output = cove_functions(
+        {"id": get_account_id, "broken": fail},
+        assuming_session=mock_session,
+        serialize_exceptions=True,
+    )()
+
+    assert len(output["id"]["Results"]) == len(mock_small_org.all_accounts)
+    assert output["id"]["Exceptions"] == []
+    assert output["broken"]["Results"] == []
+    assert len(output["broken"]["Exceptions"]) == len(mock_small_org.all_accounts)
+    for record in output["broken"]["Exceptions"]:
+        assert record["ExceptionDetails"]["Message"] == "broken"
+        assert "Result" not in record
+
+
+def test_when_spill_threshold_is_set_then_each_function_output_spills(
+    mock_session: Session, mock_small_org: SmallOrg
+) -> None:
+    def fail(session: CoveSession) -> None:
+        raise ValueError("broken")
+
+    output = cove_functions(
+        {"id": get_account_id, "broken": fail},
+        assuming_session=mock_session,
+        spill_threshold=1,
+    )()
+
+    results = output["id"]["Results"]
+    assert isinstance(results, CoveSpilledRecords)
+    assert results.spilled
+    assert sorted(r["Result"] for r in results) == sorted(mock_small_org.all_accounts)
+    exceptions = output["broken"]["Exceptions"]
+    assert isinstance(exceptions, CoveSpilledRecords)
+    assert exceptions.spilled
+    assert [e["ExceptionDetails"]["Message"] for e in exceptions] == len(
+        mock_small_org.all_accounts
+    ) * ["broken"]
+
+
+def test_arguments_are_passed_to_every_function(
+    mock_session: Session, mock_small_org: SmallOrg
+) -> None:
+    def add(session: CoveSession, a: int, b: int = 0) -> int:
+        return a + b
+
+    def multiply(session: CoveSession, a: int, b: int = 0) -> int:
+        return a * b
+
+    output = cove_functions([add, multiply], assuming_session=mock_session)(2, b=3)
+
+    assert {r["Result"] for r in output["add"]["Results"]} == {5}
+    assert {r["Result"] for r in output["multiply"]["Results"]} == {6}
+
+
+def test_when_function_names_clash_then_raises_value_error() -> None:
+    with pytest.raises(ValueError, match="unique names"):
+        cove_functions([get_account_id, get_account_id])
+
+
+def test_when_stream_is_set_then_raises_value_error() -> None:
+    with pytest.raises(ValueError, match="stream"):
+        cove_functions([get_account_id], stream=True)
@@ -0,0 +1,95 @@
+import threading
+from collections import Counter
+from typing import List
+
+from boto3 import Session
+
+from botocove import CoveHook, CoveSession, cove
+from botocove.cove_hooks import combine_hooks
+from botocove.cove_types import CoveSessionInformation
+from tests.moto_mock_org.moto_models import SmallOrg
+
+
+class RecordingHook(CoveHook):
+    def __init__(self) -> None:
+        self.events: Counter[str] = Counter()
+        self.failures: List[Exception] = []
+        self._lock = threading.Lock()
+
+    def _record(self, event: str) -> None:
+        with self._lock:
+            self.events[event] += 1
+
+    def on_task_submitted(self, session_information: CoveSessionInformation) -> None:
+        self._record("submitted")
+
+    def on_assume_role_start(self, session_information: CoveSessionInformation) -> None:
+        self._record("assume_role_start")
+
+    def on_assume_role_end(self, session_information: CoveSessionInformation) -> None:
+        assert session_information["AssumeRoleSuccess"] is True
+        self._record("assume_role_end")
+
+    def on_function_start(self, session_information: CoveSessionInformation) -> None:
+        self._record("function_start")
+
+    def on_function_end(self, session_information: CoveSessionInformation) -> None:
+        assert session_information["Result"] == session_information["Id"]
+        self._record("function_end")
+
+    def on_task_failed(
+        self, session_information: CoveSessionInformation, err: Exception
+    ) -> None:
+        with self._lock:
+            self.failures.append(err)
+        self._record("failed")
+
+    def on_run_complete(self) -> None:
+        self._record("run_complete")
+
+
+def test_when_hooks_are_registered_then_every_event_fires(
+    mock_session: Session, mock_small_org: SmallOrg
+) -> None:
+    first, second = RecordingHook(), RecordingHook()
+
+    @cove(assuming_session=mock_session, hooks=[first, second])
+    def get_account_id(session: CoveSession) -> str:
+        return session.session_information["Id"]
+
+    output = get_account_id()
+
+    task_count = len(output["Results"])
+    for hook in (first, second):
+        assert hook.events == {
+            "submitted": task_count,
+            "assume_role_start": task_count,
+            "assume_role_end": task_count,
+            "function_start": task_count,
+            "function_end": task_count,
+            "run_complete": 1,
+        }
+
+
+def test_when_function_raises_then_task_failed_fires(
+    mock_session: Session, mock_small_org: SmallOrg
+) -> None:
+    hook = RecordingHook()
+
+    @cove(assuming_session=mock_session, hooks=[hook])
+    def fail(session: CoveSession) -> None:
+        raise ValueError("failed")
+
+    output = fail()
+
+    assert hook.events["failed"] == len(output["Exceptions"])
+    assert hook.events["function_end"] == 0
+    assert all(isinstance(e, ValueError) for e in hook.failures)
+
+
+def test_when_no_hooks_then_nothing_is_combined() -> None:
+    hook = CoveHook()
+
+    assert combine_hooks(None) is None
+    assert combine_hooks([]) is None
+    assert combine_hooks([hook]) is hook
@@ -0,0 +1,125 @@
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+from boto3 import Session
+
+from botocove import CoveOrganizationSnapshot, CoveSession, cove
+from tests.moto_mock_org.moto_models import SmallOrg
+
+
+@pytest.fixture()
+def organizations_calls(mock_session: Session) -> List[Any]:
+    calls: List[Any] = []
+    mock_session.events.register(
+        "before-call.organizations.*", lambda **kwargs: calls.append(kwargs)
+    )
+    return calls
+
+
+def test_when_snapshot_is_current_then_targets_resolve_without_organizations_calls(
+    mock_session: Session,
+    mock_small_org: SmallOrg,
+    organizations_calls: List[Any],
+    tmp_path: Path,
+) -> None:
+    snapshot = CoveOrganizationSnapshot(tmp_path / "org.json")
+
+    @cove(
+        assuming_session=mock_session,
+        target_ids=[mock_small_org.new_org1, mock_small_org.new_org4],
+        ignore_ids=[mock_small_org.new_org3],
+        org_snapshot=snapshot,
+    )
+    def do_nothing(session: Session) -> None:
+        pass
+
+    first_output = do_nothing()
+    assert organizations_calls
+
+    organizations_calls.clear()
+    second_output = do_nothing()
+
+    assert organizations_calls == []
+    assert {r["Id"] for r in first_output["Results"]} == set(
+        mock_small_org.account_group_two
+    )
+    assert sorted(first_output["Results"], key=lambda r: r["Id"]) == sorted(
+        second_output["Results"], key=lambda r: r["Id"]
+    )
+
+
+def test_when_snapshot_is_invalidated_then_organizations_api_is_called_again(
+    mock_session: Session,
+    mock_small_org: SmallOrg,
+    organizations_calls: List[Any],
+    tmp_path: Path,
+) -> None:
+    snapshot = CoveOrganizationSnapshot(tmp_path / "org.json")
+
+    @cove(assuming_session=mock_session, org_snapshot=snapshot)
+    def do_nothing(session: Session) -> None:
+        pass
+
+    do_nothing()
+    snapshot.invalidate()
+    organizations_calls.clear()
+    do_nothing()
+
+    assert organizations_calls
+
+
+def test_when_snapshot_has_expired_then_organizations_api_is_called_again(
+    mock_session: Session,
+    mock_small_org: SmallOrg,
+    organizations_calls: List[Any],
+    tmp_path: Path,
+) -> None:
+    snapshot = CoveOrganizationSnapshot(tmp_path / "org.json", ttl=timedelta(0))
+
+    @cove(assuming_session=mock_session, org_snapshot=snapshot)
+    def do_nothing(session: Session) -> None:
+        pass
+
+    do_nothing()
+    organizations_calls.clear()
+    do_nothing()
+
+    assert organizations_calls
+
+
+def test_when_target_joined_after_snapshot_then_accounts_are_listed_again(
+    mock_session: Session,
+    mock_small_org: SmallOrg,
+    organizations_calls: List[Any],
+    tmp_path: Path,
+) -> None:
+    snapshot = CoveOrganizationSnapshot(tmp_path / "org.json")
+
+    def get_account_id(session: CoveSession) -> str:
+        return session.session_information["Id"]
+
+    cove(assuming_session=mock_session, org_snapshot=snapshot)(get_account_id)()
+    new_account = mock_session.client("organizations").create_account(
+        Email="late@mock.com", AccountName="late"
+    )["CreateAccountStatus"]["AccountId"]
+    organizations_calls.clear()
+
+    output = cove(
+        assuming_session=mock_session,
+        target_ids=[new_account],
+        org_snapshot=snapshot,
+    )(get_account_id)()
+
+    assert [r["Result"] for r in output["Results"]] == [new_account]
+    assert [c["model"].name for c in organizations_calls] == ["ListAccounts"]
+
+    organizations_calls.clear()
+    cove(
+        assuming_session=mock_session,
+        target_ids=[new_account],
+        org_snapshot=snapshot,
+    )(get_account_id)()
+
+    assert organizations_calls == []
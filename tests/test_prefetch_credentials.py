@@ -0,0 +1,73 @@
+from concurrent.futures import Executor, Future
+from typing import Any, Iterator, List
+
+import pytest
+from boto3 import Session
+
+from botocove import CoveSession, cove
+from botocove.cove_runner import _prefetch_credentials
+from botocove.cove_task import CoveTask
+from tests.moto_mock_org.moto_models import SmallOrg
+
+
+def _tasks(ids: List[str]) -> Iterator[CoveTask]:
+    for account_id in ids:
+        yield CoveTask(account_id, None)
+
+
+class RecordingExecutor(Executor):
+    """Records prefetches without running them."""
+
+    def __init__(self) -> None:
+        self.submitted: List[str] = []
+
+    def submit(self, fn: Any, /, *args: Any, **kwargs: Any) -> "Future[Any]":
+        self.submitted.append(args[0].account_id)
+        return Future()
+
+
+def test_when_prefetching_then_sessions_ahead_are_prefetched_once_per_key() -> None:
+    ids = ["111111111111", "111111111111", "222222222222", "333333333333"]
+    executor = RecordingExecutor()
+
+    tasks = _prefetch_credentials(_tasks(ids), lambda t: None, executor, lookahead=2)
+
+    first = next(tasks)
+    assert first.account_id == "111111111111"
+    assert executor.submitted == ["111111111111", "222222222222"]
+
+    assert [t.account_id for t in tasks] == ids[1:]
+    assert executor.submitted == ["111111111111", "222222222222", "333333333333"]
+
+
+def test_when_prefetching_then_each_account_role_is_assumed_once(
+    mock_session: Session, mock_small_org: SmallOrg
+) -> None:
+    assume_role_calls: List[Any] = []
+    mock_session.events.register(
+        "before-call.sts.AssumeRole",
+        lambda **kwargs: assume_role_calls.append(kwargs),
+    )
+
+    @cove(
+        assuming_session=mock_session,
+        regions=["eu-west-1", "us-east-1"],
+        prefetch_credentials=10,
+    )
+    def get_account_id(session: CoveSession) -> str:
+        return session.session_information["Id"]
+
+    output = get_account_id()
+
+    assert len(output["Results"]) == 2 * len(mock_small_org.all_accounts)
+    assert output["Exceptions"] == []
+    assert len(assume_role_calls) == len(mock_small_org.all_accounts)
+
+
+def test_when_prefetching_with_process_executor_then_value_error() -> None:
+    @cove(prefetch_credentials=10, executor="process")
+    def do_nothing(session: CoveSession) -> None:
+        pass
+
+    with pytest.raises(ValueError, match="prefetch_credentials is not supported"):
+        do_nothing()
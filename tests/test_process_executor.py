@@ -0,0 +1,101 @@
+import os
+from typing import Any, Tuple
+
+import pytest
+from boto3 import Session
+from pytest_mock import MockerFixture
+
+from botocove import CoveContext, CoveSession, cove
+from botocove.cove_runner import CoveRunner
+from tests.moto_mock_org.moto_models import SmallOrg
+
+
+def test_when_executor_is_process_then_function_runs_in_worker_processes(
+    mock_small_org: SmallOrg,
+) -> None:
+    @cove(executor="process", thread_workers=2)
+    def get_pid_and_account(session: CoveSession) -> Tuple[int, str]:
+        return os.getpid(), session.session_information["Id"]
+
+    output = get_pid_and_account()
+
+    assert output["Exceptions"] == []
+    assert output["FailedAssumeRole"] == []
+    assert {r["Result"][1] for r in output["Results"]} == set(
+        mock_small_org.all_accounts
+    )
+    assert os.getpid() not in {r["Result"][0] for r in output["Results"]}
+
+
+def test_when_executor_is_process_then_exceptions_are_returned(
+    mock_small_org: SmallOrg,
+) -> None:
+    @cove(executor="process", thread_workers=2)
+    def fail(session: CoveSession) -> None:
+        raise ValueError("oh no")
+
+    output = fail()
+
+    assert len(output["Exceptions"]) == len(mock_small_org.all_accounts)
+    assert all(
+        isinstance(e["ExceptionDetails"], ValueError) for e in output["Exceptions"]
+    )
+
+
+def test_when_executor_is_process_and_raise_exception_then_exception_escapes(
+    mock_small_org: SmallOrg,
+) -> None:
+    @cove(executor="process", thread_workers=2, raise_exception=True)
+    def fail(session: CoveSession) -> None:
+        raise ValueError("oh no")
+
+    with pytest.raises(ValueError, match="oh no"):
+        fail()
+
+
+def test_when_no_assuming_session_then_process_workers_use_default_chain(
+    mock_small_org: SmallOrg, mocker: MockerFixture
+) -> None:
+    get_config = mocker.spy(CoveRunner, "_get_process_worker_config")
+
+    @cove(executor="process", thread_workers=2)
+    def do_nothing(session: CoveSession) -> None:
+        pass
+
+    output = do_nothing()
+
+    assert output["FailedAssumeRole"] == []
+    assert get_config.spy_return.sts_credentials is None
+
+
+def test_when_assuming_session_then_process_workers_get_its_credentials(
+    mock_session: Session, mock_small_org: SmallOrg, mocker: MockerFixture
+) -> None:
+    get_config = mocker.spy(CoveRunner, "_get_process_worker_config")
+
+    @cove(executor="process", thread_workers=2, assuming_session=mock_session)
+    def do_nothing(session: CoveSession) -> None:
+        pass
+
+    do_nothing()
+
+    credentials = mock_session.get_credentials()
+    assert credentials is not None
+    assert get_config.spy_return.sts_credentials == (
+        credentials.get_frozen_credentials()
+    )
+
+
+@pytest.mark.parametrize("executor", ["processes", "Process", None])
+def test_when_executor_is_unknown_then_raises_value_error(
+    mock_session: Session, mock_small_org: SmallOrg, executor: Any
+) -> None:
+    @cove(assuming_session=mock_session, executor=executor, api_telemetry=True)
+    def do_nothing(session: CoveSession) -> None:
+        pass
+
+    with pytest.raises(ValueError, match="executor must be"):
+        do_nothing()
+
+    with pytest.raises(ValueError, match="executor must be"):
+        CoveContext(assuming_session=mock_session, executor=executor)
@@ -0,0 +1,115 @@
+import time
+from types import SimpleNamespace
+from typing import List, cast
+
+import pytest
+from botocore.exceptions import ClientError
+from botocore.hooks import HierarchicalEmitter
+from mypy_boto3_sts.client import STSClient
+
+from botocove import CoveSession, cove
+from botocove.cove_rate_limiter import (
+    DECREASE_FACTOR,
+    MAX_ATTEMPTS,
+    RECOVERY_FRACTION,
+    CoveRateLimiter,
+)
+from tests.moto_mock_org.moto_models import SmallOrg
+
+
+def _throttling_error() -> ClientError:
+    return ClientError(
+        {"Error": {"Code": "Throttling", "Message": "Rate exceeded"}}, "AssumeRole"
+    )
+
+
+def test_when_burst_is_spent_then_acquire_waits_for_the_rate() -> None:
+    limiter = CoveRateLimiter(rate=50, burst=1)
+
+    start = time.monotonic()
+    for _ in range(6):
+        limiter.acquire()
+    elapsed = time.monotonic() - start
+
+    # The first token is the burst; the next five refill at 50 per second
+    assert elapsed >= 5 / 50 * 0.9
+
+
+def test_when_throttled_then_rate_decreases_and_success_recovers_it() -> None:
+    limiter = CoveRateLimiter(rate=10)
+
+    limiter.on_throttle()
+    assert limiter.rate == 5
+
+    for _ in range(100):
+        limiter.on_success()
+    assert limiter.rate == 10
+
+
+def test_when_call_is_throttled_then_it_is_retried() -> None:
+    limiter = CoveRateLimiter(rate=1000, burst=10)
+    attempts: List[int] = []
+
+    def throttled_once() -> str:
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise _throttling_error()
+        return "credentials"
+
+    assert limiter.call(throttled_once) == "credentials"
+    assert len(attempts) == 2
+    assert limiter.throttle_count == 1
+
+
+def test_when_call_is_always_throttled_then_error_is_raised() -> None:
+    limiter = CoveRateLimiter(rate=1000, burst=10)
+
+    def always_throttled() -> str:
+        raise _throttling_error()
+
+    with pytest.raises(ClientError, match="Rate exceeded"):
+        limiter.call(always_throttled)
+    assert limiter.throttle_count == MAX_ATTEMPTS - 1
+
+
+def test_when_attached_then_a_throttle_that_reaches_call_is_counted_once() -> None:
+    limiter = CoveRateLimiter(rate=1000, burst=10)
+    events = HierarchicalEmitter()
+    limiter.attach(
+        cast(STSClient, SimpleNamespace(meta=SimpleNamespace(events=events)))
+    )
+    attempts: List[int] = []
+
+    def throttled_once() -> str:
+        attempts.append(1)
+        if len(attempts) == 1:
+            # botocore emits needs-retry for the final attempt too, before the
+            # error reaches the caller
+            events.emit(
+                "needs-retry.sts.AssumeRole",
+                response=(None, _throttling_error().response),
+            )
+            raise _throttling_error()
+        return "credentials"
+
+    assert limiter.call(throttled_once) == "credentials"
+    assert limiter.throttle_count == 1
+    assert limiter.rate == 1000 * DECREASE_FACTOR + 1000 * RECOVERY_FRACTION
+
+
+def test_when_rate_is_not_positive_then_raises_value_error() -> None:
+    with pytest.raises(ValueError, match=r"rate must be greater than 0\. Got 0\."):
+        CoveRateLimiter(rate=0)
+
+
+def test_when_assume_role_rate_is_set_then_every_account_is_assumed(
+    mock_small_org: SmallOrg,
+) -> None:
+    @cove(assume_role_rate=100, assume_role_burst=2, regions=["eu-west-1"])
+    def get_account_id(session: CoveSession) -> str:
+        return session.session_information["Id"]
+
+    output = get_account_id()
+
+    assert output["FailedAssumeRole"] == []
+    assert {r["Result"] for r in output["Results"]} == set(mock_small_org.all_accounts)
@@ -0,0 +1,94 @@
+from typing import List, Optional, Tuple
+
+import pytest
+from boto3 import Session
+
+from botocove import CoveSession, cove
+from tests.moto_mock_org.moto_models import SmallOrg
+
+
+def test_when_recycling_sessions_then_each_thread_reuses_one_botocore_session(
+    mock_session: Session, mock_small_org: SmallOrg
+) -> None:
+    @cove(
+        assuming_session=mock_session,
+        regions=["eu-west-1", "us-east-1"],
+        recycle_sessions=True,
+        thread_workers=1,
+    )
+    def get_botocore_session_id(session: CoveSession) -> int:
+        return id(session._session)
+
+    output = get_botocore_session_id()
+
+    assert output["Exceptions"] == []
+    assert len({r["Result"] for r in output["Results"]}) == 1
+
+
+def test_when_recycling_sessions_then_each_task_gets_its_own_region_and_account(
+    mock_session: Session, mock_small_org: SmallOrg
+) -> None:
+    @cove(
+        assuming_session=mock_session,
+        regions=["eu-west-1", "us-east-1"],
+        recycle_sessions=True,
+        thread_workers=2,
+    )
+    def get_region_and_account(session: CoveSession) -> Tuple[Optional[str], str]:
+        identity = session.client("sts").get_caller_identity()
+        return session.region_name, identity["Account"]
+
+    output = get_region_and_account()
+
+    assert output["Exceptions"] == []
+    assert len(output["Results"]) == 2 * len(mock_small_org.all_accounts)
+    for result in output["Results"]:
+        assert result["Result"] == (result["Region"], result["Id"])
+
+
+def test_when_recycling_sessions_then_handlers_dont_carry_over_to_later_tasks(
+    mock_session: Session, mock_small_org: SmallOrg
+) -> None:
+    handled: List[str] = []
+
+    @cove(
+        assuming_session=mock_session,
+        regions=["eu-west-1", "us-east-1"],
+        recycle_sessions=True,
+        thread_workers=1,
+    )
+    def register_handler(session: CoveSession) -> None:
+        task = f"{session.session_information['Id']}:{session.region_name}"
+        session.events.register(
+            "before-call.sts.GetCallerIdentity",
+            lambda **kwargs: handled.append(task),
+        )
+        session.client("sts").get_caller_identity()
+
+    output = register_handler()
+
+    assert output["Exceptions"] == []
+    assert len(handled) == len(set(handled)) == len(output["Results"])
+
+
+@pytest.mark.parametrize("recycle_sessions", [False, True])
+def test_when_session_outlives_its_task_then_using_it_raises(
+    mock_session: Session, mock_small_org: SmallOrg, recycle_sessions: bool
+) -> None:
+    @cove(
+        assuming_session=mock_session,
+        recycle_sessions=recycle_sessions,
+        thread_workers=1,
+    )
+    def get_session(session: CoveSession) -> CoveSession:
+        return session
+
+    output = get_session()
+
+    assert len(output["Results"]) == len(mock_small_org.all_accounts)
+    for result in output["Results"]:
+        kept_session = result["Result"]
+        with pytest.raises(RuntimeError, match="deactivated"):
+            kept_session.client("sts")
+        with pytest.raises(RuntimeError, match="deactivated"):
+            kept_session.get_credentials()
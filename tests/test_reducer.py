@@ -0,0 +1,175 @@
+import threading
+from typing import Any, Counter, Dict, List, Set
+
+import pytest
+from boto3 import Session
+
+from botocove import CoveReducer, CoveSession, cove
+from tests.moto_mock_org.moto_models import SmallOrg
+
+
+class AccountSetReducer(CoveReducer):
+    def __init__(self) -> None:
+        self.reduced_on: Set[int] = set()
+        self.combined = 0
+
+    def initial(self) -> Set[str]:
+        return set()
+
+    def reduce(self, accumulator: Set[str], result: str) -> Set[str]:
+        self.reduced_on.add(threading.get_ident())
+        accumulator.add(result)
+        return accumulator
+
+    def combine(self, accumulator: Set[str], other: Set[str]) -> Set[str]:
+        self.combined += 1
+        accumulator |= other
+        return accumulator
+
+
+def get_account_id(session: CoveSession) -> str:
+    return session.session_information["Id"]
+
+
+def test_when_reducer_is_a_function_then_results_are_folded(
+    mock_session: Session, mock_small_org: SmallOrg
+) -> None:
+    def count(accumulator: int, result: str) -> int:
+        return accumulator + 1
+
+    output = cove(
+        assuming_session=mock_session,
+        regions=["eu-west-1", "us-east-1"],
+        reducer=count,
+        initial=0,
+    )(get_account_id)()
+
+    assert output["Results"] == []
+    assert output["Aggregate"] == 2 * len(mock_small_org.all_accounts)
+
+
+def test_when_reducer_is_a_cove_reducer_then_workers_fold_partials(
+    mock_session: Session, mock_small_org: SmallOrg
+) -> None:
+    reducer = AccountSetReducer()
+
+    output = cove(
+        assuming_session=mock_session,
+        regions=["eu-west-1", "us-east-1"],
+        thread_workers=4,
+        reducer=reducer,
+    )(get_account_id)()
+
+    assert output["Results"] == []
+    assert output["Aggregate"] == set(mock_small_org.all_accounts)
+    assert threading.get_ident() not in reducer.reduced_on
+    assert reducer.combined == len(reducer.reduced_on) - 1
+
+
+def test_when_reducer_function_runs_twice_then_each_run_starts_from_initial(
+    mock_session: Session, mock_small_org: SmallOrg
+) -> None:
+    def add_account(accumulator: Set[str], result: str) -> Set[str]:
+        accumulator.add(result)
+        return accumulator
+
+    initial: Set[str] = set()
+
+    @cove(assuming_session=mock_session, reducer=add_account, initial=initial)
+    def get_tagged_id(session: CoveSession, tag: str) -> str:
+        return f"{tag}:{session.session_information['Id']}"
+
+    first = get_tagged_id("a")["Aggregate"]
+    second = get_tagged_id("b")["Aggregate"]
+
+    assert first == {f"a:{a}" for a in mock_small_org.all_accounts}
+    assert second == {f"b:{a}" for a in mock_small_org.all_accounts}
+    assert initial == set()
+
+
+def test_exceptions_are_kept_when_results_are_reduced(
+    mock_session: Session, mock_small_org: SmallOrg
+) -> None:
+    failing_account = mock_small_org.all_accounts[0]
+
+    def get_id_or_fail(session: CoveSession) -> str:
+        if session.session_information["Id"] == failing_account:
+            raise ValueError("broken")
+        return session.session_information["Id"]
+
+    def by_account(accumulator: Counter[str], result: str) -> Counter[str]:
+        accumulator[result] += 1
+        return accumulator
+
+    output = cove(assuming_session=mock_session, reducer=by_account, initial=Counter())(
+        get_id_or_fail
+    )()
+
+    assert [e["Id"] for e in output["Exceptions"]] == [failing_account]
+    assert set(output["Aggregate"]) == set(mock_small_org.all_accounts) - {
+        failing_account
+    }
+
+
+def test_when_timings_are_recorded_then_reduced_tasks_are_summarized(
+    mock_session: Session, mock_small_org: SmallOrg
+) -> None:
+    output = cove(
+        assuming_session=mock_session,
+        timings=True,
+        reducer=AccountSetReducer(),
+    )(get_account_id)()
+
+    assert len(output["Timings"]["SlowestAccounts"]) == len(mock_small_org.all_accounts)
+
+
+def test_when_nothing_is_reduced_then_aggregate_is_initial(
+    mock_session: Session, mock_small_org: SmallOrg
+) -> None:
+    def fail(session: CoveSession) -> None:
+        raise ValueError("broken")
+
+    output = cove(assuming_session=mock_session, reducer=AccountSetReducer())(fail)()
+
+    assert output["Aggregate"] == set()
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"initial": 0},
+        {"reducer": AccountSetReducer(), "initial": set()},
+        {"reducer": lambda a, r: a, "stream": True},
+    ],
+)
+def test_when_reducer_arguments_are_invalid_then_raises_value_error(
+    mock_session: Session, mock_small_org: SmallOrg, kwargs: Dict[str, Any]
+) -> None:
+    with pytest.raises(ValueError):
+        cove(assuming_session=mock_session, **kwargs)(get_account_id)()
+
+
+def test_when_cove_reducer_is_incomplete_then_it_cant_be_created() -> None:
+    class NoCombineReducer(CoveReducer):
+        def initial(self) -> int:
+            return 0
+
+        def reduce(self, accumulator: int, result: Any) -> int:
+            return accumulator + 1
+
+    with pytest.raises(TypeError, match="abstract method"):
+        NoCombineReducer()  # type: ignore[abstract]
+
+
+def test_process_executor_folds_results_as_they_complete(
+    mock_session: Session, mock_small_org: SmallOrg
+) -> None:
+    output = cove(
+        assuming_session=mock_session,
+        executor="process",
+        thread_workers=2,
+        reducer=AccountSetReducer(),
+    )(get_account_id)()
+
+    accounts: List[str] = sorted(output["Aggregate"])
+    assert accounts == sorted(mock_small_org.all_accounts)
@@ -0,0 +1,101 @@
+import threading
+from collections import Counter
+from typing import Iterator, List, Optional
+
+import pytest
+from boto3 import Session
+
+from botocove import CoveSession, cove
+from botocove.cove_host_account import CoveHostAccount
+from botocove.cove_scheduler import CoveRegionScheduler
+from botocove.cove_task import CoveTask
+from tests.moto_mock_org.moto_models import SmallOrg
+
+
+def _tasks(regions: List[str]) -> Iterator[CoveTask]:
+    for i, region in enumerate(regions):
+        yield CoveTask(str(i).zfill(12), region)
+
+
+def _regions(tasks: List[CoveTask]) -> List[Optional[str]]:
+    return [t.region for t in tasks]
+
+
+def test_when_sessions_are_generated_then_regions_are_interleaved(
+    mock_session: Session, mock_small_org: SmallOrg
+) -> None:
+    regions = ["eu-west-1", "us-east-1", "ap-southeast-2"]
+    host_account = CoveHostAccount(
+        target_ids=None,
+        ignore_ids=None,
+        rolename=None,
+        role_session_name=None,
+        policy=None,
+        policy_arns=None,
+        external_id=None,
+        assuming_session=mock_session,
+        regions=regions,
+        partition=None,
+        thread_workers=20,
+    )
+
+    sessions = host_account.get_cove_sessions()
+
+    assert [s["Region"] for s in sessions[:3]] == regions
+    assert [s["Region"] for s in sessions[3:6]] == regions
+
+
+def test_when_region_is_at_cap_then_other_regions_go_first() -> None:
+    scheduler = CoveRegionScheduler(
+        _tasks(["a", "a", "a", "b", "b"]), region_concurrency=1, max_deferred=10
+    )
+
+    assert _regions(scheduler.take(3)) == ["a", "b"]
+    assert scheduler.take(3) == []
+
+    scheduler.release("a")
+    assert _regions(scheduler.take(3)) == ["a"]
+
+
+def test_when_deferred_queue_is_full_then_scheduler_stops_reading() -> None:
+    tasks = _tasks(["a"] * 10)
+    scheduler = CoveRegionScheduler(tasks, region_concurrency=1, max_deferred=2)
+
+    assert len(scheduler.take(10)) == 1
+    assert len(list(tasks)) == 7
+
+
+def test_when_region_concurrency_is_set_then_no_region_exceeds_it(
+    mock_session: Session, mock_small_org: SmallOrg
+) -> None:
+    lock = threading.Lock()
+    running: Counter[Optional[str]] = Counter()
+    peak: Counter[Optional[str]] = Counter()
+
+    @cove(
+        assuming_session=mock_session,
+        regions=["eu-west-1", "us-east-1"],
+        region_concurrency=2,
+    )
+    def track_region(session: CoveSession) -> None:
+        region = session.session_information["Region"]
+        with lock:
+            running[region] += 1
+            peak[region] = max(peak[region], running[region])
+        threading.Event().wait(0.01)
+        with lock:
+            running[region] -= 1
+
+    output = track_region()
+
+    assert len(output["Results"]) == 2 * len(mock_small_org.all_accounts)
+    assert max(peak.values()) <= 2
+
+
+def test_when_region_concurrency_is_not_positive_then_value_error() -> None:
+    @cove(region_concurrency=0)
+    def do_nothing(session: CoveSession) -> None:
+        pass
+
+    with pytest.raises(ValueError, match="region_concurrency must be"):
+        do_nothing()
@@ -0,0 +1,76 @@
+import gc
+import weakref
+from typing import List
+
+import pytest
+from boto3 import Session
+from botocore.exceptions import ClientError
+
+from botocove import CoveSession, cove
+from botocove.cove_session import serialize_exception
+from tests.moto_mock_org.moto_models import SmallOrg
+
+
+def test_client_error_record_has_error_code_and_request_id() -> None:
+    err = ClientError(
+        {
+            "Error": {"Code": "AccessDenied", "Message": "Not allowed"},
+            "ResponseMetadata": {
+                "RequestId": "request-1",
+                "HostId": "",
+                "HTTPStatusCode": 403,
+                "HTTPHeaders": {},
+                "RetryAttempts": 0,
+            },
+        },
+        "DescribeInstances",
+    )
+
+    record = serialize_exception(err)
+
+    assert record["Type"] == "ClientError"
+    assert record["ErrorCode"] == "AccessDenied"
+    assert record["RequestId"] == "request-1"
+    assert "Not allowed" in record["Message"]
+
+
+def test_when_serialize_exceptions_then_exception_details_is_a_record(
+    mock_session: Session, mock_small_org: SmallOrg
+) -> None:
+    @cove(assuming_session=mock_session, serialize_exceptions=True)
+    def fail(session: CoveSession) -> None:
+        raise ValueError("broken")
+
+    output = fail()
+
+    assert output["Results"] == []
+    assert len(output["Exceptions"]) == len(mock_small_org.all_accounts)
+    for record in output["Exceptions"]:
+        details = record["ExceptionDetails"]
+        assert details["Type"] == "ValueError"
+        assert details["Message"] == "broken"
+        assert details["ErrorCode"] is None
+        assert details["RequestId"] is None
+        assert "in fail" in details["Traceback"]
+
+
+@pytest.mark.parametrize("serialize_exceptions", [True, False])
+def test_failed_sessions_are_collected_only_when_serialized(
+    mock_session: Session, mock_small_org: SmallOrg, serialize_exceptions: bool
+) -> None:
+    sessions: List["weakref.ReferenceType[CoveSession]"] = []
+
+    @cove(assuming_session=mock_session, serialize_exceptions=serialize_exceptions)
+    def fail(session: CoveSession) -> None:
+        sessions.append(weakref.ref(session))
+        raise ValueError("broken")
+
+    output = fail()
+    gc.collect()
+
+    assert len(output["Exceptions"]) == len(mock_small_org.all_accounts)
+    alive = [ref for ref in sessions if ref() is not None]
+    if serialize_exceptions:
+        assert alive == []
+    else:
+        assert len(alive) == len(sessions)
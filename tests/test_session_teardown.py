@@ -0,0 +1,150 @@
+import socket
+import threading
+import weakref
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterator, List
+
+import pytest
+from botocore.client import BaseClient
+from pytest_mock import MockerFixture
+
+from botocove import CoveSession, cove
+from tests.moto_mock_org.moto_models import SmallOrg
+
+
+def test_clients_created_by_a_task_are_closed_when_it_completes(
+    mock_small_org: SmallOrg, mocker: MockerFixture
+) -> None:
+    closed: List[object] = []
+    mocker.patch(
+        "botocore.client.BaseClient.close", autospec=True, side_effect=closed.append
+    )
+    created: List[object] = []
+
+    @cove()
+    def create_clients(session: CoveSession) -> None:
+        created.append(session.client("sts"))
+        created.append(session.resource("s3").meta.client)
+
+    output = create_clients()
+
+    assert len(output["Results"]) == len(mock_small_org.all_accounts)
+    assert len(created) == 2 * len(mock_small_org.all_accounts)
+    assert sorted(map(id, closed)) == sorted(map(id, created))
+
+
+def test_clients_are_closed_when_the_function_raises(
+    mock_small_org: SmallOrg, mocker: MockerFixture
+) -> None:
+    close = mocker.patch("botocore.client.BaseClient.close", autospec=True)
+
+    @cove()
+    def fail(session: CoveSession) -> None:
+        session.client("sts")
+        raise ValueError("broken")
+
+    output = fail()
+
+    assert len(output["Exceptions"]) == len(mock_small_org.all_accounts)
+    assert close.call_count == len(mock_small_org.all_accounts)
+
+
+@pytest.mark.parametrize("recycle_sessions", [False, True])
+def test_deactivated_session_releases_its_botocore_components(
+    mock_small_org: SmallOrg, recycle_sessions: bool
+) -> None:
+    sessions: List[CoveSession] = []
+
+    @cove(recycle_sessions=recycle_sessions)
+    def keep_session(session: CoveSession) -> None:
+        session.client("sts")
+        sessions.append(session)
+
+    keep_session()
+
+    assert len(sessions) == len(mock_small_org.all_accounts)
+    for session in sessions:
+        assert session.deactivated
+        for name in ("_session", "_loader", "resource_factory"):
+            assert name not in vars(session)
+
+
+@pytest.fixture()
+def local_endpoint() -> Iterator[str]:
+    """Serves a canned GetCallerIdentity response over keep-alive connections,
+    so that clients pointed at it hold real sockets in their connection pools.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _CallerIdentityHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}"
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+@pytest.mark.parametrize("recycle_sessions", [False, True])
+def test_sockets_opened_by_a_task_are_closed_when_it_completes(
+    mock_small_org: SmallOrg, local_endpoint: str, recycle_sessions: bool
+) -> None:
+    # The caller keeps the clients alive, so only teardown can release sockets
+    clients: List[BaseClient] = []
+    sockets: List["weakref.ReferenceType[socket.socket]"] = []
+    lock = threading.Lock()
+
+    @cove(recycle_sessions=recycle_sessions)
+    def call_endpoint(session: CoveSession) -> None:
+        client = session.client(
+            "sts", region_name="eu-west-1", endpoint_url=local_endpoint
+        )
+        client.get_caller_identity()
+        with lock:
+            clients.append(client)
+            sockets.extend(weakref.ref(sock) for sock in _pooled_sockets(client))
+
+    output = call_endpoint()
+
+    assert len(output["Results"]) == len(mock_small_org.all_accounts)
+    assert len(sockets) == len(mock_small_org.all_accounts)
+    assert all(_is_closed(ref) for ref in sockets)
+
+
+def _pooled_sockets(client: BaseClient) -> List[socket.socket]:
+    manager = client._endpoint.http_session._manager  # type: ignore[attr-defined]
+    pools = [manager.pools[key] for key in manager.pools.keys()]
+    connections = [conn for pool in pools for conn in pool.pool.queue if conn]
+    return [conn.sock for conn in connections if conn.sock]
+
+
+def _is_closed(ref: "weakref.ReferenceType[socket.socket]") -> bool:
+    sock = ref()
+    return sock is None or sock.fileno() == -1
+
+
+class _CallerIdentityHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:  # noqa: N802
+        self.rfile.read(int(self.headers["Content-Length"]))
+        body = _CALLER_IDENTITY_RESPONSE.encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/xml")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+_CALLER_IDENTITY_RESPONSE = """\
+<GetCallerIdentityResponse xmlns="https://sts.amazonaws.com/doc/2011-06-15/">
+  <GetCallerIdentityResult>
+    <Arn>arn:aws:iam::123456789012:user/cove</Arn>
+    <UserId>AIDACOVE</UserId>
+    <Account>123456789012</Account>
+  </GetCallerIdentityResult>
+</GetCallerIdentityResponse>
+"""
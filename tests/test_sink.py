@@ -0,0 +1,159 @@
+import json
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+from boto3 import Session
+
+from botocove import (
+    CoveJsonLinesSink,
+    CoveParquetSink,
+    CoveSession,
+    CoveSink,
+    CoveSqliteSink,
+    cove,
+)
+from tests.moto_mock_org.moto_models import SmallOrg
+
+
+class RecordingSink(CoveSink):
+    def __init__(self, batch_size: int) -> None:
+        super().__init__("memory", batch_size)
+        self.batches: List[List[Dict[str, Any]]] = []
+        self.closed = False
+
+    def _open(self) -> None:
+        self.batches = []
+
+    def _write_batch(self, records: List[Dict[str, Any]]) -> None:
+        self.batches.append(list(records))
+
+    def _close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture()
+def failing_account(mock_small_org: SmallOrg) -> str:
+    return mock_small_org.all_accounts[0]
+
+
+@pytest.fixture()
+def get_id_or_fail(failing_account: str) -> Any:
+    def get_id_or_fail(session: CoveSession) -> str:
+        if session.session_information["Id"] == failing_account:
+            raise ValueError("broken")
+        return session.session_information["Id"]
+
+    return get_id_or_fail
+
+
+def test_records_are_written_in_batches_instead_of_kept(
+    mock_session: Session, mock_small_org: SmallOrg, get_id_or_fail: Any
+) -> None:
+    sink = RecordingSink(batch_size=3)
+
+    output = cove(
+        assuming_session=mock_session, regions=["eu-west-1", "us-east-1"], sink=sink
+    )(get_id_or_fail)()
+
+    task_count = 2 * len(mock_small_org.all_accounts)
+    assert output["Results"] == []
+    assert output["Exceptions"] == []
+    assert output["Sink"] == {
+        "Location": "memory",
+        "Records": task_count,
+        "Results": task_count - 2,
+        "Exceptions": 2,
+        "FailedAssumeRole": 0,
+    }
+    assert [len(batch) for batch in sink.batches] == [3, 3, 2]
+    assert sink.closed
+
+
+def test_jsonl_sink_writes_one_record_per_line(
+    mock_session: Session,
+    mock_small_org: SmallOrg,
+    get_id_or_fail: Any,
+    failing_account: str,
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "records.jsonl"
+
+    output = cove(assuming_session=mock_session, sink=CoveJsonLinesSink(path))(
+        get_id_or_fail
+    )()
+
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert output["Sink"]["Location"] == str(path)
+    assert {r["Id"] for r in records} == set(mock_small_org.all_accounts)
+    for record in records:
+        if record["Id"] == failing_account:
+            assert record["ExceptionDetails"]["Type"] == "ValueError"
+        else:
+            assert record["Result"] == record["Id"]
+
+
+def test_sqlite_sink_writes_one_row_per_record(
+    mock_session: Session,
+    mock_small_org: SmallOrg,
+    get_id_or_fail: Any,
+    failing_account: str,
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "records.db"
+    sink = CoveSqliteSink(path, batch_size=2)
+    run = cove(assuming_session=mock_session, sink=sink)(get_id_or_fail)
+
+    run()
+    # A second run replaces the first run's rows
+    run()
+
+    with closing(sqlite3.connect(path)) as conn:
+        rows = conn.execute("SELECT Id, Outcome, Record FROM cove_records").fetchall()
+    assert len(rows) == len(mock_small_org.all_accounts)
+    outcomes = {account_id: outcome for account_id, outcome, _ in rows}
+    assert outcomes.pop(failing_account) == "Exception"
+    assert set(outcomes.values()) == {"Result"}
+    for account_id, _, record in rows:
+        assert json.loads(record)["Id"] == account_id
+
+
+def test_parquet_sink_writes_one_row_per_record(
+    mock_session: Session, mock_small_org: SmallOrg, tmp_path: Path
+) -> None:
+    pyarrow_parquet = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "records.parquet"
+
+    @cove(assuming_session=mock_session, sink=CoveParquetSink(path))
+    def get_account_id(session: CoveSession) -> str:
+        return session.session_information["Id"]
+
+    get_account_id()
+
+    table = pyarrow_parquet.read_table(path)
+    assert sorted(table.column("Id").to_pylist()) == sorted(mock_small_org.all_accounts)
+
+
+def test_when_sink_is_set_with_stream_then_raises_value_error(
+    mock_session: Session, mock_small_org: SmallOrg, tmp_path: Path
+) -> None:
+    @cove(stream=True, sink=CoveJsonLinesSink(tmp_path / "records.jsonl"))
+    def do_nothing(session: CoveSession) -> None:
+        pass
+
+    with pytest.raises(ValueError, match="stream"):
+        do_nothing()
+
+
+def test_when_sink_is_incomplete_then_it_cant_be_created(tmp_path: Path) -> None:
+    class NoCloseSink(CoveSink):
+        def _open(self) -> None:
+            pass
+
+        def _write_batch(self, records: List[Dict[str, Any]]) -> None:
+            pass
+
+    with pytest.raises(TypeError, match="abstract method"):
+        NoCloseSink(tmp_path / "records")  # type: ignore[abstract]
@@ -0,0 +1,126 @@
+from typing import Any, Dict, List
+
+import pytest
+from boto3 import Session
+
+from botocove import CoveSession, cove
+from botocove.cove_spill import CoveSpilledRecords, CoveSpillStore
+from tests.moto_mock_org.moto_models import SmallOrg
+
+
+def make_records(count: int) -> List[Dict[str, Any]]:
+    return [{"Id": str(i), "Result": list(range(i))} for i in range(count)]
+
+
+def test_records_stay_in_memory_up_to_the_threshold() -> None:
+    records = CoveSpilledRecords(CoveSpillStore(), threshold=3)
+    for record in make_records(3):
+        records.append(record)
+
+    assert not records.spilled
+    assert records == make_records(3)
+
+
+def test_spilled_records_behave_like_a_list() -> None:
+    expected = make_records(10)
+    records = CoveSpilledRecords(CoveSpillStore(), threshold=3)
+    for record in expected:
+        records.append(record)
+
+    assert records.spilled
+    assert len(records) == 10
+    assert records == expected
+    assert expected == records
+    assert records != expected[:-1]
+    assert list(records) == expected
+    assert records[0] == expected[0]
+    assert records[-1] == expected[-1]
+    assert records[2:8:2] == expected[2:8:2]
+    assert expected[4] in records
+    with pytest.raises(IndexError):
+        records[10]
+
+
+def test_records_can_be_read_while_more_are_spilled() -> None:
+    expected = make_records(6)
+    records = CoveSpilledRecords(CoveSpillStore(), threshold=0)
+    for i, record in enumerate(expected):
+        records.append(record)
+        assert records[i] == record
+
+    assert records == expected
+
+
+def test_views_sharing_a_store_keep_their_own_records() -> None:
+    store = CoveSpillStore()
+    first = CoveSpilledRecords(store, threshold=1)
+    second = CoveSpilledRecords(store, threshold=1)
+    for i, record in enumerate(make_records(6)):
+        (first if i % 2 else second).append(record)
+
+    assert first == make_records(6)[1::2]
+    assert second == make_records(6)[::2]
+
+
+def test_when_spill_threshold_is_passed_then_output_is_spilled(
+    mock_session: Session, mock_small_org: SmallOrg
+) -> None:
+    failing_account = mock_small_org.all_accounts[0]
+
+    @cove(
+        assuming_session=mock_session,
+        regions=["eu-west-1", "us-east-1"],
+        spill_threshold=2,
+    )
+    def get_id_or_fail(session: CoveSession) -> str:
+        if session.session_information["Id"] == failing_account:
+            raise ValueError("broken")
+        return session.session_information["Id"]
+
+    output = get_id_or_fail()
+
+    results = output["Results"]
+    assert isinstance(results, CoveSpilledRecords)
+    assert results.spilled
+    assert sorted(r["Result"] for r in results) == sorted(
+        2 * [a for a in mock_small_org.all_accounts if a != failing_account]
+    )
+    exceptions = output["Exceptions"]
+    assert isinstance(exceptions, CoveSpilledRecords)
+    assert not exceptions.spilled
+    assert [e["ExceptionDetails"]["Message"] for e in exceptions] == 2 * ["broken"]
+    assert output["FailedAssumeRole"] == []
+
+
+class DetailedError(Exception):
+    # Pickles, but unpickling calls __init__ with only the message
+    def __init__(self, code: str, detail: str) -> None:
+        super().__init__(f"{code}: {detail}")
+        self.code = code
+        self.detail = detail
+
+
+def test_when_spilled_exceptions_dont_unpickle_then_they_are_serialized(
+    mock_session: Session, mock_small_org: SmallOrg
+) -> None:
+    @cove(assuming_session=mock_session, spill_threshold=0)
+    def fail(session: CoveSession) -> None:
+        raise DetailedError("E1", "broken")
+
+    output = fail()
+
+    exceptions = list(output["Exceptions"])
+    assert len(exceptions) == len(mock_small_org.all_accounts)
+    assert {e["ExceptionDetails"]["Type"] for e in exceptions} == {"DetailedError"}
+    assert {e["ExceptionDetails"]["Message"] for e in exceptions} == {"E1: broken"}
+
+
+def test_when_spill_threshold_is_set_with_stream_then_raises_value_error(
+    mock_session: Session, mock_small_org: SmallOrg
+) -> None:
+    @cove(assuming_session=mock_session, stream=True, spill_threshold=10)
+    def do_nothing(session: CoveSession) -> None:
+        pass
+
+    with pytest.raises(ValueError, match="stream"):
+        do_nothing()
@@ -0,0 +1,54 @@
+from typing import Any, Dict, Iterator
+
+from boto3 import Session
+
+from botocove import CoveSession, cove
+from tests.moto_mock_org.moto_models import SmallOrg
+
+
+def test_when_streaming_then_returns_an_iterator_of_every_result(
+    mock_small_org: SmallOrg,
+) -> None:
+    @cove(stream=True)
+    def get_account_id(session: CoveSession) -> str:
+        return session.session_information["Id"]
+
+    output: Iterator[Dict[str, Any]] = get_account_id()
+
+    assert not isinstance(output, dict)
+    results = list(output)
+    assert {r["Result"] for r in results} == set(mock_small_org.all_accounts)
+    assert all(r["AssumeRoleSuccess"] for r in results)
+
+
+def test_when_streaming_then_exceptions_are_yielded_with_results(
+    mock_small_org: SmallOrg,
+) -> None:
+    failing_account = mock_small_org.all_accounts[0]
+
+    @cove(stream=True)
+    def fail_in_one_account(session: CoveSession) -> None:
+        if session.session_information["Id"] == failing_account:
+            raise Exception("oh no")
+
+    records = list(fail_in_one_account())
+
+    exceptions = [r for r in records if "ExceptionDetails" in r]
+    assert [e["Id"] for e in exceptions] == [failing_account]
+    assert len(records) == len(mock_small_org.all_accounts)
+
+
+def test_when_consumer_stops_early_then_remaining_tasks_are_cancelled(
+    mock_small_org: SmallOrg,
+) -> None:
+    calls = []
+
+    @cove(stream=True, thread_workers=1)
+    def record_call(session: Session) -> None:
+        calls.append(session)
+
+    output = record_call()
+    next(output)
+    output.close()
+
+    assert len(calls) < len(mock_small_org.all_accounts)
@@ -1,7 +1,9 @@
+from typing import Any
+
 import pytest
 from boto3.session import Session
 
-from botocove import cove
+from botocove import CoveContext, cove
 from tests.moto_mock_org.moto_models import SmallOrg
 
 
@@ -70,3 +72,18 @@ def test_when_empty_sequence_raises_value_error(
         ValueError, match=r"target_ids must have at least 1 element\. Got \[\]\."
     ):
         do_nothing()
+
+
+@pytest.mark.parametrize("ou_thread_workers", [0, -1, True, 2.5])
+def test_when_ou_thread_workers_is_not_positive_then_raises_value_error(
+    mock_small_org: SmallOrg, ou_thread_workers: Any
+) -> None:
+    @cove(target_ids=[mock_small_org.new_org1], ou_thread_workers=ou_thread_workers)
+    def do_nothing(session: Session) -> None:
+        pass
+
+    with pytest.raises(ValueError, match="ou_thread_workers must be"):
+        do_nothing()
+
+    with pytest.raises(ValueError, match="ou_thread_workers must be"):
+        CoveContext(ou_thread_workers=ou_thread_workers)
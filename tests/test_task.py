@@ -0,0 +1,43 @@
+import pickle
+
+from botocove.cove_task import CoveRunConfig, CoveTask
+
+CONFIG = CoveRunConfig(
+    RoleName="Role",
+    RoleSessionName="Session",
+    Policy='{"Version": "2012-10-17", "Statement": []}' * 100,
+    PolicyArns=[{"arn": "arn:aws:iam::aws:policy/ReadOnlyAccess"}],
+    ExternalId="external",
+    Partition="aws",
+)
+
+
+def test_session_information_combines_task_and_run_config() -> None:
+    task = CoveTask(
+        "111111111111",
+        "eu-west-1",
+        {
+            "Id": "111111111111",
+            "Arn": "arn:aws:organizations::111111111111:account/o-1/111111111111",
+            "Email": "account@example.com",
+            "Name": "account",
+            "Status": "ACTIVE",
+        },
+    )
+
+    session_information = task.session_information(CONFIG)
+
+    assert session_information["Id"] == "111111111111"
+    assert session_information["Region"] == "eu-west-1"
+    assert session_information["Name"] == "account"
+    assert session_information["Policy"] is CONFIG.Policy
+    assert session_information["PolicyArns"] is CONFIG.PolicyArns
+    assert session_information["AssumeRoleSuccess"] is False
+    assert "Timings" not in session_information
+
+
+def test_task_does_not_carry_run_config() -> None:
+    task = CoveTask("111111111111", "eu-west-1")
+
+    assert not hasattr(task, "__dict__")
+    assert len(pickle.dumps(task)) < len(CONFIG.Policy or "")
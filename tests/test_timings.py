@@ -0,0 +1,70 @@
+import time
+from typing import List
+
+from boto3 import Session
+
+from botocove import CoveSession, cove
+from botocove.cove_timings import _percentiles
+from tests.moto_mock_org.moto_models import SmallOrg
+
+
+def test_percentiles_are_nearest_rank() -> None:
+    values: List[float] = [float(v) for v in range(1, 101)]
+
+    assert _percentiles(values) == {"p50": 50.0, "p95": 95.0, "p99": 99.0}
+    assert _percentiles([3.0]) == {"p50": 3.0, "p95": 3.0, "p99": 3.0}
+
+
+def test_when_timings_then_each_task_and_the_run_are_timed(
+    mock_session: Session, mock_small_org: SmallOrg
+) -> None:
+    @cove(
+        assuming_session=mock_session,
+        regions=["eu-west-1", "us-east-1"],
+        timings=True,
+    )
+    def sleep(session: CoveSession) -> None:
+        time.sleep(0.01)
+
+    output = sleep()
+
+    for result in output["Results"]:
+        timings = result["Timings"]
+        assert timings["Function"] >= 0.01
+        assert timings["Total"] >= (
+            timings["QueueWait"] + timings["AssumeRole"] + timings["Function"]
+        )
+
+    summary = output["Timings"]
+    assert set(summary["Phases"]) == {"QueueWait", "AssumeRole", "Function", "Total"}
+    assert summary["Phases"]["Function"]["p50"] >= 0.01
+    assert set(summary["Regions"]) == {"eu-west-1", "us-east-1"}
+    assert len(summary["SlowestAccounts"]) == min(10, len(output["Results"]))
+    slowest_totals = [a["Total"] for a in summary["SlowestAccounts"]]
+    assert slowest_totals == sorted(slowest_totals, reverse=True)
+
+
+def test_when_function_raises_then_its_task_is_timed(
+    mock_session: Session, mock_small_org: SmallOrg
+) -> None:
+    @cove(assuming_session=mock_session, timings=True)
+    def fail(session: CoveSession) -> None:
+        raise ValueError("failed")
+
+    output = fail()
+
+    assert len(output["Exceptions"]) == len(mock_small_org.all_accounts)
+    assert all("Total" in e["Timings"] for e in output["Exceptions"])
+
+
+def test_when_timings_are_off_then_output_has_no_timings(
+    mock_session: Session, mock_small_org: SmallOrg
+) -> None:
+    @cove(assuming_session=mock_session)
+    def do_nothing(session: CoveSession) -> None:
+        pass
+
+    output = do_nothing()
+
+    assert "Timings" not in output
+    assert all("Timings" not in r for r in output["Results"])
@@ -0,0 +1,60 @@
+import json
+from collections import Counter
+from pathlib import Path
+
+from boto3 import Session
+
+from botocove import CoveSession, cove
+from tests.moto_mock_org.moto_models import SmallOrg
+
+
+def test_when_trace_file_then_each_task_phase_is_a_trace_event(
+    mock_session: Session, mock_small_org: SmallOrg, tmp_path: Path
+) -> None:
+    trace_file = tmp_path / "trace.json"
+
+    @cove(
+        assuming_session=mock_session,
+        regions=["eu-west-1", "us-east-1"],
+        trace_file=trace_file,
+    )
+    def do_nothing(session: CoveSession) -> None:
+        pass
+
+    output = do_nothing()
+    task_count = len(output["Results"])
+    events = json.loads(trace_file.read_text())
+
+    phases = Counter((e["ph"], e["name"]) for e in events if e["ph"] != "X")
+    assert phases[("b", "QueueWait")] == task_count
+    assert phases[("e", "QueueWait")] == task_count
+
+    spans = Counter(e["name"] for e in events if e["ph"] == "X")
+    assert spans["AssumeRole"] == task_count
+    assert spans["Function"] == task_count
+    assert sum(spans[a] for a in mock_small_org.all_accounts) == task_count
+
+    tracks = {(e["pid"], e["tid"]) for e in events if e["ph"] == "X"}
+    named = {(e["pid"], e["tid"]) for e in events if e["name"] == "thread_name"}
+    assert tracks == named
+
+    for event in events:
+        if event["ph"] == "X":
+            assert event["ts"] >= 0
+            assert event["dur"] >= 0
+
+
+def test_when_streaming_stops_early_then_trace_file_is_valid(
+    mock_session: Session, mock_small_org: SmallOrg, tmp_path: Path
+) -> None:
+    trace_file = tmp_path / "trace.json"
+
+    @cove(assuming_session=mock_session, trace_file=trace_file, stream=True)
+    def do_nothing(session: CoveSession) -> None:
+        pass
+
+    records = do_nothing()
+    next(records)
+    records.close()
+
+    assert isinstance(json.loads(trace_file.read_text()), list)